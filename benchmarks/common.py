@@ -0,0 +1,56 @@
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+
+def create_arguments_parser(description: str) -> argparse.ArgumentParser:
+    """
+    :return: parser of arguments that are common for benchmarks: paths of docx files and path of package
+    """
+    arguments_parser = argparse.ArgumentParser(description=description)
+    arguments_parser.add_argument('paths', nargs='*', help='docx files. Synthetic documents are used if absent')
+    arguments_parser.add_argument('--package-path', default=None,
+                                  help='directory with docx_microreader package to measure instead of this one, '
+                                       'for example checkout of older commit (git worktree add DIR COMMIT)')
+    return arguments_parser
+
+
+def use_package(package_path: str):
+    """
+    docx_microreader is imported from directory package_path after this. It must be called before imports
+    of docx_microreader
+    """
+    if package_path is not None:
+        if 'docx_microreader' in sys.modules:
+            raise RuntimeError('docx_microreader is imported already')
+        sys.path.insert(0, package_path)
+
+
+def best_time(function: Callable, rounds: int) -> float:
+    """
+    :return: the least time of call of function in seconds
+    """
+    result: float = float('inf')
+    for _ in range(rounds):
+        begin: float = time.perf_counter()
+        function()
+        result = min(result, time.perf_counter() - begin)
+    return result
+
+
+def get_retained_memory(create_document) -> int:
+    """
+    :return: bytes that are allocated by create_document and are retained by created document
+    """
+    gc.collect()
+    tracemalloc.start()
+    document = create_document()
+    document.close()
+    gc.collect()
+    retained: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del document
+    return retained
@@ -0,0 +1,184 @@
+import atexit
+import os
+import random
+import shutil
+import tempfile
+import zipfile
+from typing import List, Tuple
+from xml.sax.saxutils import escape
+
+
+# synthetic documents for benchmarks. Benchmarks take paths of docx files as arguments and use synthetic documents
+# of these sizes (count of top-level paragraphs and tables of body) if paths aren't given
+SYNTHETIC_DOCUMENTS_SIZES: Tuple[int, ...] = (60, 300, 1500)
+
+NAMESPACES: str = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+CONTENT_TYPES: str = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+DOCUMENT_RELATIONSHIPS: str = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" '
+    'Target="numbering.xml"/>'
+    '</Relationships>'
+)
+
+STYLES: str = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:styles {NAMESPACES}>'
+    '<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri"/><w:sz w:val="22"/><w:lang w:val="en-US"/>'
+    '</w:rPr></w:rPrDefault><w:pPrDefault><w:pPr><w:spacing w:after="160"/></w:pPr></w:pPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/>'
+    '<w:pPr><w:jc w:val="both"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:keepNext/><w:pBdr><w:bottom w:val="single" w:sz="4" w:color="auto"/></w:pBdr></w:pPr>'
+    '<w:rPr><w:b/><w:sz w:val="32"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading2"><w:basedOn w:val="Heading1"/>'
+    '<w:pPr><w:ind w:left="360"/></w:pPr><w:rPr><w:i/><w:color w:val="2F5496"/><w:sz w:val="28"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Quote"><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:ind w:left="720" w:right="720"/><w:jc w:val="center"/></w:pPr><w:rPr><w:i/></w:rPr></w:style>'
+    '<w:style w:type="character" w:styleId="Emphasis"><w:rPr><w:i/><w:u w:val="single"/></w:rPr></w:style>'
+    '<w:style w:type="character" w:styleId="Strong"><w:basedOn w:val="Emphasis"/>'
+    '<w:rPr><w:b/><w:bdr w:val="single" w:sz="8" w:color="0000FF"/></w:rPr></w:style>'
+    '<w:style w:type="table" w:styleId="Grid"><w:tblPr><w:jc w:val="center"/><w:tblBorders>'
+    '<w:top w:val="single" w:sz="4" w:color="auto"/><w:bottom w:val="single" w:sz="4" w:color="auto"/>'
+    '<w:left w:val="single" w:sz="4"/><w:right w:val="single" w:sz="4"/>'
+    '<w:insideH w:val="single" w:sz="4"/><w:insideV w:val="dotted" w:sz="4"/></w:tblBorders>'
+    '<w:tblCellMar><w:left w:w="108" w:type="dxa"/><w:right w:w="108" w:type="dxa"/></w:tblCellMar></w:tblPr>'
+    '<w:tblStylePr w:type="firstRow"><w:rPr><w:b/></w:rPr><w:tcPr><w:shd w:fill="4472C4"/>'
+    '<w:tcBorders><w:bottom w:val="double" w:sz="12"/></w:tcBorders></w:tcPr></w:tblStylePr>'
+    '<w:tblStylePr w:type="lastRow"><w:rPr><w:i/></w:rPr></w:tblStylePr>'
+    '<w:tblStylePr w:type="firstCol"><w:tcPr><w:shd w:fill="D9E2F3"/></w:tcPr></w:tblStylePr>'
+    '<w:tblStylePr w:type="band1Horz"><w:tcPr><w:shd w:fill="EEEEEE"/></w:tcPr></w:tblStylePr>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+NUMBERING: str = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:numbering {NAMESPACES}>'
+    '<w:abstractNum w:abstractNumId="0">'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="decimal"/><w:lvlText w:val="%1."/></w:lvl>'
+    '<w:lvl w:ilvl="1"><w:start w:val="1"/><w:numFmt w:val="lowerLetter"/><w:lvlText w:val="%2)"/></w:lvl>'
+    '<w:lvl w:ilvl="2"><w:start w:val="1"/><w:numFmt w:val="bullet"/><w:lvlText w:val="o"/></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+RUN_FORMATS: Tuple[str, ...] = (
+    '', '', '<w:b/>', '<w:i/>', '<w:rStyle w:val="Emphasis"/>', '<w:rStyle w:val="Strong"/><w:sz w:val="24"/>',
+    '<w:color w:val="FF0000"/><w:u w:val="double" w:color="00FF00"/>', '<w:strike/><w:highlight w:val="yellow"/>',
+    '<w:vertAlign w:val="superscript"/>', '<w:rFonts w:ascii="Arial"/><w:shd w:fill="FFFF00"/>',
+)
+
+WORDS: Tuple[str, ...] = ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'contract', 'party', 'shall', 'clause', 'α', '<&>')
+
+
+def _run(text: str, formats: str = '') -> str:
+    properties: str = f'<w:rPr>{formats}</w:rPr>' if formats else ''
+    return f'<w:r>{properties}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _paragraph(runs: str, properties: str = '') -> str:
+    return f'<w:p>{"<w:pPr>" + properties + "</w:pPr>" if properties else ""}{runs}</w:p>'
+
+
+def _text(rng: random.Random, words_count: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words_count)) + ' '
+
+
+def _table(rng: random.Random, rows_count: int, columns_count: int) -> str:
+    rows: List[str] = []
+    for row in range(rows_count):
+        cells: List[str] = []
+        for column in range(columns_count):
+            properties: str = '<w:tcW w:w="1500" w:type="dxa"/>'
+            if column == 1 and row >= 1:
+                # cells of the second column are merged by groups of 3 rows
+                properties += '<w:vMerge w:val="restart"/>' if row % 3 == 1 else '<w:vMerge/>'
+            elif column == columns_count - 1 and row % 5 == 3:
+                properties += '<w:shd w:fill="FFFF00"/><w:tcBorders><w:left w:val="thick" w:sz="16"/></w:tcBorders>'
+            cells.append(f'<w:tc><w:tcPr>{properties}</w:tcPr>'
+                         f'{_paragraph(_run(_text(rng, 3), rng.choice(RUN_FORMATS)))}</w:tc>')
+        header: str = '<w:trPr><w:tblHeader/></w:trPr>' if row == 0 else ''
+        rows.append(f'<w:tr>{header}{"".join(cells)}</w:tr>')
+    return ('<w:tbl><w:tblPr><w:tblStyle w:val="Grid"/><w:tblW w:w="5000" w:type="pct"/>'
+            '<w:tblLook w:firstRow="1" w:lastRow="1" w:firstColumn="1" w:noHBand="0" w:noVBand="1"/></w:tblPr>'
+            f'{"".join(rows)}</w:tbl>')
+
+
+def create_docx(blocks_count: int, seed: int = 0) -> bytes:
+    """
+    :param blocks_count: count of top-level paragraphs and tables of body
+    :param seed: documents with different seed have different content
+    :return: content of docx file with styled paragraphs, runs of various formats, numbered lists and tables with
+             header rows and merged cells
+    """
+    rng: random.Random = random.Random(seed)
+    body: List[str] = []
+    for index in range(blocks_count):
+        kind: int = index % 20
+        if kind == 0:
+            body.append(_paragraph(_run(_text(rng, 4)), '<w:pStyle w:val="Heading1"/>'))
+        elif kind == 10:
+            body.append(_paragraph(_run(_text(rng, 5)), '<w:pStyle w:val="Heading2"/>'))
+        elif kind in (5, 15):
+            body.append(_table(rng, rng.randint(4, 12), rng.randint(3, 5)))
+        else:
+            runs: str = ''.join(_run(_text(rng, rng.randint(2, 12)), rng.choice(RUN_FORMATS))
+                                for _ in range(rng.randint(1, 8)))
+            if kind in (6, 7, 8, 9):
+                properties: str = f'<w:numPr><w:ilvl w:val="{rng.randint(0, 2)}"/><w:numId w:val="1"/></w:numPr>'
+            elif kind == 12:
+                properties = '<w:pStyle w:val="Quote"/>'
+            else:
+                properties = rng.choice(('', '', '<w:jc w:val="left"/>', '<w:ind w:firstLine="720"/>'))
+            body.append(_paragraph(runs, properties))
+    document: str = f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {NAMESPACES}><w:body>' \
+                    f'{"".join(body)}</w:body></w:document>'
+
+    with tempfile.SpooledTemporaryFile() as content:
+        with zipfile.ZipFile(content, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+            archive.writestr('word/_rels/document.xml.rels', DOCUMENT_RELATIONSHIPS)
+            archive.writestr('word/document.xml', document)
+            archive.writestr('word/styles.xml', STYLES)
+            archive.writestr('word/numbering.xml', NUMBERING)
+        content.seek(0)
+        return content.read()
+
+
+def get_corpus(paths: List[str]) -> List[Tuple[str, str]]:
+    """
+    :param paths: paths of docx files. Synthetic documents are created in temporary directory if empty
+    :return: [(name of document, path of docx file)]
+    """
+    if paths:
+        return [(os.path.basename(path), path) for path in paths]
+
+    directory: str = tempfile.mkdtemp(prefix='docx_microreader_benchmark_')
+    atexit.register(shutil.rmtree, directory, True)
+    corpus: List[Tuple[str, str]] = []
+    for size in SYNTHETIC_DOCUMENTS_SIZES:
+        path: str = os.path.join(directory, f'synthetic_{size}.docx')
+        with open(path, 'wb') as file:
+            file.write(create_docx(size))
+        corpus.append((os.path.basename(path), path))
+    return corpus
@@ -0,0 +1,60 @@
+"""
+measure memory of instances of models (object and its __dict__, without storage of properties) by type of element,
+memory retained by parsed Document (tracemalloc) and sharing of effective formats of runs. Run it with
+--package-path of older checkout to compare with previous models.
+
+usage (from root of repository): python -m benchmarks.model_memory [--package-path DIR] [path.docx ...]
+"""
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.common import create_arguments_parser, get_retained_memory, use_package
+from benchmarks.corpus import get_corpus
+
+
+def get_size_of_instance(element) -> int:
+    """
+    :return: bytes of element and of its __dict__ if it has it
+    """
+    size: int = sys.getsizeof(element)
+    if hasattr(element, '__dict__'):
+        size += sys.getsizeof(element.__dict__)
+    return size
+
+
+def main():
+    arguments = create_arguments_parser('measure memory of models of docx_microreader').parse_args()
+    use_package(arguments.package_path)
+
+    from docx_microreader.models import Document, Run
+
+    for name, path in get_corpus(arguments.paths):
+        document = Document(path)
+        # {name of class: [count of elements, bytes of instances, count of instances with __dict__]}
+        statistics: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        runs: List[Run] = []
+        elements: list = list(document.iterate_by_inner_elements())
+        while elements:
+            element = elements.pop()
+            element_statistics: List[int] = statistics[type(element).__name__]
+            element_statistics[0] += 1
+            element_statistics[1] += get_size_of_instance(element)
+            element_statistics[2] += hasattr(element, '__dict__')
+            if isinstance(element, Run):
+                runs.append(element)
+            elements.extend(element.iterate_by_inner_elements())
+
+        print(name)
+        print(f'  {"element":12s} {"count":>8s} {"bytes/element":>14s} {"with __dict__":>14s}')
+        for class_name, (count, size, dicts_count) in sorted(statistics.items(), key=lambda item: -item[1][1]):
+            print(f'  {class_name:12s} {count:8d} {size / count:14.0f} {dicts_count:14d}')
+        if hasattr(Run, 'get_effective_format'):
+            formats_ids = {id(run.get_effective_format()) for run in runs}
+            print(f'  effective formats of {len(runs)} runs: {len(formats_ids)} distinct objects')
+        document.close()
+        print(f'  retained by Document: {get_retained_memory(lambda: Document(path)) / 1e6:.2f} MB')
+
+
+if __name__ == '__main__':
+    main()
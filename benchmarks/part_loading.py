@@ -0,0 +1,69 @@
+"""
+compare loading of xml parts of docx: parsing of raw bytes by ElementTree with previous round trip through minidom
+(parsing, pretty printing and parsing of printed xml by ElementTree). Time and peak memory (tracemalloc) of both
+are reported. Texts of w:t elements, the only texts that are used by models, are compared.
+
+usage (from root of repository): python -m benchmarks.part_loading [--rounds N] [path.docx ...]
+"""
+import gc
+import tracemalloc
+import xml.dom.minidom
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Callable, List, Optional
+
+from benchmarks.common import best_time, create_arguments_parser
+from benchmarks.corpus import get_corpus
+
+
+PARTS: tuple = ('word/document.xml', 'word/styles.xml', 'word/numbering.xml')
+TEXT_TAG: str = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t'
+
+
+def parse(data: bytes) -> ET.Element:
+    return ET.fromstring(data)
+
+
+def parse_pretty_printed(data: bytes) -> ET.Element:
+    return ET.fromstring(xml.dom.minidom.parseString(data).toprettyxml())
+
+
+def get_peak_memory(function: Callable) -> int:
+    """
+    :return: the most bytes that are allocated during call of function
+    """
+    gc.collect()
+    tracemalloc.start()
+    function()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def get_texts(root: ET.Element) -> List[Optional[str]]:
+    return [element.text for element in root.iter(TEXT_TAG)]
+
+
+def main():
+    arguments_parser = create_arguments_parser('compare loading of xml parts of docx')
+    arguments_parser.add_argument('--rounds', type=int, default=5, help='the best of rounds is reported')
+    arguments = arguments_parser.parse_args()
+
+    print(f'{"document":28s} {"part":20s} {"KB":>7s} {"round trip, s":>14s} {"MB":>7s} {"bytes, s":>9s} {"MB":>7s}')
+    for name, path in get_corpus(arguments.paths):
+        with zipfile.ZipFile(path) as archive:
+            parts: List[str] = [part for part in PARTS if part in archive.namelist()]
+            contents: List[bytes] = [archive.read(part) for part in parts]
+        for part, data in zip(parts, contents):
+            if get_texts(parse(data)) != get_texts(parse_pretty_printed(data)):
+                print(f'{name} {part}: texts differ')
+            measurements: list = []
+            for function in (parse_pretty_printed, parse):
+                measurements.append(best_time(lambda: function(data), arguments.rounds))
+                measurements.append(get_peak_memory(lambda: function(data)) / 1e6)
+            print(f'{name:28s} {part:20s} {len(data) / 1e3:7.0f} {measurements[0]:14.4f} {measurements[1]:7.1f} '
+                  f'{measurements[2]:9.4f} {measurements[3]:7.1f}')
+
+
+if __name__ == '__main__':
+    main()
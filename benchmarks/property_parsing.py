@@ -0,0 +1,41 @@
+"""
+measure parsing of properties: time of resolution of namespace prefixes of tags (check_namespace_of_tag) and time of
+building of Document, which runs extraction plans of properties for every element. Run it with --package-path of older
+checkout to compare with previous parsing.
+
+usage (from root of repository): python -m benchmarks.property_parsing [--package-path DIR] [--rounds N] [path.docx ...]
+"""
+import timeit
+from typing import Tuple
+
+from benchmarks.common import best_time, create_arguments_parser, use_package
+from benchmarks.corpus import get_corpus
+
+
+# tags that are resolved most often while parsing
+TAGS: Tuple[str, ...] = ('w:p', 'w:r', 'w:t', 'w:pPr', 'w:rPr', 'w:val', 'xml:space')
+CALLS_COUNT: int = 100000
+
+
+def main():
+    arguments_parser = create_arguments_parser('measure parsing of properties of docx_microreader')
+    arguments_parser.add_argument('--rounds', type=int, default=3, help='the best of rounds is reported')
+    arguments = arguments_parser.parse_args()
+    use_package(arguments.package_path)
+
+    from docx_microreader.constants.namespaces import check_namespace_of_tag
+    from docx_microreader.models import Document
+
+    def resolve_tags():
+        for tag in TAGS:
+            check_namespace_of_tag(tag)
+
+    resolution_time: float = min(timeit.repeat(resolve_tags, number=CALLS_COUNT // len(TAGS), repeat=arguments.rounds))
+    print(f'check_namespace_of_tag: {resolution_time / CALLS_COUNT * 1e9:.0f} ns per call')
+    for name, path in get_corpus(arguments.paths):
+        build_time: float = best_time(lambda: Document(path).close(), arguments.rounds)
+        print(f'{name:28s} Document(): {build_time:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+measure memory of storage of properties (_properties of elements) by type of element and memory retained by parsed
+Document (tracemalloc). Run it with --package-path of older checkout to compare with previous storage.
+
+usage (from root of repository): python -m benchmarks.property_storage_memory [--package-path DIR] [path.docx ...]
+"""
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.common import create_arguments_parser, get_retained_memory, use_package
+from benchmarks.corpus import get_corpus
+
+
+def get_size_of_properties(element) -> int:
+    """
+    :return: bytes of dict of properties of element and of its Property objects (with their __dict__ if they have it)
+    """
+    properties: dict = element._properties
+    size: int = sys.getsizeof(properties)
+    for prop in properties.values():
+        size += sys.getsizeof(prop)
+        if hasattr(prop, '__dict__'):
+            size += sys.getsizeof(prop.__dict__)
+    return size
+
+
+def main():
+    arguments = create_arguments_parser('measure memory of properties of elements of docx_microreader').parse_args()
+    use_package(arguments.package_path)
+
+    from docx_microreader.models import Document
+
+    for name, path in get_corpus(arguments.paths):
+        # {name of class: [count of elements, count of stored properties, bytes of properties]}
+        statistics: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        elements: list = [Document(path)]
+        while elements:
+            element = elements.pop()
+            element_statistics: List[int] = statistics[type(element).__name__]
+            element_statistics[0] += 1
+            element_statistics[1] += len(element._properties)
+            element_statistics[2] += get_size_of_properties(element)
+            elements.extend(element.iterate_by_inner_elements())
+
+        print(name)
+        print(f'  {"element":12s} {"count":>8s} {"entries/element":>16s} {"bytes/element":>14s}')
+        for class_name, (count, entries, size) in sorted(statistics.items(), key=lambda item: -item[1][2]):
+            print(f'  {class_name:12s} {count:8d} {entries / count:16.1f} {size / count:14.0f}')
+        print(f'  retained by Document: {get_retained_memory(lambda: Document(path)) / 1e6:.2f} MB')
+
+
+if __name__ == '__main__':
+    main()
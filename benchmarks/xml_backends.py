@@ -0,0 +1,49 @@
+"""
+compare xml backends (xml.etree.ElementTree and lxml) on the same corpus: parsing of word/document.xml and building
+of Document. Translations to html by both backends are compared, so backends must build the same models.
+
+usage (from root of repository): python -m benchmarks.xml_backends [--rounds N] [path.docx ...]
+"""
+import zipfile
+from typing import Dict, List
+
+from benchmarks.common import best_time, create_arguments_parser, use_package
+from benchmarks.corpus import get_corpus
+
+
+def main():
+    arguments_parser = create_arguments_parser('compare xml backends of docx_microreader')
+    arguments_parser.add_argument('--rounds', type=int, default=5, help='the best of rounds is reported')
+    arguments = arguments_parser.parse_args()
+    use_package(arguments.package_path)
+
+    from docx_microreader import xml_backend
+    from docx_microreader.models import Document
+
+    backends: List[str] = [xml_backend.ETREE]
+    if xml_backend.lxml_etree is not None:
+        backends.append(xml_backend.LXML)
+    else:
+        print('lxml is not installed, only xml.etree.ElementTree is measured')
+    default_backend: str = xml_backend.get_backend()
+
+    print(f'{"document":28s} {"backend":8s} {"document.xml, s":>16s} {"Document(), s":>14s}')
+    try:
+        for name, path in get_corpus(arguments.paths):
+            with zipfile.ZipFile(path) as archive:
+                document_xml: bytes = archive.read('word/document.xml')
+            html: Dict[str, str] = {}
+            for backend in backends:
+                xml_backend.set_backend(backend)
+                parse_time: float = best_time(lambda: xml_backend.fromstring(document_xml), arguments.rounds)
+                build_time: float = best_time(lambda: Document(path).close(), arguments.rounds)
+                html[backend] = Document(path).translate('html')
+                print(f'{name:28s} {backend:8s} {parse_time:16.4f} {build_time:14.4f}')
+            if len(set(html.values())) != 1:
+                print(f'{name}: translations by backends differ')
+    finally:
+        xml_backend.set_backend(default_backend)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+import xml.etree.ElementTree as ET
+import zipfile
+import io
+import mmap
+import os
+from typing import Dict, Optional, Tuple, Union, BinaryIO
+from . import xml_backend
+
+
+class _MemoryMapReader(io.RawIOBase):
+    """
+    seekable binary stream over memory-mapped file. Content of file isn't copied
+    """
+
+    def __init__(self, memory_map: mmap.mmap):
+        super(_MemoryMapReader, self).__init__()
+        self._map: mmap.mmap = memory_map
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._map.read(size if size is not None and size >= 0 else None)
+
+    def readinto(self, buffer) -> int:
+        data: bytes = self._map.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self) -> int:
+        return self._map.tell()
+
+
+class DocxArchive:
+    """
+    opened package of docx document. Zip archive is opened once, its entries are indexed and
+    parts are read and parsed only once per archive
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO, mmap.mmap]):
+        """
+        :param source: path to file (str or os.PathLike), content of file, memory-mapped file or seekable binary
+                       file-like object
+        """
+        if isinstance(source, os.PathLike):
+            source = os.fsdecode(source)
+        self._path: Optional[str] = source if isinstance(source, str) else None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        elif isinstance(source, mmap.mmap):
+            source = _MemoryMapReader(source)
+        self._zip: Optional[zipfile.ZipFile] = zipfile.ZipFile(source)
+        self._entries: Dict[str, zipfile.ZipInfo] = {info.filename: info for info in self._zip.infolist()}
+        self._parts: Dict[str, bytes] = {}
+        self._trees: Dict[str, ET.Element] = {}
+        # {name of part: (count of parsing, total time of parsing in seconds)}
+        self._parse_statistics: Dict[str, Tuple[int, float]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        self._parts = {}
+        self._trees = {}
+
+    def is_closed(self) -> bool:
+        return self._zip is None
+
+    def get_path(self) -> Optional[str]:
+        """
+        :return: path to file of archive or None if archive isn't opened from filesystem
+        """
+        return self._path
+
+    def has_part(self, name: str) -> bool:
+        return name in self._entries
+
+    def iterate_by_part_names(self):
+        for name in self._entries:
+            yield name
+
+    def _get_name(self) -> str:
+        return self._path if self._path is not None else '<in-memory>'
+
+    def _get_zip(self) -> zipfile.ZipFile:
+        if self._zip is None:
+            raise ValueError(f'archive {self._get_name()} is closed')
+        return self._zip
+
+    def read(self, name: str) -> bytes:
+        """
+        :param name: path to file in document
+        :return: raw content of file
+        """
+        result: Optional[bytes] = self._parts.get(name)
+        if result is None:
+            if name not in self._entries:
+                raise KeyError(f'there is no item named {name} in the archive {self._get_name()}')
+            result = self._get_zip().read(self._entries[name])
+            self._parts[name] = result
+        return result
+
+    def get_xml(self, name: str, is_cached: bool = True) -> ET.Element:
+        """
+        :param name: path to file in document
+        :param is_cached: keep parsed tree in archive until it is closed, so file is parsed only once.
+                          Tree that isn't cached is freed when it isn't used anymore
+        :return: root of ElementTree of file
+        """
+        from time import perf_counter
+
+        result: Optional[ET.Element] = self._trees.get(name)
+        if result is None:
+            begin: float = perf_counter()
+            result = xml_backend.fromstring(self.read(name))
+            count, total_time = self._parse_statistics.get(name, (0, 0.0))
+            self._parse_statistics[name] = (count + 1, total_time + perf_counter() - begin)
+            if is_cached:
+                self._trees[name] = result
+            # raw bytes aren't needed after parsing
+            self._parts.pop(name, None)
+        return result
+
+    def get_parse_statistics(self) -> Dict[str, Tuple[int, float]]:
+        """
+        :return: {name of part: (count of parsing, total time of parsing in seconds)}
+        """
+        return dict(self._parse_statistics)
+
+    def open(self, name: str):
+        """
+        :return: file-like object for reading file of document without loading it in memory
+        """
+        if name not in self._entries:
+            raise KeyError(f'there is no item named {name} in the archive {self._get_name()}')
+        return self._get_zip().open(self._entries[name])
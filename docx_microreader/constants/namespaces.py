@@ -1,4 +1,5 @@
 from typing import Dict
+from functools import cache
 
 namespaces: Dict[str, str] = {
     'wpc': 'http://schemas.microsoft.com/office/word/2010/wordprocessingCanvas',
@@ -39,16 +40,22 @@ additional_namespaces: Dict[str, str] = {
 }
 
 
+# {prefix: namespace} of namespaces and additional_namespaces. Prefixes of namespaces have priority
+_prefixes: Dict[str, str] = {**additional_namespaces, **namespaces}
+
+
+@cache
 def check_namespace_of_tag(tag: str) -> str:
     """
-    :param tag: string
-    :return: tag with replaced namespace
+    result is memoized, so namespaces and additional_namespaces must not be changed at runtime
+    :param tag: string (prefix:name) or path of tags separated by '/' (prefix:name/prefix:name)
+    :return: tag (or each tag of path) with replaced namespace ({namespace}name)
     """
-    import re
-
-    if ':' in tag:
-        key = re.split(':', tag)[0]
-        for name_space in [namespaces, additional_namespaces]:
-            if key in name_space:
-                return tag.replace(key + ':', '{' + name_space[key] + '}')
+    if '{' in tag:  # already in Clark notation
+        return tag
+    if '/' in tag:
+        return '/'.join(check_namespace_of_tag(t) for t in tag.split('/'))
+    prefix, separator, name = tag.partition(':')
+    if separator and prefix in _prefixes:
+        return '{' + _prefixes[prefix] + '}' + name
     return tag
@@ -1,22 +1,82 @@
+import os
+import itertools
+import threading
 import xml.etree.ElementTree as ET
 from .constants.namespaces import namespaces, check_namespace_of_tag
-from typing import Union, List, Callable, Dict, Tuple, Optional
-from .properties import Property, PropertyDescription
+from typing import Union, List, Callable, Dict, Tuple, Optional, Set, BinaryIO
+from .properties import Property, PropertiesExtractionPlan
 from .constants import property_enums as pr_const
+from .archive import DocxArchive
+
+
+class _ResolvedPropertiesCacheVersion:
+    """
+    version of caches of resolved properties of elements of one document. Versions are unique in process, so caches
+    that are filled while element belonged to one document are never valid in another one
+    """
+    __slots__ = ('value',)
+    __versions = itertools.count()
+
+    def __init__(self):
+        self.value: int = next(_ResolvedPropertiesCacheVersion.__versions)
+
+    def invalidate(self):
+        self.value = next(_ResolvedPropertiesCacheVersion.__versions)
 
 
 class Parser:
     element_description = None
     __possible_inner_elements: Optional[dict] = None
+    # {class: compiled descriptions of properties of class}
+    __properties_extraction_plans: Dict[type, PropertiesExtractionPlan] = {}
+    # inner elements of lazy element can be accessed first from many threads at once, but they are parsed once
+    __inner_elements_parsing_lock: threading.RLock = threading.RLock()
+    # instances of models are numerous, so attributes are stored in slots. Subclasses must declare __slots__ too
+    # (empty if they don't add attributes), otherwise instances of subclass get __dict__
+    __slots__ = ('_properties', '_is_lazy', '__inner_elements', '__source_element')
 
     @classmethod
     def _possible_inner_elements_descriptions(cls) -> list:
         return []
 
-    def __init__(self, element: ET.Element):
+    def __init__(self, element: ET.Element, is_lazy: bool = False):
+        """
+        :param is_lazy: inner elements are parsed on first access to them if True. Source element is kept until then
+        """
         self._properties: Dict[str, Property] = self.__class__._parse_properties(element)
-        self._inner_elements: list = []
-        self._parse_all_inner_elements(element)
+        self._is_lazy: bool = is_lazy
+        self.__inner_elements: Optional[list] = None
+        self.__source_element: Optional[ET.Element] = element
+        if not is_lazy:
+            self.__materialize_inner_elements()
+
+    @property
+    def _inner_elements(self) -> list:
+        # source element is kept until inner elements are parsed and prepared by _after_parse_inner_elements
+        if self.__source_element is not None or self.__inner_elements is None:
+            with Parser.__inner_elements_parsing_lock:
+                if self.__inner_elements is None:
+                    self.__materialize_inner_elements()
+        return self.__inner_elements
+
+    def __materialize_inner_elements(self):
+        inner_elements: list = []
+        if self.__source_element is not None:
+            self._parse_all_inner_elements(self.__source_element, inner_elements)
+        self.__inner_elements = inner_elements
+        self._after_parse_inner_elements()
+        # other threads get inner elements only after this
+        self.__source_element = None
+
+    def _after_parse_inner_elements(self):
+        """
+        called after inner elements are parsed (immediately in __init__ or on first access in lazy mode) and after
+        inner elements are inserted or removed
+        """
+        pass
+
+    def is_inner_elements_parsed(self) -> bool:
+        return self.__inner_elements is not None
 
     @classmethod
     def __set_possible_inner_elements(cls):
@@ -36,122 +96,159 @@ class Parser:
                 d = d[t]
             d[check_namespace_of_tag(tags[-1])] = v
 
-    def _parse_all_inner_elements(self, element: ET.Element):
+    def _parse_all_inner_elements(self, element: ET.Element, inner_elements: list):
+        """
+        :param inner_elements: parsed inner elements are appended to this list
+        """
         if self.__class__.__possible_inner_elements is None:
             self.__class__.__set_possible_inner_elements()
-        self.__parse_element(element, self.__class__.__possible_inner_elements)
+        self.__parse_element(element, self.__class__.__possible_inner_elements, inner_elements)
 
     @classmethod
     def is_possible_inner_element(cls, inner_class) -> bool:
+        if cls.__possible_inner_elements is None:
+            cls.__set_possible_inner_elements()
         return inner_class in cls.__possible_inner_elements.values()
 
-    def __parse_element(self, element, d):
+    def __parse_element(self, element, d, inner_elements: list):
         if not isinstance(d, dict):
-            self._inner_elements.append(d(element, self))
+            inner_elements.append(d(element, self))
             return
         if d:
             for el in element.findall('./'):
                 if el.tag in d:
-                    self.__parse_element(el, d[el.tag])
+                    self.__parse_element(el, d[el.tag], inner_elements)
+
+    @classmethod
+    def _get_properties_extraction_plan(cls) -> PropertiesExtractionPlan:
+        """
+        :return: compiled descriptions of properties of cls. Plan is compiled once for each class
+        """
+        plan: Optional[PropertiesExtractionPlan] = Parser.__properties_extraction_plans.get(cls)
+        if plan is None:
+            plan = PropertiesExtractionPlan(tuple(
+                description.compile(key)
+                for key, description in cls.element_description.get_property_descriptions_dict().items()
+            ))
+            Parser.__properties_extraction_plans[cls] = plan
+        return plan
 
     @classmethod
     def _parse_properties(cls, element: ET.Element) -> Dict[str, Property]:
-        result: Dict[str, Property] = {}
-        properties_description_dict = cls.element_description.get_property_descriptions_dict()
-        for key, pr in properties_description_dict.items():
-            if pr.tag is not None:
-                property_element: Optional[ET.Element] = Parser.__find_property_element(pr, element)
-                if property_element is not None:
-                    result[key] = Parser.__find_property(property_element, pr,
-                                                         properties_description_dict[key].tag_property)
-                else:
-                    result[key] = Property(None)
-            else:
-                result[key] = Property(element.get(check_namespace_of_tag(pr.tag_property)))
-        return result
-
-    @staticmethod
-    def __find_property_element(description: PropertyDescription, element: ET.Element) -> Optional[ET.Element]:
-        """
-        find element by propertyDescription
-        """
-        if isinstance(description.get_wrapped_tags(), list):
-            for tag in description.get_wrapped_tags():
-                result: Optional[ET.Element] = element.find(tag, namespaces)
-                if result is not None:
-                    return result
-            return None
-        return element.find(description.get_wrapped_tags(), namespaces)
-
-    @staticmethod
-    def __find_property(property_element: ET.Element, pr: PropertyDescription,
-                        tags: Union[List[str], str, None]) -> Property:
-        """
-        find property in element
-        """
-        if isinstance(tags, list):
-            for tag_prop in tags:
-                prop: Optional[str] = property_element.get(check_namespace_of_tag(tag_prop))
-                if prop is not None:
-                    return Property(prop)
-            return Property(None)
+        """
+        :return: {key of property: Property}. Absent properties aren't stored
+        """
+        return {key: Property(value) for key, value in cls._get_properties_extraction_plan().extract(element).items()}
+
+    @classmethod
+    def _is_described_property(cls, key: str) -> bool:
+        return key in cls._get_properties_extraction_plan().keys
+
+    def _get_property_value(self, key: str) -> Union[str, bool, Property.Missed, None]:
+        """
+        :return: own value of property (without styles) or None if property is absent
+        """
+        prop: Optional[Property] = self._properties.get(key)
+        return prop.value if prop is not None else None
+
+    def _set_property_value(self, key: str, value: Union[str, bool, Property.Missed, None]):
+        """
+        absent property (value is None) is removed from storage
+        """
+        if value is None:
+            self._properties.pop(key, None)
+        elif key in self._properties:
+            self._properties[key].value = value
         else:
-            if pr.is_can_be_miss:
-                value: Optional[str] = property_element.get(check_namespace_of_tag(pr_const.MissedPropertyAttribute))
-                if value is None:
-                    return Property(Property.Missed())
-                if value == '1':
-                    return Property(True)
-                elif value == '0':
-                    return Property(False)
-                return Property(value)
-            else:
-                return Property(property_element.get(check_namespace_of_tag(tags)))
+            self._properties[key] = Property(value)
 
 
 class DocumentParser:
     document_key: str = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml'
     styles_key: str = 'application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml'
     numberings_key: str = 'application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml'
+    image_copy_chunk_size: int = 64 * 1024
 
-    def __init__(self, path: Optional[str], path_for_images: Optional[str] = None):
+    def __init__(self, source: Union[str, os.PathLike, bytes, BinaryIO, None], path_for_images: Optional[str] = None):
+        """
+        :param source: path to docx file (str or os.PathLike), content of docx file (bytes), memory-mapped docx file
+                       (mmap) or seekable binary file-like object
+        :param path_for_images: directory for extracted images. If None, directory of docx file is used.
+                                Images are stored in memory if None and source isn't path
+        """
         from os.path import abspath
 
-        self._path: str = abspath(path).replace('\\', '/') if path is not None else None
+        if isinstance(source, os.PathLike):
+            source = os.fsdecode(source)
+        # caches of resolved properties of elements of document are invalidated together by changing of version
+        self._resolved_properties_cache_version: _ResolvedPropertiesCacheVersion = _ResolvedPropertiesCacheVersion()
+        self._path: Optional[str] = abspath(source).replace('\\', '/') if isinstance(source, str) else None
+        self._archive: Optional[DocxArchive] = DocxArchive(self._path if self._path is not None else source) \
+            if source is not None else None
         self._content: Dict[str, Optional[str]] = {
             DocumentParser.document_key: None,
             DocumentParser.styles_key: None,
             DocumentParser.numberings_key: None,
         }
         self._relationships: Dict[str, Tuple[str, str]] = {}
-        if path is not None:
+        if self._archive is not None:
             self._extract_content_types()
             self._extract_relationships()
 
         self._styles: dict = {}
         self._default_styles: dict = {}
-        if path is not None:
-            self._parse_default_styles()
-            self._parse_styles()
+        if self._archive is not None and self._content.get(DocumentParser.styles_key) is not None:
+            styles: ET.Element = self._get_xml_file(self._content[DocumentParser.styles_key])
+            self._parse_default_styles(styles)
+            self._parse_styles(styles)
+            self._flatten_styles()
 
         self._numbering: dict = {pr_const.Element.ABSTRACT_NUMBERING.key: {}, pr_const.Element.NUMBERING.key: {}}
-        if path is not None:
+        # {(id of numbering, index of level): level}. It is cleared when caches of resolved properties are invalidated
+        self._numbering_levels: Dict[Tuple[str, Union[str, int]], Optional[object]] = {}
+        self._numbering_levels_version: int = -1
+        # interning table of effective formats of runs: {format: id of format}, formats in order of ids.
+        # Equal formats of runs are shared. Table isn't cleared, so ids are stable while document exists
+        self._run_formats_ids: dict = {}
+        self._run_formats: list = []
+        self._images_dir: Optional[str] = None
+        if self._archive is not None:
             self._parse_numberings()
-            self._images_dir: Optional[str] = abspath(path_for_images).replace('\\', '/') + '/' \
-                if path_for_images is not None else self._get_images_directory(False)
-            self._images_extraction()
-        else:
-            self._images_dir: Optional[str] = None
+            if path_for_images is not None:
+                self._images_dir = abspath(path_for_images).replace('\\', '/') + '/'
+            elif self._path is not None:
+                self._images_dir = self._get_images_directory(False)
+        # ids of image relationships whose files are written to images directory
+        self._extracted_images: Set[str] = set()
+        # {id of image relationship: content of image} if document haven't images directory
+        self._images: Dict[str, bytes] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        close archive of document. Parts of document that aren't parsed yet become unavailable
+        """
+        if self._archive is not None:
+            self._archive.close()
+
+    def get_parse_statistics(self) -> Dict[str, Tuple[int, float]]:
+        """
+        :return: {name of part: (count of parsing, total time of parsing in seconds)}
+        """
+        return self._archive.get_parse_statistics() if self._archive is not None else {}
 
-    def _get_xml_file(self, file: str) -> Optional[ET.Element]:
+    def _get_xml_file(self, file: str, is_cached: bool = True) -> Optional[ET.Element]:
         """
         :param file: path to file in document
+        :param is_cached: keep parsed tree in archive until it is closed
         :return: ElementTree of file
         """
-        import xml.dom.minidom
-        import zipfile
-
-        return ET.fromstring(xml.dom.minidom.parseString(zipfile.ZipFile(self._path).read(file)).toprettyxml())
+        return self._archive.get_xml(file, is_cached)
 
     def _extract_content_types(self):
         content_types: Optional[ET.Element] = self._get_xml_file('[Content_Types].xml')
@@ -167,24 +264,37 @@ class DocumentParser:
         for rel in relationships.findall('./'):
             self._relationships[rel.get('Id')] = (rel.get('Type').split('/')[-1], rel.get('Target'))
 
-    def _parse_default_styles(self):
+    def _parse_default_styles(self, styles: ET.Element):
+        """
+        :param styles: root of parsed styles part of document
+        """
         for default_style in pr_const.DefaultStyle:
-            el = self._get_xml_file(self._content[DocumentParser.styles_key]).find(
-                './w:docDefaults/' + default_style.tag, namespaces
-            )
+            el = styles.find('./w:docDefaults/' + default_style.tag, namespaces)
             if el is not None:
                 elem = self.__parse_style(el, default_style.style_type())
                 if elem is not None:
                     self._default_styles[default_style.key] = elem
 
-    def _parse_styles(self):
-        for el in self._get_xml_file(self._content[DocumentParser.styles_key]).findall(
-                './' + pr_const.Style.tag(), namespaces
-        ):
+    def _parse_styles(self, styles: ET.Element):
+        """
+        :param styles: root of parsed styles part of document
+        """
+        for el in styles.findall('./' + pr_const.Style.tag(), namespaces):
             elem = self.__parse_style(el)
             if elem is not None:
                 self._styles[elem.id] = elem
 
+    def _flatten_styles(self):
+        """
+        precompute effective properties of styles with folded chains of base styles (and area styles of table styles)
+        """
+        styles: list = [*self._default_styles.values(), *self._styles.values()]
+        for style in styles:
+            style._reset_flattening()
+        for style in styles:
+            if style._effective_properties is None:
+                style._flatten()
+
     def __parse_style(self, element: ET.Element, default_type=None):
         from .styles import ParagraphStyle, CharacterStyle, TableStyle, NumberingStyle
 
@@ -218,20 +328,30 @@ class DocumentParser:
             return result
         return self._images_dir
 
-    def _images_extraction(self):
-        import zipfile
-
-        images: List[str] = []
+    def extract_images(self):
+        """
+        write all images of document to images directory (or load them to memory if document haven't images
+        directory). Images are also extracted one by one on demand by get_image, so calling this method is needed
+        only for getting all images
+        """
         for rel_id, rel_v in self._relationships.items():
             if rel_v[0] == 'image':
-                images.append(rel_v[1])
+                self._extract_image(rel_id)
 
+    def _get_image_part_name(self, image_id: str) -> str:
         docx_media_dir: str = 'word/'
-        directory: str = self._get_images_directory()
-        with zipfile.ZipFile(self._path) as z:
-            for image in images:
-                with open(directory + image.split('/')[-1], 'wb') as f:
-                    f.write(z.read(docx_media_dir + image))
+        return docx_media_dir + self._relationships[image_id][1]
+
+    def _extract_image(self, image_id: str):
+        import shutil
+
+        if self._images_dir is None:
+            self.get_image_content(image_id)
+        elif image_id not in self._extracted_images:
+            with self._archive.open(self._get_image_part_name(image_id)) as source, \
+                    open(self._get_images_directory() + self._relationships[image_id][1].split('/')[-1], 'wb') as f:
+                shutil.copyfileobj(source, f, DocumentParser.image_copy_chunk_size)
+            self._extracted_images.add(image_id)
 
     def _parse_numberings(self):
         if self._content.get(DocumentParser.numberings_key) is not None:
@@ -257,13 +377,79 @@ class DocumentParser:
     def get_default_style(self, style_type: pr_const.DefaultStyle):
         return self._default_styles.get(style_type.key)
 
-    def get_image(self, image_id: str):
+    def get_image(self, image_id: str) -> str:
+        """
+        :return: path to extracted image or data URI of image if images of document are stored in memory
+        """
+        import base64
+        import mimetypes
+
         if self._images_dir is not None:
+            self._extract_image(image_id)
             return f'{self._get_images_directory()}{self._relationships[image_id][1].split("/")[-1]}'
+        if self._archive is not None:
+            mime_type: Optional[str] = mimetypes.guess_type(self._relationships[image_id][1])[0]
+            content: str = base64.b64encode(self.get_image_content(image_id)).decode('ascii')
+            return f'data:{mime_type if mime_type is not None else "application/octet-stream"};base64,{content}'
         raise RuntimeError("Document haven't images directory")
 
+    def get_image_content(self, image_id: str) -> bytes:
+        """
+        :return: content of image file. It is kept in memory if document haven't images directory
+        """
+        content: Optional[bytes] = self._images.get(image_id)
+        if content is None:
+            if self._archive is None:
+                raise RuntimeError("Document haven't images")
+            with self._archive.open(self._get_image_part_name(image_id)) as source:
+                content = source.read()
+            if self._images_dir is None:
+                self._images[image_id] = content
+        return content
+
     def get_numbering(self, num_id):
         return self._numbering[pr_const.Element.NUMBERING.key][num_id]
 
     def get_abstract_numbering(self, num_id):
         return self._numbering[pr_const.Element.ABSTRACT_NUMBERING.key][num_id]
+
+    def get_numbering_level(self, num_id: str, level_index: Union[str, int]):
+        """
+        :param num_id: id of numbering
+        :param level_index: index of level
+        :return: level of abstract numbering of numbering or None
+        """
+        if self._numbering_levels_version != self._resolved_properties_cache_version.value:
+            self._numbering_levels = {}
+            self._numbering_levels_version = self._resolved_properties_cache_version.value
+        key: Tuple[str, Union[str, int]] = (num_id, level_index)
+        if key not in self._numbering_levels:
+            abstract_num_id: Optional[str] = self.get_numbering(num_id).get_abstract_numbering_id()
+            self._numbering_levels[key] = self.get_abstract_numbering(abstract_num_id).get_level(level_index) \
+                if abstract_num_id is not None else None
+        return self._numbering_levels[key]
+
+    def intern_run_format(self, run_format) -> Tuple[object, int]:
+        """
+        :param run_format: RunFormat
+        :return: (shared RunFormat equal to run_format, id of this format in document)
+        """
+        format_id: Optional[int] = self._run_formats_ids.get(run_format)
+        if format_id is None:
+            format_id = len(self._run_formats)
+            self._run_formats_ids[run_format] = format_id
+            self._run_formats.append(run_format)
+        return self._run_formats[format_id], format_id
+
+    def get_run_format(self, format_id: int):
+        """
+        :param format_id: id returned by intern_run_format or Run.get_format_id
+        :return: RunFormat
+        """
+        return self._run_formats[format_id]
+
+    def count_run_formats(self) -> int:
+        """
+        :return: count of distinct effective formats of runs that are interned in document
+        """
+        return len(self._run_formats)
@@ -0,0 +1,97 @@
+from typing import NamedTuple, Optional, Union, Tuple, Dict
+from .constants import property_enums as pr_const
+
+
+class RunFormat(NamedTuple):
+    """
+    effective formatting of run: values of all style properties of run. Values are equal to results of
+    get_property of run, so properties that aren't set are None (also boolean properties like bold)
+    """
+    font_ascii: Optional[str]
+    font_east_asia: Optional[str]
+    font_h_ansi: Optional[str]
+    font_ascii_theme: Optional[str]
+    font_east_asia_theme: Optional[str]
+    font_h_ansi_theme: Optional[str]
+    font_cs: Optional[str]
+    size: Optional[str]
+    bold: Union[str, bool, None]
+    italic: Union[str, bool, None]
+    strike: Union[str, bool, None]
+    vertical_align: Optional[str]
+    language: Optional[str]
+    color: Optional[str]
+    theme_color: Optional[str]
+    background_color: Optional[str]
+    background_fill: Optional[str]
+    underline_type: Optional[str]
+    underline_color: Optional[str]
+    spacing: Optional[str]
+    border_type: Optional[str]
+    border_color: Optional[str]
+    border_size: Optional[str]
+    border_space: Optional[str]
+
+
+class ParagraphFormat(NamedTuple):
+    """
+    effective formatting of paragraph: values of all style properties of paragraph. Values are equal to results of
+    get_property of paragraph, so properties that aren't set are None (also boolean properties like keep_lines)
+    """
+    align: Optional[str]
+    indent_left: Optional[str]
+    indent_right: Optional[str]
+    hanging: Optional[str]
+    first_line: Optional[str]
+    keep_lines: Union[str, bool, None]
+    keep_next: Union[str, bool, None]
+    outline_level: Optional[str]
+    top_border_type: Optional[str]
+    top_border_color: Optional[str]
+    top_border_size: Optional[str]
+    top_border_space: Optional[str]
+    bottom_border_type: Optional[str]
+    bottom_border_color: Optional[str]
+    bottom_border_size: Optional[str]
+    bottom_border_space: Optional[str]
+    right_border_type: Optional[str]
+    right_border_color: Optional[str]
+    right_border_size: Optional[str]
+    right_border_space: Optional[str]
+    left_border_type: Optional[str]
+    left_border_color: Optional[str]
+    left_border_size: Optional[str]
+    left_border_space: Optional[str]
+    before_space: Optional[str]
+    after_space: Optional[str]
+    spacing: Optional[str]
+    font_size: Optional[str]
+    font_ascii_theme: Optional[str]
+    font_east_asia_theme: Optional[str]
+    font_h_ansi_theme: Optional[str]
+
+
+def _keys_of_fields(format_class, property_enum) -> Tuple[str, ...]:
+    """
+    :return: keys of properties corresponding to fields of format_class (field is lowercase name of property enum)
+    """
+    return tuple(property_enum[field.upper()].key for field in format_class._fields)
+
+
+# keys of properties in order of fields of formats
+RUN_FORMAT_KEYS: Tuple[str, ...] = _keys_of_fields(RunFormat, pr_const.RunProperty)
+PARAGRAPH_FORMAT_KEYS: Tuple[str, ...] = _keys_of_fields(ParagraphFormat, pr_const.ParagraphProperty)
+
+
+def create_run_format(values: Dict[str, Union[str, bool, None]]) -> RunFormat:
+    """
+    :param values: {key of property: resolved value} for all RUN_FORMAT_KEYS
+    """
+    return RunFormat._make([values[key] for key in RUN_FORMAT_KEYS])
+
+
+def create_paragraph_format(values: Dict[str, Union[str, bool, None]]) -> ParagraphFormat:
+    """
+    :param values: {key of property: resolved value} for all PARAGRAPH_FORMAT_KEYS
+    """
+    return ParagraphFormat._make([values[key] for key in PARAGRAPH_FORMAT_KEYS])
@@ -5,6 +5,8 @@ from ..utils.functions import execute_if_not_none
 
 
 class GetSetMixin(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_property(self, property_name, is_find_missed_or_true: bool = True):
         pass
@@ -15,6 +17,8 @@ class GetSetMixin(ABC):
 
 
 class ParagraphPropertiesGetSetMixin(GetSetMixin, ABC):
+    __slots__ = ()
+
     def get_align(self) -> Optional[str]:
         return self.get_property(pr_const.ParagraphProperty.ALIGN)
 
@@ -93,6 +97,8 @@ class ParagraphPropertiesGetSetMixin(GetSetMixin, ABC):
 
 
 class RunPropertiesGetSetMixin(GetSetMixin, ABC):
+    __slots__ = ()
+
     def get_font(self) -> Optional[str]:
         return self.get_property(pr_const.RunProperty.FONT_ASCII)
 
@@ -201,6 +207,8 @@ class RunPropertiesGetSetMixin(GetSetMixin, ABC):
 
 
 class TablePropertiesGetSetMixin(GetSetMixin, ABC):
+    __slots__ = ()
+
     def get_width(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         return: Tuple(width, type, layout)
@@ -301,6 +309,8 @@ class TablePropertiesGetSetMixin(GetSetMixin, ABC):
 
 
 class RowPropertiesGetSetMixin(GetSetMixin, ABC):
+    __slots__ = ()
+
     def is_header(self) -> bool:
         result = self.get_property(pr_const.RowProperty.HEADER)
         return result if result is not None else False
@@ -323,6 +333,8 @@ class RowPropertiesGetSetMixin(GetSetMixin, ABC):
 
 
 class CellPropertiesGetSetMixin(GetSetMixin, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_parent_table(self):
         pass
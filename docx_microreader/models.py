@@ -1,38 +1,30 @@
+import os
 from .xml_element import XMLement
 from .docx_parser import DocumentParser
 import xml.etree.ElementTree as ET
-from typing import List, Callable, Dict, Union, Tuple, Optional
+from typing import List, Callable, Dict, Union, Tuple, Optional, BinaryIO, FrozenSet
 from .mixins.getters_setters import ParagraphPropertiesGetSetMixin, RunPropertiesGetSetMixin, \
                                     TablePropertiesGetSetMixin, RowPropertiesGetSetMixin, CellPropertiesGetSetMixin
 from .constants import property_enums as pr_const
 from .constants.translate_formats import TranslateFormat
 from .numbering import NumberingLevel
+from .formats import RunFormat, ParagraphFormat, RUN_FORMAT_KEYS, PARAGRAPH_FORMAT_KEYS, create_run_format, \
+                     create_paragraph_format
 from .utils.functions import execute_if_not_none
 
 
 class Image(XMLement):
     element_description = pr_const.Element.IMAGE
+    __slots__ = ()
     _is_unique = True
     from docx_microreader.translators.html.html_translators import ImageTranslatorToHTML
     translators = {
         TranslateFormat.HTML: ImageTranslatorToHTML(),
     }
 
-    def translate(self, to_format: Union[TranslateFormat, str, None] = None, is_recursive_translate: bool = True,
-                  context: Optional[dict] = None):
-        """
-        :param to_format: using translate_format of element if None
-        :param is_recursive_translate: pass to_format to inner element if True
-        :param context: Translators can use this variable for create context of translation
-        """
-        translator = self.translators[TranslateFormat(to_format)] if to_format is not None else \
-                     self.translators[self.translate_format]
-        translator.preparation_to_translate_inner_elements(self, context)
-        return translator.translate(self, [], context)
-
     def get_path(self):
         return execute_if_not_none(self._get_document(),
-                                   lambda x: x.get_image(self._properties[pr_const.ImageProperty.ID.key].value))
+                                   lambda x: x.get_image(self._get_property_value(pr_const.ImageProperty.ID.key)))
 
     def get_size(self) -> (Optional[int], Optional[int]):
         """
@@ -40,9 +32,14 @@ class Image(XMLement):
         """
         return execute_if_not_none(self.get_parent(), lambda x: x.get_size(), (None, None))
 
+    def get_content(self) -> Optional[bytes]:
+        image_id: Optional[str] = self._get_property_value(pr_const.ImageProperty.ID.key)
+        return execute_if_not_none(self._get_document(), lambda x: x.get_image_content(image_id))
+
 
 class Drawing(XMLement):
     element_description = pr_const.Element.DRAWING
+    __slots__ = ()
 
     from docx_microreader.translators.html.html_translators import ContainerTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
@@ -60,13 +57,14 @@ class Drawing(XMLement):
         :return: (horizontal size, vertical size)
         """
         return (
-            int(self._properties[pr_const.DrawingProperty.HORIZONTAL_SIZE.key].value),
-            int(self._properties[pr_const.DrawingProperty.VERTICAL_SIZE.key].value)
+            int(self._get_property_value(pr_const.DrawingProperty.HORIZONTAL_SIZE.key)),
+            int(self._get_property_value(pr_const.DrawingProperty.VERTICAL_SIZE.key))
         )
 
 
 class LineBreak(XMLement):
     element_description = pr_const.Element.LINE_BREAK
+    __slots__ = ()
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
     from docx_microreader.translators.html.html_translators import LineBreakTranslatorToHTML
     translators = {
@@ -77,6 +75,7 @@ class LineBreak(XMLement):
 
 class CarriageReturn(XMLement):
     element_description = pr_const.Element.CARRIAGE_RETURN
+    __slots__ = ()
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
     from docx_microreader.translators.html.html_translators import CarriageReturnTranslatorToHTML
     translators = {
@@ -87,6 +86,7 @@ class CarriageReturn(XMLement):
 
 class Tabulation(XMLement):
     element_description = pr_const.Element.Tabulation
+    __slots__ = ()
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
     from docx_microreader.translators.html.html_translators import TabulationTranslatorToHTML
     translators = {
@@ -97,6 +97,7 @@ class Tabulation(XMLement):
 
 class NoBreakHyphen(XMLement):
     element_description = pr_const.Element.NO_BREAK_HYPHEN
+    __slots__ = ()
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
     from docx_microreader.translators.html.html_translators import NoBreakHyphenTranslatorToHTML
     translators = {
@@ -107,6 +108,7 @@ class NoBreakHyphen(XMLement):
 
 class SoftHyphen(XMLement):
     element_description = pr_const.Element.SOFT_HYPHEN
+    __slots__ = ()
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
     from docx_microreader.translators.html.html_translators import SoftHyphenTranslatorToHTML
     translators = {
@@ -117,6 +119,7 @@ class SoftHyphen(XMLement):
 
 class Symbol(XMLement):
     element_description = pr_const.Element.SYMBOL
+    __slots__ = ()
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
     from docx_microreader.translators.html.html_translators import SymbolTranslatorToHTML
     translators = {
@@ -125,14 +128,15 @@ class Symbol(XMLement):
     }
 
     def get_char(self):
-        return self._properties.get(pr_const.SymbolProperty.CHAR.key).value
+        return self._get_property_value(pr_const.SymbolProperty.CHAR.key)
 
     def get_font(self):
-        return self._properties.get(pr_const.SymbolProperty.FONT.key).value
+        return self._get_property_value(pr_const.SymbolProperty.FONT.key)
 
 
 class Text(XMLement):
     element_description = pr_const.Element.TEXT
+    __slots__ = ('content',)
 
     from docx_microreader.translators.html.html_translators import TextTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
@@ -145,21 +149,13 @@ class Text(XMLement):
         self.content: str = element.text
         super(Text, self).__init__(element, parent)
 
-    def translate(self, to_format: Union[TranslateFormat, str, None] = None, is_recursive_translate: bool = True,
-                  context: Optional[dict] = None):
-        """
-        :param to_format: using translate_format of element if None
-        :param is_recursive_translate: pass to_format to inner element if True
-        :param context: Translators can use this variable for create context of translation
-        """
-        translator = self.translators[TranslateFormat(to_format)] if to_format is not None else \
-                     self.translators[self.translate_format]
-        translator.preparation_to_translate_inner_elements(self, context)
+    def _translate_by(self, translator, translated_inner_elements: list, context: dict):
         return translator.translate(self, [self.content], context)
 
 
 class Run(XMLement, RunPropertiesGetSetMixin):
     element_description = pr_const.Element.RUN
+    __slots__ = ('__effective_format', '__effective_format_id', '__effective_format_version')
 
     from docx_microreader.translators.html.html_translators import RunTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
@@ -172,20 +168,44 @@ class Run(XMLement, RunPropertiesGetSetMixin):
     def _possible_inner_elements_descriptions(cls) -> list:
         return [Text, Drawing, LineBreak, CarriageReturn, Tabulation, NoBreakHyphen, SoftHyphen, Symbol]
 
+    def __init__(self, element: ET.Element, parent):
+        # cached result of get_effective_format. It is valid while version of caches of resolved properties is same
+        self.__effective_format: Optional[RunFormat] = None
+        # id of effective format in interning table of document. None if run isn't in document
+        self.__effective_format_id: Optional[int] = None
+        self.__effective_format_version: int = -1
+        super(Run, self).__init__(element, parent)
+
     def _get_style_id(self) -> Optional[str]:
-        return self._properties[pr_const.RunProperty.STYLE.key].value
+        return self._get_property_value(pr_const.RunProperty.STYLE.key)
 
-    def get_property(self, property_name, is_find_missed_or_true: bool = True):
+    def get_effective_format(self) -> RunFormat:
         """
-        :param property_name: key of property (str or instance of Enum from constants.property_enums)
-        :param is_find_missed_or_true: recursive find value if result equal Property.Missed. Return True if not find
-        :return: Property.value or None
+        :return: values of all style properties of run. They are resolved in one walk of chain of styles.
+                 Runs of document with equal formats share one RunFormat
         """
-        from .properties import Property
+        if self.__effective_format_version != self._get_resolved_properties_cache_version():
+            run_format: RunFormat = create_run_format(self._get_properties(RUN_FORMAT_KEYS))
+            self.__effective_format_id = None
+            document = self._get_document()
+            if document is not None:
+                run_format, self.__effective_format_id = document.intern_run_format(run_format)
+            self.__effective_format = run_format
+            self.__effective_format_version = self._get_resolved_properties_cache_version()
+        return self.__effective_format
+
+    def get_format_id(self) -> Optional[int]:
+        """
+        :return: id of effective format of run in document (see Document.get_run_format).
+                 Runs with equal formats have equal ids. None if run isn't in document
+        """
+        self.get_effective_format()
+        return self.__effective_format_id
 
-        key: str = XMLement._key_of_property(property_name)
+    def _resolve_property(self, key: str, is_find_missed_or_true: bool):
+        from .properties import Property
 
-        result = super(Run, self).get_property(key, is_find_missed_or_true)
+        result = super(Run, self)._resolve_property(key, is_find_missed_or_true)
         if result is not None and (not isinstance(result, Property.Missed) or not is_find_missed_or_true):
             return result
 
@@ -207,9 +227,24 @@ class Run(XMLement, RunPropertiesGetSetMixin):
             return True
         return result
 
+    def _resolve_properties(self, keys: Tuple[str, ...]) -> Dict[str, Union[str, bool, None]]:
+        result: Dict[str, Union[str, bool, None]] = self._resolve_properties_of_element_and_base_style(keys)
+
+        not_found_keys: Tuple[str, ...] = tuple(key for key in keys if result[key] is None)
+        if not_found_keys and self.parent is not None:
+            result.update(self.parent._get_properties(not_found_keys))
+            not_found_keys = tuple(key for key in not_found_keys if result[key] is None)
+
+        if not_found_keys and self._default_style is not None:
+            default_style = self._get_default_style_from_document(self._default_style)
+            if default_style is not None:
+                result.update(default_style._get_properties(not_found_keys))
+        return result
+
 
 class Paragraph(XMLement, ParagraphPropertiesGetSetMixin):
     element_description = pr_const.Element.PARAGRAPH
+    __slots__ = ('__numbering_level', '__numbering_level_version', '__effective_format', '__effective_format_version')
 
     _properties_unificators = {
         pr_const.ParagraphProperty.ALIGN.key: [('left', ['start']),
@@ -230,20 +265,22 @@ class Paragraph(XMLement, ParagraphPropertiesGetSetMixin):
     def _possible_inner_elements_descriptions(cls) -> list:
         return [Run]
 
+    def __init__(self, element: ET.Element, parent):
+        # cached result of get_numbering_level. It is valid while version of caches of resolved properties isn't changed
+        self.__numbering_level: Optional[NumberingLevel] = None
+        self.__numbering_level_version: int = -1
+        # cached result of get_effective_format
+        self.__effective_format: Optional[ParagraphFormat] = None
+        self.__effective_format_version: int = -1
+        super(Paragraph, self).__init__(element, parent)
+
     def _get_style_id(self) -> Optional[str]:
-        return self._properties[pr_const.ParagraphProperty.STYLE.key].value
+        return self._get_property_value(pr_const.ParagraphProperty.STYLE.key)
 
-    def get_property(self, property_name, is_find_missed_or_true: bool = True):
-        """
-        :param property_name: key of property (str or instance of Enum from constants.property_enums)
-        :param is_find_missed_or_true: recursive find value if result equal Property.Missed. Return True if not find
-        :return: Property.value or None
-        """
+    def _resolve_property(self, key: str, is_find_missed_or_true: bool):
         from .properties import Property
 
-        key: str = XMLement._key_of_property(property_name)
-
-        result = super(Paragraph, self).get_property(key, is_find_missed_or_true)
+        result = super(Paragraph, self)._resolve_property(key, is_find_missed_or_true)
         if result is not None and (not isinstance(result, Property.Missed) or not is_find_missed_or_true):
             return result
 
@@ -265,20 +302,45 @@ class Paragraph(XMLement, ParagraphPropertiesGetSetMixin):
             return True
         return result
 
+    def _resolve_properties(self, keys: Tuple[str, ...]) -> Dict[str, Union[str, bool, None]]:
+        result: Dict[str, Union[str, bool, None]] = self._resolve_properties_of_element_and_base_style(keys)
+
+        not_found_keys: Tuple[str, ...] = tuple(key for key in keys if result[key] is None)
+        if not_found_keys and self.parent is not None:
+            result.update(self.parent._get_properties(not_found_keys))
+            not_found_keys = tuple(key for key in not_found_keys if result[key] is None)
+
+        if not_found_keys and self._default_style is not None:
+            default_style = self._get_default_style_from_document(self._default_style)
+            if default_style is not None:
+                result.update(default_style._get_properties(not_found_keys))
+        return result
+
+    def get_effective_format(self) -> ParagraphFormat:
+        """
+        :return: values of all style properties of paragraph. They are resolved in one walk of chain of styles
+        """
+        if self.__effective_format_version != self._get_resolved_properties_cache_version():
+            self.__effective_format = create_paragraph_format(self._get_properties(PARAGRAPH_FORMAT_KEYS))
+            self.__effective_format_version = self._get_resolved_properties_cache_version()
+        return self.__effective_format
+
     def get_numbering_level(self) -> Optional[NumberingLevel]:
-        num_id = self._properties.get(pr_const.ParagraphProperty.NUMBERING_ID.key).value
-        if num_id is not None:
-            doc = self._get_document()
-            abstract_num_id = execute_if_not_none(doc, lambda x: x.get_numbering(num_id).get_abstract_numbering_id())
-            if abstract_num_id is not None:
-                return doc.get_abstract_numbering(abstract_num_id).get_level(
-                    self._properties[pr_const.ParagraphProperty.NUMBERING_LEVEL.key].value
+        if self.__numbering_level_version != self._get_resolved_properties_cache_version():
+            num_id = self._get_property_value(pr_const.ParagraphProperty.NUMBERING_ID.key)
+            self.__numbering_level = None if num_id is None else execute_if_not_none(
+                self._get_document(),
+                lambda x: x.get_numbering_level(
+                    num_id, self._get_property_value(pr_const.ParagraphProperty.NUMBERING_LEVEL.key)
                 )
-            return None
+            )
+            self.__numbering_level_version = self._get_resolved_properties_cache_version()
+        return self.__numbering_level
 
 
 class Cell(XMLement, CellPropertiesGetSetMixin):
     element_description = pr_const.Element.CELL
+    __slots__ = ('row_span', 'is_header', 'index_in_row')
 
     from docx_microreader.translators.html.html_translators import CellTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
@@ -291,171 +353,102 @@ class Cell(XMLement, CellPropertiesGetSetMixin):
     def _possible_inner_elements_descriptions(cls) -> list:
         return [Paragraph, ('docx_microreader.models', 'Table')]
 
+    __table_areas_for_horizontal_inside_borders: FrozenSet[pr_const.TableArea] = frozenset(
+        set(pr_const.TableArea) - {pr_const.TableArea.ODD_ROW, pr_const.TableArea.EVEN_ROW}
+    )
+    __table_areas_for_vertical_inside_borders: FrozenSet[pr_const.TableArea] = frozenset(
+        set(pr_const.TableArea) - {pr_const.TableArea.ODD_COLUMN, pr_const.TableArea.EVEN_COLUMN}
+    )
+    __table_areas_for_inside_borders_of_header: FrozenSet[pr_const.TableArea] = frozenset({
+        pr_const.TableArea.FIRST_COLUMN, pr_const.TableArea.LAST_COLUMN,
+        pr_const.TableArea.ODD_COLUMN, pr_const.TableArea.EVEN_COLUMN,
+    })
+
     def __init__(self, element: ET.Element, parent):
         self.row_span: int = 1
         self.is_header: bool = False
         self.index_in_row: int = -1
         super(Cell, self).__init__(element, parent)
 
-    def __get_table_area_style(self, table_area_style_type: str):
+    def __get_table_area_style(self, table_area_style_type: Union[str, pr_const.TableArea]):
         style = execute_if_not_none(self.get_parent_table(), lambda x: x.get_base_style())
         return execute_if_not_none(style, lambda x: x.get_table_area_style(table_area_style_type))
 
-    def __get_property_of_table_area_style(self, property_name, table_area_style_type: str):
+    def __get_property_of_table_area_style(self, property_name, table_area_style_type: Union[str, pr_const.TableArea]):
         return execute_if_not_none(
             self.__get_table_area_style(table_area_style_type),
             lambda x: x.get_property(property_name)
         )
 
-    def __get_property_of_top_left_cell_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_top() and self.get_parent_table().is_use_style_of_first_row() and \
-                self.is_first_in_row() and self.get_parent_table().is_use_style_of_first_column():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.TOP_LEFT_CELL.value), True
-        return None, False
-
-    def __get_property_of_top_right_cell_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_top() and self.get_parent_table().is_use_style_of_first_row() and \
-                self.is_last_in_row() and self.get_parent_table().is_use_style_of_last_column():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.TOP_RIGHT_CELL.value), True
-        return None, False
-
-    def __get_property_of_bottom_left_cell_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_bottom() and self.get_parent_table().is_use_style_of_last_row() and \
-                self.is_first_in_row() and self.get_parent_table().is_use_style_of_first_column():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.BOTTOM_LEFT_CELL.value), \
-                   True
-        return None, False
-
-    def __get_property_of_bottom_right_cell_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_bottom() and self.get_parent_table().is_use_style_of_last_row() and \
-                self.is_last_in_row() and self.get_parent_table().is_use_style_of_last_column():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.BOTTOM_RIGHT_CELL.value),\
-                   True
-        return None, False
-
-    def __get_property_of_first_column_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_first_in_row() and self.get_parent_table().is_use_style_of_first_column():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.FIRST_COLUMN.value), True
-        return None, False
-
-    def __get_property_of_last_column_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_last_in_row() and self.get_parent_table().is_use_style_of_last_column():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.LAST_COLUMN.value), True
-        return None, False
-
-    def __get_property_of_first_row_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_top() and self.get_parent_table().is_use_style_of_first_row():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.FIRST_ROW.value), True
-        return None, False
-
-    def __get_property_of_last_row_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_bottom() and self.get_parent_table().is_use_style_of_last_row():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.LAST_ROW.value), True
-        return None, False
-
-    def __get_property_of_odd_row_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.get_parent_row().is_odd() and self.get_parent_table().is_use_style_of_horizontal_banding():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.ODD_ROW.value), True
-        return None, False
-
-    def __get_property_of_even_row_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.get_parent_row().is_even() and self.get_parent_table().is_use_style_of_horizontal_banding():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.EVEN_ROW.value), True
-        return None, False
-
-    def __get_property_of_odd_column_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_odd() and self.get_parent_table().is_use_style_of_vertical_banding():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.ODD_COLUMN.value), True
-        return None, False
-
-    def __get_property_of_even_column_area_style(self, property_name) -> Tuple[Union[str, None, bool], bool]:
-        if self.is_even() and self.get_parent_table().is_use_style_of_vertical_banding():
-            return self.__get_property_of_table_area_style(property_name, pr_const.TableArea.EVEN_COLUMN.value), True
-        return None, False
+    def _define_table_areas(self) -> Tuple[pr_const.TableArea, ...]:
+        """
+        :return: table areas whose styles are applicable to cell, in order of priority of area styles
+        """
+        table = self.get_parent_table()
+        is_top: bool = self.is_top()
+        is_bottom: bool = self.is_bottom()
+        is_first_in_row: bool = self.is_first_in_row()
+        is_last_in_row: bool = self.is_last_in_row()
+        conditions: List[Tuple[pr_const.TableArea, bool]] = [
+            (pr_const.TableArea.TOP_LEFT_CELL, is_top and table.is_use_style_of_first_row() and
+             is_first_in_row and table.is_use_style_of_first_column()),
+            (pr_const.TableArea.TOP_RIGHT_CELL, is_top and table.is_use_style_of_first_row() and
+             is_last_in_row and table.is_use_style_of_last_column()),
+            (pr_const.TableArea.BOTTOM_LEFT_CELL, is_bottom and table.is_use_style_of_last_row() and
+             is_first_in_row and table.is_use_style_of_first_column()),
+            (pr_const.TableArea.BOTTOM_RIGHT_CELL, is_bottom and table.is_use_style_of_last_row() and
+             is_last_in_row and table.is_use_style_of_last_column()),
+            (pr_const.TableArea.FIRST_ROW, is_top and table.is_use_style_of_first_row()),
+            (pr_const.TableArea.LAST_ROW, is_bottom and table.is_use_style_of_last_row()),
+            (pr_const.TableArea.FIRST_COLUMN, is_first_in_row and table.is_use_style_of_first_column()),
+            (pr_const.TableArea.LAST_COLUMN, is_last_in_row and table.is_use_style_of_last_column()),
+            (pr_const.TableArea.ODD_COLUMN, self.is_odd() and table.is_use_style_of_vertical_banding()),
+            (pr_const.TableArea.EVEN_COLUMN, self.is_even() and table.is_use_style_of_vertical_banding()),
+            (pr_const.TableArea.ODD_ROW, self.get_parent_row().is_odd() and
+             table.is_use_style_of_horizontal_banding()),
+            (pr_const.TableArea.EVEN_ROW, self.get_parent_row().is_even() and
+             table.is_use_style_of_horizontal_banding()),
+        ]
+        return tuple(area for area, is_met_condition in conditions if is_met_condition)
 
     def __define_table_area_style_and_get_property(self, property_name) -> Union[str, None, bool]:
-        methods: List[Callable] = [
-            self.__get_property_of_top_left_cell_area_style,
-            self.__get_property_of_top_right_cell_area_style,
-            self.__get_property_of_bottom_left_cell_area_style,
-            self.__get_property_of_bottom_right_cell_area_style,
-            self.__get_property_of_first_row_area_style,
-            self.__get_property_of_last_row_area_style,
-            self.__get_property_of_first_column_area_style,
-            self.__get_property_of_last_column_area_style,
-            self.__get_property_of_odd_column_area_style,
-            self.__get_property_of_even_column_area_style,
-            self.__get_property_of_odd_row_area_style,
-            self.__get_property_of_even_row_area_style,
-        ]
-        for method in methods:
-            result = method(property_name)[0]
+        for area in self.get_parent_table()._get_table_areas_of_cell(self):
+            result = self.__get_property_of_table_area_style(property_name, area)
             if result is not None:
                 return result
 
+    def __get_property_of_first_applicable_table_area_style(self, property_name, table_areas) -> \
+            Union[str, None, bool]:
+        """
+        :param table_areas: considered table areas
+        :return: property of style of the first (by priority) applicable area of table_areas
+        """
+        for area in self.get_parent_table()._get_table_areas_of_cell(self):
+            if area in table_areas:
+                return self.__get_property_of_table_area_style(property_name, area)
+
     def __define_table_area_style_and_get_property_for_horizontal_inside_borders(self, property_name) -> \
             Union[str, None, bool]:
-        methods: List[Callable] = [
-            self.__get_property_of_top_left_cell_area_style,
-            self.__get_property_of_top_right_cell_area_style,
-            self.__get_property_of_bottom_left_cell_area_style,
-            self.__get_property_of_bottom_right_cell_area_style,
-            self.__get_property_of_first_row_area_style,
-            self.__get_property_of_last_row_area_style,
-            self.__get_property_of_first_column_area_style,
-            self.__get_property_of_last_column_area_style,
-            self.__get_property_of_odd_column_area_style,
-            self.__get_property_of_even_column_area_style,
-        ]
-        for method in methods:
-            result, is_met_contition = method(property_name)
-            if result is not None or is_met_contition:
-                return result
+        return self.__get_property_of_first_applicable_table_area_style(
+            property_name, Cell.__table_areas_for_horizontal_inside_borders
+        )
 
     def __define_table_area_style_and_get_property_for_vertical_inside_borders(self, property_name) -> \
             Union[str, None, bool]:
-        methods: List[Callable] = [
-            self.__get_property_of_top_left_cell_area_style,
-            self.__get_property_of_top_right_cell_area_style,
-            self.__get_property_of_bottom_left_cell_area_style,
-            self.__get_property_of_bottom_right_cell_area_style,
-            self.__get_property_of_first_row_area_style,
-            self.__get_property_of_last_row_area_style,
-            self.__get_property_of_first_column_area_style,
-            self.__get_property_of_last_column_area_style,
-            self.__get_property_of_odd_row_area_style,
-            self.__get_property_of_even_row_area_style,
-        ]
-        for method in methods:
-            result, is_met_contition = method(property_name)
-            if result is not None or is_met_contition:
-                return result
+        return self.__get_property_of_first_applicable_table_area_style(
+            property_name, Cell.__table_areas_for_vertical_inside_borders
+        )
 
     def __define_table_area_style_and_get_property_for_inside_borders_of_header(self, property_name) -> \
             Union[str, None, bool]:
-        methods: List[Callable] = [
-            self.__get_property_of_first_column_area_style,
-            self.__get_property_of_last_column_area_style,
-            self.__get_property_of_odd_column_area_style,
-            self.__get_property_of_even_column_area_style,
-        ]
-        for method in methods:
-            result, is_met_contition = method(property_name)
-            if result is not None or is_met_contition:
-                return result
+        return self.__get_property_of_first_applicable_table_area_style(
+            property_name, Cell.__table_areas_for_inside_borders_of_header
+        )
 
-    def get_property(self, property_name, is_find_missed_or_true: bool = True):
-        """
-        :param property_name: key of property (str or instance of Enum from constants.property_enums)
-        :param is_find_missed_or_true: recursive find value if result equal Property.Missed. Return True if not find
-        :return: Property.value or None
-        """
+    def _resolve_property(self, key: str, is_find_missed_or_true: bool):
         from .properties import Property
 
-        result = None
-        key: str = XMLement._key_of_property(property_name)
-
-        result = super(Cell, self).get_property(key, is_find_missed_or_true)
+        result = super(Cell, self)._resolve_property(key, is_find_missed_or_true)
         if result is not None and (not isinstance(result, Property.Missed) or not is_find_missed_or_true):
             return result
 
@@ -482,9 +475,8 @@ class Cell(XMLement, CellPropertiesGetSetMixin):
         """
         direct: pr_const.Direction = pr_const.convert_to_enum_element(direction, pr_const.Direction)
         pr_name: pr_const.BorderProperty = pr_const.convert_to_enum_element(property_name, pr_const.BorderProperty)
-        maybe_result = execute_if_not_none(
-            self._properties.get(pr_const.CellProperty.get_border_property_enum_value(direct, pr_name).key),
-            lambda x: x.value
+        maybe_result = self._get_property_value(
+            pr_const.CellProperty.get_border_property_enum_value(direct, pr_name).key
         )
         if maybe_result is None or (maybe_result == 'auto' and pr_name == pr_const.BorderProperty.COLOR):
             if not (self.is_first_in_row() and direct == pr_const.Direction.LEFT) and \
@@ -526,10 +518,10 @@ class Cell(XMLement, CellPropertiesGetSetMixin):
         )
 
     def get_col_span(self) -> Optional[str]:
-        return self._properties[pr_const.CellProperty.COLUMN_SPAN.key].value
+        return self._get_property_value(pr_const.CellProperty.COLUMN_SPAN.key)
 
     def set_col_span_value(self, value: Union[str, int]):
-        self._properties[pr_const.CellProperty.COLUMN_SPAN.key].value = str(value)
+        self._set_property_value(pr_const.CellProperty.COLUMN_SPAN.key, str(value))
 
     def get_parent_row(self):
         return self.get_parent()
@@ -572,6 +564,7 @@ class Cell(XMLement, CellPropertiesGetSetMixin):
 
 class Row(XMLement, RowPropertiesGetSetMixin):
     element_description = pr_const.Element.ROW
+    __slots__ = ('is_first_row_in_header', 'is_last_row_in_header', 'index_in_table')
 
     from docx_microreader.translators.html.html_translators import RowTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
@@ -585,12 +578,14 @@ class Row(XMLement, RowPropertiesGetSetMixin):
         return [Cell]
 
     def __init__(self, element: ET.Element, parent):
-        super(Row, self).__init__(element, parent)
-        self.__set_index_in_row_for_cells()
         self.is_first_row_in_header: bool = False
         self.is_last_row_in_header: bool = False
         self.index_in_table: int = -1
-        if self._properties[pr_const.RowProperty.HEADER.key].value:
+        super(Row, self).__init__(element, parent)
+
+    def _after_parse_inner_elements(self):
+        self.__set_index_in_row_for_cells()
+        if self._get_property_value(pr_const.RowProperty.HEADER.key):
             self.__set_cells_as_header()
 
     def __set_cells_as_header(self):
@@ -636,6 +631,7 @@ class Row(XMLement, RowPropertiesGetSetMixin):
 
 class Table(XMLement, TablePropertiesGetSetMixin):
     element_description = pr_const.Element.TABLE
+    __slots__ = ('header_row_number', '__cells_table_areas', '__cells_table_areas_version', '__layout_version')
 
     _properties_unificators = {
         pr_const.TableProperty.ALIGN.key: [('left', ['start']),
@@ -655,46 +651,115 @@ class Table(XMLement, TablePropertiesGetSetMixin):
         return [Row]
 
     def __init__(self, element: ET.Element, parent):
+        self.header_row_number: int = 0
+        # {cell: applicable table areas of cell}. It is computed for all cells of table at once and is recomputed
+        # when caches of resolved properties are invalidated (changing of rows, cells or their properties)
+        self.__cells_table_areas: Dict[Cell, Tuple[pr_const.TableArea, ...]] = {}
+        self.__cells_table_areas_version: int = -1
+        # version of caches of resolved properties for which layout (header rows and spans of cells) is defined.
+        # None while table is parsed, because layout depends on properties of table that are set after parsing
+        self.__layout_version: Optional[int] = None
         super(Table, self).__init__(element, parent)
+        # layout is defined when table is built, so translation doesn't change table if table isn't changed.
+        # Rows of lazy table define layout when they are parsed
+        self.__layout_version = -1
+        if self.is_inner_elements_parsed():
+            self.__update_layout()
+
+    def _after_parse_inner_elements(self):
         self.__set_index_in_table_for_rows()
-        self.header_row_number: int = 0
+        if self.__layout_version is not None:
+            self.__update_layout()
 
-    def translate(self, to_format: Union[TranslateFormat, str, None] = None, is_recursive_translate: bool = True,
-                  context: Optional[dict] = None):
+    def _preparation_to_translate(self):
+        if self.__layout_version != self._get_resolved_properties_cache_version():
+            self.__update_layout()
+
+    def _get_style_id(self) -> Optional[str]:
+        return self._get_property_value(pr_const.TableProperty.STYLE.key)
+
+    def _get_table_areas_of_cell(self, cell: Cell) -> Tuple[pr_const.TableArea, ...]:
+        """
+        :param cell: cell of table
+        :return: table areas whose styles are applicable to cell, in order of priority of area styles
         """
-        :param to_format: using translate_format of element if None
-        :param is_recursive_translate: pass to_format to inner element if True
-        :param context: Translators can use this variable for create context of translation
+        if self.__cells_table_areas_version != self._get_resolved_properties_cache_version():
+            self.__cells_table_areas = {
+                c: c._define_table_areas() for row in self._inner_elements for c in row.iterate_by_inner_elements()
+            }
+            self.__cells_table_areas_version = self._get_resolved_properties_cache_version()
+        result: Optional[Tuple[pr_const.TableArea, ...]] = self.__cells_table_areas.get(cell)
+        return result if result is not None else cell._define_table_areas()
+
+    def __get_layout(self) -> tuple:
         """
-        self.__define_first_and_last_head_rows()
-        self.__calculate_rowspan_for_cells()
-        return super(Table, self).translate(TranslateFormat(to_format), is_recursive_translate, context)
+        :return: header rows and spans of cells that affect table areas of cells: (number of header rows,
+                 ((is first row in header, is last row in header, (row span of cell, ...)) for each row))
+        """
+        return self.header_row_number, tuple(
+            (row.is_first_row_in_header, row.is_last_row_in_header,
+             tuple(cell.row_span for cell in row.iterate_by_inner_elements()))
+            for row in self._inner_elements
+        )
 
-    def _get_style_id(self) -> Optional[str]:
-        return self._properties[pr_const.TableProperty.STYLE.key].value
+    def __update_layout(self):
+        """
+        layout is calculated without changing of table and is set only if it differs from current one. So
+        translations of unchanged table from different threads at once don't change it
+        """
+        layout: tuple = self.__calculate_layout()
+        if layout != self.__get_layout():
+            self.header_row_number = layout[0]
+            for row, (is_first_row_in_header, is_last_row_in_header, row_spans) in zip(self._inner_elements, layout[1]):
+                row.is_first_row_in_header = is_first_row_in_header
+                row.is_last_row_in_header = is_last_row_in_header
+                for cell, row_span in zip(row.iterate_by_inner_elements(), row_spans):
+                    cell.row_span = row_span
+            # header rows and spans of cells define table areas of cells, so they affect only elements of table
+            self.__cells_table_areas_version = -1
+            self._invalidate_resolved_properties_cache_of_inner_elements()
+        self.__layout_version = self._get_resolved_properties_cache_version()
+
+    def __calculate_layout(self) -> tuple:
+        """
+        :return: layout of table in format of __get_layout
+        """
+        header_row_number, header_rows = self.__define_first_and_last_head_rows()
+        row_spans: Dict[Cell, int] = self.__calculate_rowspan_for_cells()
+        return header_row_number, tuple(
+            (is_first_row_in_header, is_last_row_in_header,
+             tuple(row_spans.get(cell, 1) for cell in row.iterate_by_inner_elements()))
+            for row, (is_first_row_in_header, is_last_row_in_header) in zip(self._inner_elements, header_rows)
+        )
 
     def __set_index_in_table_for_rows(self):
         for index, el in enumerate(self._inner_elements):
             el.index_in_table = index
 
-    def __define_first_and_last_head_rows(self):
-        self.header_row_number = 0
+    def __define_first_and_last_head_rows(self) -> Tuple[int, List[List[bool]]]:
+        """
+        :return: (number of header rows, [[is first row in header, is last row in header] for each row])
+        """
+        header_row_number: int = 0
+        header_rows: List[List[bool]] = [[False, False] for _ in self._inner_elements]
         if self._inner_elements:
             if self._inner_elements[0].is_header():
-                self.header_row_number = 1
-                self._inner_elements[0].is_first_row_in_header = True
-                self._inner_elements[0].is_last_row_in_header = True
-                previous_row: Row = self._inner_elements[0]
-                for row in self._inner_elements:
-                    if row != previous_row and row.is_header():
-                        self.header_row_number += 1
-                        previous_row.is_last_row_in_header = False
-                        row.is_last_row_in_header = True
-                    previous_row = row
-
-    def __calculate_rowspan_for_cells(self):
+                header_row_number = 1
+                header_rows[0] = [True, True]
+                for index in range(1, len(self._inner_elements)):
+                    if self._inner_elements[index].is_header():
+                        header_row_number += 1
+                        header_rows[index - 1][1] = False
+                        header_rows[index][1] = True
+        return header_row_number, header_rows
+
+    def __calculate_rowspan_for_cells(self) -> Dict[Cell, int]:
+        """
+        :return: {cell that begins vertical merging: row span}
+        """
         from .properties import Property
 
+        row_spans: Dict[Cell, int] = {}
         cell_for_row_span: Dict[int, Cell] = {}
         for row in self._inner_elements:
             col: int = 0
@@ -702,63 +767,65 @@ class Table(XMLement, TablePropertiesGetSetMixin):
                 vertical_merge = cell.get_property(pr_const.CellProperty.VERTICAL_MERGE, False)
                 if vertical_merge == 'restart':
                     cell_for_row_span[col] = cell
-                    cell_for_row_span[col].row_span = 1
+                    row_spans[cell] = 1
                 elif vertical_merge == 'continue' or isinstance(vertical_merge, Property.Missed):
-                    cell_for_row_span[col].row_span += 1
+                    row_spans[cell_for_row_span[col]] += 1
                 col_span = cell.get_col_span()
                 col += int(col_span) if col_span is not None else 1
+        return row_spans
 
     def is_use_style_of_first_row(self) -> bool:
-        if self._properties[pr_const.TableProperty.FIRST_ROW_STYLE_LOOK.key].value is None:
+        if self._get_property_value(pr_const.TableProperty.FIRST_ROW_STYLE_LOOK.key) is None:
             return False
-        return self._properties[pr_const.TableProperty.FIRST_ROW_STYLE_LOOK.key].value == '1'
+        return self._get_property_value(pr_const.TableProperty.FIRST_ROW_STYLE_LOOK.key) == '1'
 
     def set_as_use_style_of_first_row(self, is_use: bool):
-        self._properties[pr_const.TableProperty.FIRST_ROW_STYLE_LOOK.key].value = None if not is_use else '1'
+        self._set_property_value(pr_const.TableProperty.FIRST_ROW_STYLE_LOOK.key, None if not is_use else '1')
 
     def is_use_style_of_first_column(self) -> bool:
-        if self._properties[pr_const.TableProperty.FIRST_COLUMN_STYLE_LOOK.key].value is None:
+        if self._get_property_value(pr_const.TableProperty.FIRST_COLUMN_STYLE_LOOK.key) is None:
             return False
-        return self._properties[pr_const.TableProperty.FIRST_COLUMN_STYLE_LOOK.key].value == '1'
+        return self._get_property_value(pr_const.TableProperty.FIRST_COLUMN_STYLE_LOOK.key) == '1'
 
     def set_as_use_style_of_first_column(self, is_use: bool):
-        self._properties[pr_const.TableProperty.FIRST_COLUMN_STYLE_LOOK.key].value = None if not is_use else '1'
+        self._set_property_value(pr_const.TableProperty.FIRST_COLUMN_STYLE_LOOK.key, None if not is_use else '1')
 
     def is_use_style_of_last_row(self) -> bool:
-        if self._properties[pr_const.TableProperty.LAST_ROW_STYLE_LOOK.key].value is None:
+        if self._get_property_value(pr_const.TableProperty.LAST_ROW_STYLE_LOOK.key) is None:
             return False
-        return self._properties[pr_const.TableProperty.LAST_ROW_STYLE_LOOK.key].value == '1'
+        return self._get_property_value(pr_const.TableProperty.LAST_ROW_STYLE_LOOK.key) == '1'
 
     def set_as_use_style_of_last_row(self, is_use: bool):
-        self._properties[pr_const.TableProperty.LAST_ROW_STYLE_LOOK.key].value = None if not is_use else '1'
+        self._set_property_value(pr_const.TableProperty.LAST_ROW_STYLE_LOOK.key, None if not is_use else '1')
 
     def is_use_style_of_last_column(self) -> bool:
-        if self._properties[pr_const.TableProperty.LAST_COLUMN_STYLE_LOOK.key].value is None:
+        if self._get_property_value(pr_const.TableProperty.LAST_COLUMN_STYLE_LOOK.key) is None:
             return False
-        return self._properties[pr_const.TableProperty.LAST_COLUMN_STYLE_LOOK.key].value == '1'
+        return self._get_property_value(pr_const.TableProperty.LAST_COLUMN_STYLE_LOOK.key) == '1'
 
     def set_as_use_style_of_last_column(self, is_use: bool):
-        self._properties[pr_const.TableProperty.LAST_COLUMN_STYLE_LOOK.key].value = None if not is_use else '1'
+        self._set_property_value(pr_const.TableProperty.LAST_COLUMN_STYLE_LOOK.key, None if not is_use else '1')
 
     def is_use_style_of_horizontal_banding(self) -> bool:
-        if self._properties[pr_const.TableProperty.NO_HORIZONTAL_BANDING.key].value is None:
+        if self._get_property_value(pr_const.TableProperty.NO_HORIZONTAL_BANDING.key) is None:
             return True
-        return self._properties[pr_const.TableProperty.NO_HORIZONTAL_BANDING.key].value == '0'
+        return self._get_property_value(pr_const.TableProperty.NO_HORIZONTAL_BANDING.key) == '0'
 
     def set_as_use_style_of_horizontal_banding(self, is_use: bool):
-        self._properties[pr_const.TableProperty.NO_HORIZONTAL_BANDING.key].value = None if is_use else '0'
+        self._set_property_value(pr_const.TableProperty.NO_HORIZONTAL_BANDING.key, None if is_use else '0')
 
     def is_use_style_of_vertical_banding(self) -> bool:
-        if self._properties[pr_const.TableProperty.NO_VERTICAL_BANDING.key].value is None:
+        if self._get_property_value(pr_const.TableProperty.NO_VERTICAL_BANDING.key) is None:
             return True
-        return self._properties[pr_const.TableProperty.NO_VERTICAL_BANDING.key].value == '0'
+        return self._get_property_value(pr_const.TableProperty.NO_VERTICAL_BANDING.key) == '0'
 
     def set_as_use_style_of_vertical_banding(self, is_use: bool):
-        self._properties[pr_const.TableProperty.NO_VERTICAL_BANDING.key].value = None if is_use else '0'
+        self._set_property_value(pr_const.TableProperty.NO_VERTICAL_BANDING.key, None if is_use else '0')
 
 
 class Body(XMLement):
     element_description = pr_const.Element.BODY
+    __slots__ = ()
 
     from docx_microreader.translators.html.html_translators import BodyTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import TranslatorToXML
@@ -774,6 +841,8 @@ class Body(XMLement):
 
 class Document(XMLement, DocumentParser):
     element_description = pr_const.Element.DOCUMENT
+    # styles and numbering are parsed with document as parent before XMLement.__init__, so they aren't lazy
+    _is_lazy: bool = False
 
     from docx_microreader.translators.html.html_translators import DocumentTranslatorToHTML
     from docx_microreader.translators.xml.xml_translators import DocumentTranslatorToXML
@@ -786,19 +855,104 @@ class Document(XMLement, DocumentParser):
     def _possible_inner_elements_descriptions(cls) -> list:
         return [Body]
 
-    def __init__(self, source: Union[str, ET.Element], path_for_images: Optional[str] = None):
-        DocumentParser.__init__(self, source if isinstance(source, str) else None, path_for_images)
-        if isinstance(source, str):
-            doc = self._get_xml_file(self._content[DocumentParser.document_key])
+    def __init__(self, source: Union[str, os.PathLike, bytes, BinaryIO, ET.Element],
+                 path_for_images: Optional[str] = None, is_lazy: bool = False):
+        """
+        :param source: path to docx file (str or os.PathLike), content of docx file (bytes), memory-mapped docx file
+                       (mmap), seekable binary file-like object or xml element of document
+        :param path_for_images: directory for extracted images. If None, directory of docx file is used.
+                                Images are stored in memory if None and source isn't path
+        :param is_lazy: elements of document parse their inner elements on first access to them if True
+        """
+        from .xml_backend import is_element
+
+        DocumentParser.__init__(self, source if not is_element(source) else None, path_for_images)
+        if not is_element(source):
+            # tree of document isn't kept by archive after model is built. Lazy elements keep their source subtrees
+            doc = self._get_xml_file(self._content[DocumentParser.document_key], is_cached=False)
             if doc is not None:
-                XMLement.__init__(self, doc, None)
+                XMLement.__init__(self, doc, None, is_lazy)
         else:
-            XMLement.__init__(self, source, None)
+            XMLement.__init__(self, source, None, is_lazy)
 
     @classmethod
     def _parse_properties(cls, element: ET.Element):
         return {}
 
+    @classmethod
+    def iter_body(cls, source: Union[str, os.PathLike, bytes, BinaryIO], path_for_images: Optional[str] = None,
+                  context: Optional[dict] = None):
+        """
+        parse body of document incrementally. Styles and numbering of document are parsed before body
+        :param context: context for translations of yielded elements. Beginnings and ends of numbered lists are marked
+                        in it, so elements translated with this context are translated as in translation of whole
+                        document. Marks of element are removed from context when the next element is requested
+        :return: generator of top-level elements of body (Paragraph or Table).
+                 Source xml of element is freed after the element is yielded. Consecutive numbered paragraphs (list)
+                 are yielded when the list is ended, so paragraphs of one list are kept in memory together.
+                 Archive of document is closed when generator is finished, so images that aren't extracted yet
+                 (see get_image) are available only while iterating
+        """
+        from .constants.namespaces import check_namespace_of_tag
+        from .xml_backend import iterparse
+
+        if context is None:
+            context = {}
+        document = cls.__new__(cls)
+        DocumentParser.__init__(document, source, path_for_images)
+        XMLement.__init__(document, ET.Element(check_namespace_of_tag(cls.element_description.tag)), None)
+        body_tag: str = check_namespace_of_tag(Body.element_description.tag)
+        # body contains elements that aren't yielded yet: current list and element after it
+        body = Body(ET.Element(body_tag), None)
+        document.append_inner_element(body)
+        body_elements_classes: Dict[str, Callable] = {
+            check_namespace_of_tag(el_class.element_description.tag): el_class
+            for el_class in Body._possible_inner_elements_descriptions()
+        }
+
+        depth: int = 0
+        body_element: Optional[ET.Element] = None
+        stream = None
+        try:
+            stream = document._archive.open(document._content[DocumentParser.document_key])
+            for event, element in iterparse(stream):
+                if event == 'start':
+                    depth += 1
+                    if depth == 2 and element.tag == body_tag:
+                        body_element = element
+                    continue
+                depth -= 1
+                if depth == 1:
+                    body_element = None
+                elif depth == 2 and body_element is not None:
+                    element_class = body_elements_classes.get(element.tag)
+                    if element_class is not None:
+                        inner_element = element_class(element, body)
+                        body._inner_elements.append(inner_element)
+                        if not isinstance(inner_element, Paragraph) or inner_element.get_numbering_level() is None:
+                            yield from Document.__pop_inner_elements_of_body(body, context)
+                    element.clear()
+                    body_element.remove(element)
+            yield from Document.__pop_inner_elements_of_body(body, context)
+        finally:
+            if stream is not None:
+                stream.close()
+            document.close()
+
+    @staticmethod
+    def __pop_inner_elements_of_body(body: Body, context: dict):
+        """
+        inner elements of body are marked in context as translators of body mark them (beginnings and ends of
+        numbered lists) and yielded. Marks of element are removed after it is yielded. Elements are removed from body
+        after all of them are yielded
+        """
+        for translator in body.translators.values():
+            translator.preparation_to_translate_inner_elements(body, context)
+        for element in body.iterate_by_inner_elements():
+            yield element
+            context.pop(element, None)
+        body._inner_elements.clear()
+
     def save_as_docx(self, name: str):
         from docx_microreader.translators.xml.xml_translators import DocumentTranslatorToXML
         import os
@@ -1,19 +1,20 @@
 from .constants import property_enums as pr_const
 from .xml_element import XMLement
-from typing import Union, Optional
+import xml.etree.ElementTree as ET
+from typing import Union, Optional, Dict
 
 
 class NumberingLevel(XMLement):
     element_description = pr_const.Element.NUMBERING_LEVEL
 
     def get_index(self) -> int:
-        return int(self._properties[pr_const.NumberingLevelProperty.INDEX.key].value)
+        return int(self._get_property_value(pr_const.NumberingLevelProperty.INDEX.key))
 
     def get_numbering_format(self) -> str:
-        return self._properties[pr_const.NumberingLevelProperty.FORMAT.key].value
+        return self._get_property_value(pr_const.NumberingLevelProperty.FORMAT.key)
 
     def get_start(self) -> str:
-        return self._properties[pr_const.NumberingLevelProperty.START.key].value
+        return self._get_property_value(pr_const.NumberingLevelProperty.START.key)
 
 
 class AbstractNumbering(XMLement):
@@ -24,19 +25,33 @@ class AbstractNumbering(XMLement):
         return [NumberingLevel]
 
     def get_id(self) -> str:
-        return self._properties[pr_const.AbstractNumberingProperty.ID.key].value
+        return self._get_property_value(pr_const.AbstractNumberingProperty.ID.key)
+
+    def __init__(self, element: ET.Element, parent):
+        # {index of level: level}. It is built on first getting of level and is rebuilt when caches of resolved
+        # properties are invalidated (changing of levels or their indexes). The first level is used if indexes repeat
+        self.__levels: Optional[Dict[int, NumberingLevel]] = None
+        self.__levels_version: int = -1
+        super(AbstractNumbering, self).__init__(element, parent)
+
+    def _after_parse_inner_elements(self):
+        self.__levels = None
 
     def get_level(self, index: Union[str, int]) -> Optional[NumberingLevel]:
-        for level in self._inner_elements:
-            if level.get_index() == int(index):
-                return level
+        if self.__levels is None or self.__levels_version != self._get_resolved_properties_cache_version():
+            levels: Dict[int, NumberingLevel] = {}
+            for level in self._inner_elements:
+                levels.setdefault(level.get_index(), level)
+            self.__levels = levels
+            self.__levels_version = self._get_resolved_properties_cache_version()
+        return self.__levels.get(int(index))
 
 
 class Numbering(XMLement):
     element_description = pr_const.Element.NUMBERING
 
     def get_id(self) -> str:
-        return self._properties[pr_const.NumberingProperty.ID.key].value
+        return self._get_property_value(pr_const.NumberingProperty.ID.key)
 
     def get_abstract_numbering_id(self) -> str:
-        return self._properties[pr_const.NumberingProperty.ABSTRACT_NUMBERING.key].value
+        return self._get_property_value(pr_const.NumberingProperty.ABSTRACT_NUMBERING.key)
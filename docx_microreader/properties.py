@@ -1,4 +1,4 @@
-from typing import Union, List
+from typing import Union, List, Tuple, Optional, NamedTuple, Dict, FrozenSet
 
 
 class PropertyDescription:
@@ -33,6 +33,28 @@ class PropertyDescription:
             return [PropertyDescription.__wrapping_tag(tag_wrap, tag) for tag_wrap in tag_wrap]
         return PropertyDescription.__wrapping_tag(tag_wrap, tag)
 
+    def compile(self, key: str):
+        """
+        :param key: key of property
+        :return: PropertyExtraction with tags and attributes in Clark notation
+        """
+        from .constants.namespaces import check_namespace_of_tag
+
+        paths: Optional[Tuple[Tuple[str, ...], ...]] = None
+        if self.tag is not None:
+            wrapped_tags: Union[List[str], str] = self.get_wrapped_tags()
+            paths = tuple(
+                tuple(check_namespace_of_tag(tag) for tag in path.split('/'))
+                for path in (wrapped_tags if isinstance(wrapped_tags, list) else [wrapped_tags])
+            )
+        attributes: List[str] = self.tag_property if isinstance(self.tag_property, list) else [self.tag_property]
+        return PropertyExtraction(
+            key,
+            paths,
+            tuple(check_namespace_of_tag(attribute) for attribute in attributes),
+            self.is_can_be_miss and self.tag is not None,
+        )
+
     @staticmethod
     def __wrapping_tag(wrap, tag) -> str:
         if wrap != '':
@@ -48,6 +70,7 @@ class PropertyDescription:
 
 
 class Property:
+    __slots__ = ('value',)
 
     def __init__(self, value):
         self.value: Union[str, bool, Property.Missed, None] = value
@@ -55,6 +78,105 @@ class Property:
     class Missed:
         """
         if Property.value equal Missed, tag don't have attribute for this Property but it is correct value of Property.
-        This is mean using default value for corresponding attribute
+        This is mean using default value for corresponding attribute. Missed has the single instance
+        """
+        __slots__ = ()
+        __instance = None
+
+        def __new__(cls):
+            if cls.__instance is None:
+                cls.__instance = super(Property.Missed, cls).__new__(cls)
+            return cls.__instance
+
+        def __repr__(self) -> str:
+            return 'Property.Missed'
+
+
+class PropertyExtraction(NamedTuple):
+    """
+    compiled PropertyDescription. Tags of paths and attributes are in Clark notation ({namespace}tag)
+    """
+    key: str
+    # paths (as tuples of tags) to element of property (first found is used).
+    # None if property is attribute of parsed element
+    paths: Optional[Tuple[Tuple[str, ...], ...]]
+    # attributes of element of property (first not None is used)
+    attributes: Tuple[str, ...]
+    # value of property can be equal Property.Missed
+    is_can_be_miss: bool
+
+    def extract_from_property_element(self, property_element) -> Union[str, bool, Property.Missed, None]:
         """
-        pass
+        :param property_element: element found by one of paths
+        :return: value of property
+        """
+        if self.is_can_be_miss:
+            value: Optional[str] = property_element.get(self.attributes[0])
+            if value is None:
+                return Property.Missed()
+            if value == '1':
+                return True
+            elif value == '0':
+                return False
+            return value
+        for attribute in self.attributes:
+            value: Optional[str] = property_element.get(attribute)
+            if value is not None:
+                return value
+        return None
+
+
+class PropertiesExtractionPlan:
+    """
+    compiled descriptions of all properties of element. Children of element are walked once and each child tag is
+    routed to the properties that are interested in it, so absent properties don't cost searches in element
+    """
+
+    def __init__(self, extractions: Tuple[PropertyExtraction, ...]):
+        self.extractions: Tuple[PropertyExtraction, ...] = extractions
+        self.__attribute_extractions: Tuple[PropertyExtraction, ...] = tuple(
+            extraction for extraction in extractions if extraction.paths is None
+        )
+        self.keys: FrozenSet[str] = frozenset(extraction.key for extraction in extractions)
+        # {tag: (dispatch of children of tag, ((index of extraction, index of path), ...))}
+        self.__dispatch: dict = {}
+        for extraction_index, extraction in enumerate(extractions):
+            for path_index, path in enumerate(extraction.paths if extraction.paths is not None else ()):
+                dispatch: dict = self.__dispatch
+                for tag in path[:-1]:
+                    dispatch = dispatch.setdefault(tag, ({}, []))[0]
+                dispatch.setdefault(path[-1], ({}, []))[1].append((extraction_index, path_index))
+
+    def extract(self, element) -> Dict[str, Union[str, bool, Property.Missed]]:
+        """
+        :param element: parsed ElementTree.Element
+        :return: {key of property: value of property}. Absent properties (with value None) aren't included
+        """
+        result: Dict[str, Union[str, bool, Property.Missed]] = {}
+        for extraction in self.__attribute_extractions:
+            value: Optional[str] = element.get(extraction.attributes[0])
+            if value is not None:
+                result[extraction.key] = value
+        if self.__dispatch:
+            found: Dict[int, tuple] = {}  # {index of extraction: (index of path, element of property)}
+            PropertiesExtractionPlan.__walk(element, self.__dispatch, found)
+            for extraction_index, (path_index, property_element) in found.items():
+                extraction: PropertyExtraction = self.extractions[extraction_index]
+                value = extraction.extract_from_property_element(property_element)
+                if value is not None:
+                    result[extraction.key] = value
+        return result
+
+    @staticmethod
+    def __walk(element, dispatch: dict, found: Dict[int, tuple]):
+        for child in element:
+            node: Optional[tuple] = dispatch.get(child.tag)
+            if node is not None:
+                children_dispatch, targets = node
+                for extraction_index, path_index in targets:
+                    current: Optional[tuple] = found.get(extraction_index)
+                    # the first path of extraction has priority, the first element in document order for same path
+                    if current is None or path_index < current[0]:
+                        found[extraction_index] = (path_index, child)
+                if children_dispatch:
+                    PropertiesExtractionPlan.__walk(child, children_dispatch, found)
@@ -2,7 +2,8 @@ from .xml_element import XMLement
 import xml.etree.ElementTree as ET
 from .mixins.getters_setters import ParagraphPropertiesGetSetMixin, RunPropertiesGetSetMixin, TablePropertiesGetSetMixin
 from .constants import property_enums as pr_const
-from typing import Union, Dict, Optional
+from .properties import Property
+from typing import Union, Dict, Optional, Tuple
 
 
 class Style(XMLement):
@@ -13,10 +14,66 @@ class Style(XMLement):
         self.id: str = style_id
         self.is_default = is_default
         self.is_custom_style = is_custom_style
+        # values of properties with folded chain of base styles:
+        # ({key: value for is_find_missed_or_true == False}, {key: value for is_find_missed_or_true == True})
+        # None if style isn't flattened, then chain of base styles is walked
+        self._effective_properties: Optional[Tuple[Dict[str, Union[str, bool, Property.Missed]],
+                                                   Dict[str, Union[str, bool]]]] = None
         super(Style, self).__init__(element, parent)
 
     def _get_style_id(self) -> Optional[str]:
-        return self._properties[pr_const.StyleProperty.BASE_STYLE.key].value
+        return self._get_property_value(pr_const.StyleProperty.BASE_STYLE.key)
+
+    def _flatten(self):
+        """
+        fold properties of chain of base styles into effective properties of style. Base styles are flattened first
+        """
+        base_found, base_resolved = {}, {}
+        if self._base_style is not None:
+            if self._base_style._effective_properties is None:
+                self._base_style._flatten()
+            base_found, base_resolved = self._base_style._effective_properties
+        found: Dict[str, Union[str, bool, Property.Missed]] = dict(base_found)
+        resolved: Dict[str, Union[str, bool]] = dict(base_resolved)
+        for key, prop in self._properties.items():
+            found[key] = prop.value
+            if not isinstance(prop.value, Property.Missed):
+                resolved[key] = prop.value
+            elif key not in base_resolved:
+                resolved[key] = True
+        self._effective_properties = (found, resolved)
+
+    def _reset_flattening(self):
+        self._effective_properties = None
+
+    def _resolve_property(self, key: str, is_find_missed_or_true: bool):
+        if self._effective_properties is not None:
+            return self._effective_properties[is_find_missed_or_true].get(key)
+        return super(Style, self)._resolve_property(key, is_find_missed_or_true)
+
+    def _resolve_properties(self, keys: Tuple[str, ...]) -> Dict[str, Union[str, bool, None]]:
+        if self._effective_properties is not None:
+            resolved: Dict[str, Union[str, bool]] = self._effective_properties[True]
+            return {key: resolved.get(key) for key in keys}
+        return self._resolve_properties_of_element_and_base_style(keys)
+
+    def _set_property_value(self, key: str, value):
+        super(Style, self)._set_property_value(key, value)
+        self.__reflatten_styles_of_document()
+
+    def set_style(self, style_id: str):
+        super(Style, self).set_style(style_id)
+        self.__reflatten_styles_of_document()
+
+    def __reflatten_styles_of_document(self):
+        # styles that are based on this style are flattened again too. Styles are flattened after parsing of all
+        # styles, so change of property while style is parsed don't need flattening
+        if self._effective_properties is not None:
+            document = self._get_document()
+            if document is not None:
+                document._flatten_styles()
+            else:
+                self._reset_flattening()
 
     @classmethod
     def _set_default_style_of_class(cls):
@@ -61,14 +118,33 @@ class TableStyle(Style, TablePropertiesGetSetMixin):
 
     def __init__(self, element: ET.Element, parent,
                  style_id: str, is_default: bool = False, is_custom_style: bool = False):
+        # {TableArea or its value: area style of this style or of nearest base style}. None if style isn't flattened
+        self.__effective_table_area_styles: Optional[Dict[Union[str, pr_const.TableArea], TableAreaStyle]] = None
         super(TableStyle, self).__init__(element, parent, style_id, is_default, is_custom_style)
         self.__table_area_styles: Dict[str, TableAreaStyle] = {
             st.area: st for st in self._inner_elements if isinstance(st, TableAreaStyle)
         }
 
+    def _flatten(self):
+        super(TableStyle, self)._flatten()
+        self.__effective_table_area_styles = None
+        table_area_styles: Dict[Union[str, pr_const.TableArea], TableAreaStyle] = {}
+        for area in pr_const.TableArea:
+            area_style: Optional[TableAreaStyle] = self.get_table_area_style(area)
+            if area_style is not None:
+                table_area_styles[area] = area_style
+                table_area_styles[area.value] = area_style
+        self.__effective_table_area_styles = table_area_styles
+
+    def _reset_flattening(self):
+        super(TableStyle, self)._reset_flattening()
+        self.__effective_table_area_styles = None
+
     def get_table_area_style(self, table_area: Union[str, pr_const.TableArea]):
         from .utils.functions import execute_if_not_none
 
+        if self.__effective_table_area_styles is not None:
+            return self.__effective_table_area_styles.get(table_area)
         area = pr_const.convert_to_enum_element(table_area, pr_const.TableArea)
         result = self.__table_area_styles.get(area)
         if result is not None:
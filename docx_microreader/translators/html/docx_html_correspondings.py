@@ -125,6 +125,7 @@ character: Dict[str, str] = {
     '☎': '&#9742;',
     '×': '&times;',
     '÷': '&divide;',
+    '&': '&amp;',
     '<': '&lt;',
     '>': '&gt;',
     '±': '&plusmn;',
@@ -1,110 +1,234 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Callable
 from .mixins import BorderedElementToHTMLMixin, ParagraphContainerMixin
 
 
-class TranslatorToHTML(ParagraphContainerMixin):
-    def __init__(self):
+class TranslationStateOfHTML:
+    """
+    state of translation of one element to html. It is created for each translated element, so translators don't
+    store state of translation and one translator can translate many elements at once (in different threads)
+    """
+    __slots__ = ('styles', 'inner_html_wrapper_styles', 'attributes', 'ext_tags', 'ext_tags_attributes',
+                 'ext_tags_styles', 'inner_text', 'css_classes')
+
+    def __init__(self, css_classes: Optional[Dict[str, str]], inner_text: str = ''):
+        """
+        :param css_classes: {css declarations: name of css class} of translation. None if styles are translated
+                            to style attributes
+        """
         self.styles: Dict[str, str] = {}
         self.inner_html_wrapper_styles: Dict[str, str] = {}
         self.attributes: Dict[str, str] = {}
         self.ext_tags: List[Tuple[str, bool, bool]] = []
         self.ext_tags_attributes: Dict[str, Dict[str, str]] = {}
         self.ext_tags_styles: Dict[str, Dict[str, str]] = {}
-        self.inner_text: str = ''
+        self.inner_text: str = inner_text
+        self.css_classes: Optional[Dict[str, str]] = css_classes
+
+
+class ParagraphTranslationStateOfHTML(TranslationStateOfHTML):
+    __slots__ = ('tag', 'is_first_paragraph_in_numbering')
+
+    def __init__(self, css_classes: Optional[Dict[str, str]], inner_text: str = ''):
+        super(ParagraphTranslationStateOfHTML, self).__init__(css_classes, inner_text)
+        self.tag: str = 'p'
+        self.is_first_paragraph_in_numbering: bool = False
+
+
+class CellTranslationStateOfHTML(TranslationStateOfHTML):
+    __slots__ = ('is_header',)
+
+    def __init__(self, css_classes: Optional[Dict[str, str]], inner_text: str = ''):
+        super(CellTranslationStateOfHTML, self).__init__(css_classes, inner_text)
+        self.is_header: bool = False
+
+
+class TranslatorToHTML(ParagraphContainerMixin):
+    """
+    styles of elements are translated to style attributes. If context of translation has ContextMark.IS_CSS_CLASSES_USED
+    with True value, identical styles are translated to one css class instead. Css classes of translation are placed in
+    style element in head of document. When translation is iterated, style element with css classes that aren't
+    written yet is placed before html that uses them, so style elements can be placed in body of document
+    """
+    def _create_state(self, context: dict, inner_text: str = '') -> TranslationStateOfHTML:
+        """
+        :return: state of translation of one element
+        """
+        return TranslationStateOfHTML(self._get_css_classes(context), inner_text)
+
+    @staticmethod
+    def _get_css_classes(context: dict) -> Optional[Dict[str, str]]:
+        """
+        :return: {css declarations: name of css class} of translation. None if css classes aren't used
+        """
+        from .marks import ContextMark
+
+        if not context.get(ContextMark.IS_CSS_CLASSES_USED, False):
+            return None
+        return context.setdefault(ContextMark.CSS_CLASSES, {})
+
+    @staticmethod
+    def get_style_element(context: dict, first_css_class_index: int = 0) -> str:
+        """
+        :param context: context of translation in which css classes are used
+        :param first_css_class_index: css classes created before css class with this index aren't included
+        :return: html style element with css classes of translation. Empty string if translation hasn't classes
+        """
+        from itertools import islice
+        from .marks import ContextMark
+
+        css_classes: Optional[Dict[str, str]] = context.get(ContextMark.CSS_CLASSES)
+        if not css_classes or first_css_class_index >= len(css_classes):
+            return ''
+        rules: str = ''.join([rf'.{css_class} {{{declarations} }}'
+                              for declarations, css_class in islice(css_classes.items(), first_css_class_index, None)])
+        return rf'<style>{rules}</style>'
+
+    @staticmethod
+    def _write_new_css_classes(html: str, context: dict) -> str:
+        """
+        it is used when translation is iterated
+        :return: html with style element of css classes that aren't written yet before it
+        """
+        from .marks import ContextMark
 
-    def _reset_value(self):
-        self.styles = {}
-        self.inner_html_wrapper_styles = {}
-        self.attributes = {}
-        self.ext_tags = []
-        self.ext_tags_attributes = {}
-        self.ext_tags_styles = {}
-        self.inner_text = ''
+        css_classes: Optional[Dict[str, str]] = context.get(ContextMark.CSS_CLASSES)
+        if css_classes is None:
+            return html
+        count_of_written_css_classes: int = context.get(ContextMark.COUNT_OF_WRITTEN_CSS_CLASSES, 0)
+        context[ContextMark.COUNT_OF_WRITTEN_CSS_CLASSES] = len(css_classes)
+        return rf'{TranslatorToHTML.get_style_element(context, count_of_written_css_classes)}{html}'
+
+    @staticmethod
+    def _write_new_css_classes_if_iterated(html: str, context: dict) -> str:
+        """
+        element without inner elements is translated by translate method when translation is iterated too
+        :return: html with style element of css classes that aren't written yet before it if translation is iterated
+        """
+        from .marks import ContextMark
+
+        if ContextMark.COUNT_OF_WRITTEN_CSS_CLASSES in context:
+            return TranslatorToHTML._write_new_css_classes(html, context)
+        return html
 
     def translate(self, element, inner_elements: list, context: dict) -> str:
-        self.inner_text = ''.join([str(s) for s in inner_elements])
-        self._convert_fields(element)
-        self._do_methods(element, context)
-        result: str = self._get_html()
-        self._reset_value()
-        return result
+        state: TranslationStateOfHTML = self._create_state(context, ''.join([str(s) for s in inner_elements]))
+        self._convert_fields(element, state)
+        self._do_methods(element, context, state)
+        return self._write_new_css_classes_if_iterated(self._get_html(state), context)
 
-    def _convert_fields(self, element):
+    def translate_around_inner_elements(self, element, context: dict) -> Tuple[str, Optional[str]]:
+        """
+        translate element without its inner elements. It is used for streaming output, where inner elements are
+        translated and written between returned parts
+        :return: (html before inner elements, html after inner elements). Html after inner elements is None if
+                 inner elements aren't translated (single tag)
+        """
+        state: TranslationStateOfHTML = self._create_state(context)
+        self._convert_fields(element, state)
+        self._do_methods(element, context, state)
+        html_before_inner_text, html_after_inner_text = self._get_html_around_inner_text(state)
+        if html_after_inner_text is not None:
+            # inner text that is set by methods of translator is placed before inner elements
+            html_before_inner_text = rf'{html_before_inner_text}{state.inner_text}'
+        return self._write_new_css_classes(html_before_inner_text, context), html_after_inner_text
+
+    def _convert_fields(self, element, state: TranslationStateOfHTML):
         pass
 
-    def _do_methods(self, element, context: dict):
+    def _do_methods(self, element, context: dict, state: TranslationStateOfHTML):
         pass
 
-    def _get_html(self) -> str:
-        open_ext_tags, close_ext_tags = self._get_ext_tags()
-        styles: str = self._get_styles()
-        attrs: str = self._get_attributes()
-        tag: str = self._get_html_tag()
+    def _get_html(self, state: TranslationStateOfHTML) -> str:
+        html_before_inner_text, html_after_inner_text = self._get_html_around_inner_text(state)
+        if html_after_inner_text is None:
+            return html_before_inner_text
+        return rf'{html_before_inner_text}{state.inner_text}{html_after_inner_text}'
 
-        inner_text_styles: str = self._get_inner_html_wrapper_styles()
+    def _get_html_around_inner_text(self, state: TranslationStateOfHTML) -> Tuple[str, Optional[str]]:
+        """
+        :return: (html before inner text, html after inner text). Html after inner text is None if html
+                 doesn't contain inner text (single tag)
+        """
+        open_ext_tags, close_ext_tags = self._get_ext_tags(state)
+        styles: str = self._get_styles(state)
+        attrs: str = self._get_attributes(state)
+        tag: str = self._get_html_tag(state)
+
+        open_wrapper: str = ''
+        close_wrapper: str = ''
+        inner_text_styles: str = self._get_inner_html_wrapper_styles(state)
         if inner_text_styles != '':
-            self.inner_text: str = rf'<div{inner_text_styles}>{self.inner_text}</div>'
+            open_wrapper, close_wrapper = rf'<div{inner_text_styles}>', '</div>'
         if tag == '':
-            return rf'{open_ext_tags}{self.inner_text}{close_ext_tags}'
+            return rf'{open_ext_tags}{open_wrapper}', rf'{close_wrapper}{close_ext_tags}'
         if not self._is_single_tag():
-            return rf'{open_ext_tags}<{tag}{attrs}{styles}>{self.inner_text}</{tag}>{close_ext_tags}'
-        return rf'{open_ext_tags}<{tag}{attrs}{styles}>{close_ext_tags}'
+            return rf'{open_ext_tags}<{tag}{attrs}{styles}>{open_wrapper}', rf'{close_wrapper}</{tag}>{close_ext_tags}'
+        return rf'{open_ext_tags}<{tag}{attrs}{styles}>{close_ext_tags}', None
 
-    def _get_html_tag(self) -> str:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         pass
 
     @staticmethod
     def _is_single_tag() -> bool:
         return False
 
-    def _get_styles(self, key: Optional[str] = None) -> str:
+    def _get_styles(self, state: TranslationStateOfHTML, key: Optional[str] = None) -> str:
         """
         :param key: external tag. Return styles for tag if None
         """
-        styles = self.styles if key is None else self.ext_tags_styles[key]
-        result: str = ''
-        for k in styles:
-            result += rf' {k}: {styles[k]};'
-        if result != '':
-            result = rf' style="{result}"'
-        return result
+        styles = state.styles if key is None else state.ext_tags_styles[key]
+        return self._to_style_attribute(styles, state)
 
-    def _get_attributes(self, key: Optional[str] = None) -> str:
+    def _get_attributes(self, state: TranslationStateOfHTML, key: Optional[str] = None) -> str:
         """
         :param key: external tag. Return styles for tag if None
         """
-        attributes = self.attributes if key is None else self.ext_tags_attributes[key]
+        attributes = state.attributes if key is None else state.ext_tags_attributes[key]
         result: str = ''
         for k in attributes:
             result += rf' {k}="{attributes[k]}"'
         return result
 
-    def _add_to_ext_tags(self, tag: str, is_open: bool = True, is_close: bool = True):
+    def _add_to_ext_tags(self, state: TranslationStateOfHTML, tag: str, is_open: bool = True, is_close: bool = True):
         if is_open or is_close:
-            self.ext_tags.append((tag, is_open, is_close))
-            self.ext_tags_attributes[tag] = {}
-            self.ext_tags_styles[tag] = {}
+            state.ext_tags.append((tag, is_open, is_close))
+            state.ext_tags_attributes[tag] = {}
+            state.ext_tags_styles[tag] = {}
 
-    def _ext_tags_list(self) -> List[str]:
-        return [tag for tag, b1, b2 in self.ext_tags]
+    def _ext_tags_list(self, state: TranslationStateOfHTML) -> List[str]:
+        return [tag for tag, b1, b2 in state.ext_tags]
 
-    def _get_ext_tags(self) -> Tuple[str, str]:
+    def _get_ext_tags(self, state: TranslationStateOfHTML) -> Tuple[str, str]:
         open_tags: str = ''
         close_tags: str = ''
-        for tag in self.ext_tags:
+        for tag in state.ext_tags:
             if tag[1]:
-                open_tags += rf'<{tag[0]}{self._get_attributes(tag[0])}{self._get_styles(tag[0])}>'
+                open_tags += rf'<{tag[0]}{self._get_attributes(state, tag[0])}{self._get_styles(state, tag[0])}>'
             if tag[2]:
                 close_tags = rf'</{tag[0]}>' + close_tags
         return open_tags, close_tags
 
-    def _get_inner_html_wrapper_styles(self) -> str:
-        result: str = ''
-        for k in self.inner_html_wrapper_styles:
-            result += rf' {k}: {self.inner_html_wrapper_styles[k]};'
-        if result != '':
-            result = rf' style="{result}"'
-        return result
+    def _get_inner_html_wrapper_styles(self, state: TranslationStateOfHTML) -> str:
+        return self._to_style_attribute(state.inner_html_wrapper_styles, state)
+
+    @staticmethod
+    def _to_style_attribute(styles: Dict[str, str], state: TranslationStateOfHTML) -> str:
+        """
+        :return: style attribute with styles or class attribute with css class of styles if css classes are used.
+                 Empty string if styles are empty
+        """
+        declarations: str = ''
+        for k in styles:
+            declarations += rf' {k}: {styles[k]};'
+        if declarations == '':
+            return ''
+        if state.css_classes is None:
+            return rf' style="{declarations}"'
+        css_class: Optional[str] = state.css_classes.get(declarations)
+        if css_class is None:
+            css_class = rf's{len(state.css_classes)}'
+            state.css_classes[declarations] = css_class
+        return rf' class="{css_class}"'
 
     @staticmethod
     def translate_color(color: str) -> str:
@@ -115,16 +239,16 @@ class TranslatorToHTML(ParagraphContainerMixin):
                 return '#' + color
         return color
 
-    def _add_to_many_properties_style(self, t: Optional[Tuple[str, str]]):
+    def _add_to_many_properties_style(self, t: Optional[Tuple[str, str]], state: TranslationStateOfHTML):
         if t is not None:
-            if t[0] not in self.styles:
-                self.styles[t[0]] = t[1]
+            if t[0] not in state.styles:
+                state.styles[t[0]] = t[1]
             else:
-                self.styles[t[0]] += rf' {t[1]}'
+                state.styles[t[0]] += rf' {t[1]}'
 
     def preparation_to_translate_inner_elements(self, element, translation_context: dict):
         from ...models import Paragraph
-        
+
         if element.__class__.is_possible_inner_element(Paragraph):
             self._mark_numbering_paragraphs(element, translation_context)
 
@@ -133,7 +257,7 @@ class ContainerTranslatorToHTML(TranslatorToHTML):
     """
     displayed only containing elements
     """
-    def _get_html_tag(self) -> str:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         return ''
 
     @staticmethod
@@ -142,238 +266,261 @@ class ContainerTranslatorToHTML(TranslatorToHTML):
 
 
 class DocumentTranslatorToHTML(TranslatorToHTML):
-    def _get_html_tag(self) -> str:
+    def translate(self, document, inner_elements: list, context: dict) -> str:
+        # inner elements are translated already, so all css classes of translation are known
+        style_element: str = self.get_style_element(context)
+        if style_element != '':
+            inner_elements = [rf'<head>{style_element}</head>', *inner_elements]
+        return super(DocumentTranslatorToHTML, self).translate(document, inner_elements, context)
+
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         return 'html'
 
 
 class BodyTranslatorToHTML(TranslatorToHTML):
-    def _get_html_tag(self) -> str:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         return 'body'
 
 
 class ImageTranslatorToHTML(TranslatorToHTML):
 
-    def _do_methods(self, image, context: dict):
-        self._to_attribute_src(image)
-        self._to_attribute_width(image)
-        self._to_attribute_height(image)
+    def _do_methods(self, image, context: dict, state: TranslationStateOfHTML):
+        self._to_attribute_src(image, state)
+        self._to_attribute_width(image, state)
+        self._to_attribute_height(image, state)
 
-    def _get_html_tag(self) -> str:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         return 'img'
 
     @staticmethod
     def _is_single_tag() -> bool:
         return True
 
-    def _to_attribute_src(self, image):
-        self.attributes['src'] = image.get_path()
+    def _to_attribute_src(self, image, state: TranslationStateOfHTML):
+        state.attributes['src'] = image.get_path()
 
     @staticmethod
     def _emu_to_px(value: int) -> int:
         return value // 12700
 
-    def _to_attribute_width(self, image):
+    def _to_attribute_width(self, image, state: TranslationStateOfHTML):
         w = image.get_size()[0]
         if w is not None:
-            self.attributes['width'] = str(ImageTranslatorToHTML._emu_to_px(w))
+            state.attributes['width'] = str(ImageTranslatorToHTML._emu_to_px(w))
 
-    def _to_attribute_height(self, image):
+    def _to_attribute_height(self, image, state: TranslationStateOfHTML):
         h = image.get_size()[1]
         if h is not None:
-            self.attributes['height'] = str(ImageTranslatorToHTML._emu_to_px(h))
+            state.attributes['height'] = str(ImageTranslatorToHTML._emu_to_px(h))
 
 
 class ParagraphTranslatorToHTML(TranslatorToHTML, BorderedElementToHTMLMixin):
     from .docx_html_correspondings import align
     aligns: Dict[str, str] = align
 
-    def __init__(self):
-        super(ParagraphTranslatorToHTML, self).__init__()
-        self.tag: str = 'p'
-        self.is_first_paragraph_in_numbering: bool = False
+    def _create_state(self, context: dict, inner_text: str = '') -> ParagraphTranslationStateOfHTML:
+        return ParagraphTranslationStateOfHTML(self._get_css_classes(context), inner_text)
 
-    def _reset_value(self):
-        super(ParagraphTranslatorToHTML, self)._reset_value()
-        self.tag: str = 'p'
-        self.is_first_paragraph_in_numbering = False
-
-    def _do_methods(self, paragraph, context: dict):
-        self._to_numbering(paragraph, context)
+    def _do_methods(self, paragraph, context: dict, state: ParagraphTranslationStateOfHTML):
+        self._to_numbering(paragraph, context, state)
         level = paragraph.get_numbering_level()
-        if self.is_first_paragraph_in_numbering:    # level is not None
-            if 'ol' in self._ext_tags_list():
-                self._to_ext_css_numbering_format(level)
-                self._to_ext_attribute_start(level)
+        if state.is_first_paragraph_in_numbering:    # level is not None
+            if 'ol' in self._ext_tags_list(state):
+                self._to_ext_css_numbering_format(level, state)
+                self._to_ext_attribute_start(level, state)
         if level is None:
-            self._to_attribute_align(paragraph)
-            self._to_css_margin_left(paragraph)
-            self._to_css_margin_right(paragraph)
-            self._to_css_text_indent(paragraph)
-            self._to_css_all_borders(paragraph)
+            self._to_attribute_align(paragraph, state)
+            self._to_css_margin_left(paragraph, state)
+            self._to_css_margin_right(paragraph, state)
+            self._to_css_text_indent(paragraph, state)
+            self._to_css_all_borders(paragraph, state)
 
-    def _get_html_tag(self) -> str:
-        return self.tag
+    def _get_html_tag(self, state: ParagraphTranslationStateOfHTML) -> str:
+        return state.tag
 
-    def _to_attribute_align(self, paragraph):
-        align = paragraph.get_align()
+    def _to_attribute_align(self, paragraph, state: TranslationStateOfHTML):
+        align = paragraph.get_effective_format().align
         if align is not None:
             if align in self.aligns and align != 'left':    # left is default in browsers
-                self.attributes['align'] = self.aligns[align]
+                state.attributes['align'] = self.aligns[align]
 
-    def _to_css_margin_left(self, paragraph):
-        margin_left = paragraph.get_indent_left()
+    def _to_css_margin_left(self, paragraph, state: TranslationStateOfHTML):
+        margin_left = paragraph.get_effective_format().indent_left
         if margin_left is not None:
-            self.styles['margin-left'] = str(int(margin_left) // 20) + 'px'
+            state.styles['margin-left'] = str(int(margin_left) // 20) + 'px'
 
-    def _to_css_margin_right(self, paragraph):
-        margin_right = paragraph.get_indent_right()
+    def _to_css_margin_right(self, paragraph, state: TranslationStateOfHTML):
+        margin_right = paragraph.get_effective_format().indent_right
         if margin_right is not None:
-            self.styles['margin-left'] = str(int(margin_right) // 20) + 'px'
+            state.styles['margin-left'] = str(int(margin_right) // 20) + 'px'
 
-    def _to_css_text_indent(self, paragraph):
-        hanging = paragraph.get_hanging()
-        first_line = paragraph.get_first_line()
+    def _to_css_text_indent(self, paragraph, state: TranslationStateOfHTML):
+        paragraph_format = paragraph.get_effective_format()
+        hanging = paragraph_format.hanging
+        first_line = paragraph_format.first_line
         if hanging is not None:
-            self.styles['text-indent'] = str(-int(hanging) // 20) + 'px'
+            state.styles['text-indent'] = str(-int(hanging) // 20) + 'px'
         elif first_line is not None:
-            self.styles['text-indent'] = str(int(first_line) // 20) + 'px'
+            state.styles['text-indent'] = str(int(first_line) // 20) + 'px'
 
-    def _to_numbering(self, paragraph, context: dict):
+    def _to_numbering(self, paragraph, context: dict, state: ParagraphTranslationStateOfHTML):
         from .marks import ParagraphMark
 
         context_of_paragraph = context.get(paragraph)
         numbering_level = paragraph.get_numbering_level()
         if context_of_paragraph is not None and numbering_level is not None:
-            self.is_first_paragraph_in_numbering = ParagraphMark.FIRST_ELEMENT_NUMBERING in context_of_paragraph
+            state.is_first_paragraph_in_numbering = ParagraphMark.FIRST_ELEMENT_NUMBERING in context_of_paragraph
             level_num_format = numbering_level.get_numbering_format()
-            self._add_to_ext_tags('ul' if level_num_format == 'bullet' or level_num_format == 'chicago' else 'ol',
-                                  is_open=self.is_first_paragraph_in_numbering,
+            self._add_to_ext_tags(state,
+                                  'ul' if level_num_format == 'bullet' or level_num_format == 'chicago' else 'ol',
+                                  is_open=state.is_first_paragraph_in_numbering,
                                   is_close=ParagraphMark.LAST_ELEMENT_NUMBERING in context_of_paragraph)
         if numbering_level is not None:
-            self.tag = 'li'
+            state.tag = 'li'
 
-    def _to_ext_css_numbering_format(self, level):
+    def _to_ext_css_numbering_format(self, level, state: TranslationStateOfHTML):
         from .docx_html_correspondings import numbering_formats
 
         level_num_format: Optional[str] = numbering_formats.get(level.get_numbering_format())
         if level_num_format is not None:
-            self.ext_tags_styles['ol']['list-style-type'] = level_num_format
+            state.ext_tags_styles['ol']['list-style-type'] = level_num_format
 
-    def _to_ext_attribute_start(self, level):
+    def _to_ext_attribute_start(self, level, state: TranslationStateOfHTML):
         start: str = level.get_start()
         if start != '1':
-            self.ext_tags_attributes['ol']['start'] = start
+            state.ext_tags_attributes['ol']['start'] = start
 
 
 class RunTranslatorToHTML(TranslatorToHTML, BorderedElementToHTMLMixin):
     from .docx_html_correspondings import text_typeface, underline
     external_tags: Dict[str, str] = text_typeface
     underlines: Dict[str, str] = underline
-
-    def __init__(self):
-        super(RunTranslatorToHTML, self).__init__()
-        self.border: Dict[str, Optional[str]]
-        self.defining_of_border: Dict[str, bool]
-        self._set_default_for_border_dicts()
-
-    def _reset_value(self):
-        super(RunTranslatorToHTML, self)._reset_value()
-        self._set_default_for_border_dicts()
-
-    def _set_default_for_border_dicts(self):
-        self.border: Dict[str, Optional[str]] = {
-            'type': None,
-            'size': None,
-            'color': None,
-        }
-        self.defining_of_border: Dict[str, bool] = {
-            'type': False,
-            'size': False,
-            'color': False,
-        }
-
-    def _do_methods(self, run, context: dict):
-        self._to_css_font(run)
-        self._to_css_size(run)
-        self._to_ext_tag_bold(run)
-        self._to_ext_tag_italic(run)
-        self._to_ext_tags_vertical_align(run)
-        self._to_css_background_color(run)
-        self._to_css_color(run)
-        self._to_css_line_throught(run)
-        self._to_css_underline(run)
-        self._to_css_all_borders(run)
-
-    def _get_html_tag(self) -> str:
-        if self.attributes or self.styles:
+    # html around inner text of run is translated once for each effective format of runs of document and is reused.
+    # Subclasses whose html of run depends on anything else than effective format must set False
+    is_html_cached_by_format: bool = True
+
+    def translate(self, run, inner_elements: list, context: dict) -> str:
+        html_around_inner_text: Optional[Tuple[str, Optional[str]]] = self.__get_html_of_format(run, context)
+        if html_around_inner_text is None:
+            return super(RunTranslatorToHTML, self).translate(run, inner_elements, context)
+        html_before_inner_text, html_after_inner_text = html_around_inner_text
+        if html_after_inner_text is None:
+            return self._write_new_css_classes_if_iterated(html_before_inner_text, context)
+        return self._write_new_css_classes_if_iterated(
+            ''.join([html_before_inner_text, *[str(s) for s in inner_elements], html_after_inner_text]), context
+        )
+
+    def translate_around_inner_elements(self, run, context: dict) -> Tuple[str, Optional[str]]:
+        html_around_inner_text: Optional[Tuple[str, Optional[str]]] = self.__get_html_of_format(run, context)
+        if html_around_inner_text is None:
+            return super(RunTranslatorToHTML, self).translate_around_inner_elements(run, context)
+        html_before_inner_text, html_after_inner_text = html_around_inner_text
+        return self._write_new_css_classes(html_before_inner_text, context), html_after_inner_text
+
+    def __get_html_of_format(self, run, context: dict) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        :return: (html before inner text, html after inner text) of effective format of run.
+                 None if html isn't cached by format
+        """
+        from .marks import ContextMark
+
+        format_id: Optional[int] = run.get_format_id() if self.is_html_cached_by_format else None
+        if format_id is None:
+            return None
+
+        # {(document, id of format): (html before inner text, html after inner text)}
+        html_of_formats: Dict[tuple, Tuple[str, Optional[str]]] = \
+            context.setdefault(ContextMark.HTML_OF_RUN_FORMATS, {})
+        key: tuple = (run._get_document(), format_id)
+        html_around_inner_text: Optional[Tuple[str, Optional[str]]] = html_of_formats.get(key)
+        if html_around_inner_text is None:
+            state: TranslationStateOfHTML = self._create_state(context)
+            self._convert_fields(run, state)
+            self._do_methods(run, context, state)
+            html_around_inner_text = self._get_html_around_inner_text(state)
+            html_of_formats[key] = html_around_inner_text
+        return html_around_inner_text
+
+    def _do_methods(self, run, context: dict, state: TranslationStateOfHTML):
+        self._to_css_font(run, state)
+        self._to_css_size(run, state)
+        self._to_ext_tag_bold(run, state)
+        self._to_ext_tag_italic(run, state)
+        self._to_ext_tags_vertical_align(run, state)
+        self._to_css_background_color(run, state)
+        self._to_css_color(run, state)
+        self._to_css_line_throught(run, state)
+        self._to_css_underline(run, state)
+        self._to_css_all_borders(run, state)
+
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
+        if state.attributes or state.styles:
             return 'span'
         return ''
 
-    def _to_css_size(self, run):
-        size = run.get_size()
+    def _to_css_size(self, run, state: TranslationStateOfHTML):
+        size = run.get_effective_format().size
         if size is not None:
-            self.styles['font-size'] = size
+            state.styles['font-size'] = size
 
-    def _to_css_font(self, run):
-        font = run.get_font()
+    def _to_css_font(self, run, state: TranslationStateOfHTML):
+        font = run.get_effective_format().font_ascii
         if font is not None:
-            self.styles['font-family'] = font
+            state.styles['font-family'] = font
 
-    def _to_ext_tag_bold(self, run):
-        if run.is_bold():
-            self._add_to_ext_tags(self.external_tags['bold'])
+    def _to_ext_tag_bold(self, run, state: TranslationStateOfHTML):
+        if run.get_effective_format().bold:
+            self._add_to_ext_tags(state, self.external_tags['bold'])
 
-    def _to_ext_tag_italic(self, run):
-        if run.is_italic():
-            self._add_to_ext_tags(self.external_tags['italic'])
+    def _to_ext_tag_italic(self, run, state: TranslationStateOfHTML):
+        if run.get_effective_format().italic:
+            self._add_to_ext_tags(state, self.external_tags['italic'])
 
-    def _to_ext_tags_vertical_align(self, run):
-        vert_align = run.get_vertical_align()
+    def _to_ext_tags_vertical_align(self, run, state: TranslationStateOfHTML):
+        vert_align = run.get_effective_format().vertical_align
         if vert_align is not None:
             if vert_align == 'subscript':
-                self._add_to_ext_tags('sub')
+                self._add_to_ext_tags(state, 'sub')
             elif vert_align == 'superscript':
-                self._add_to_ext_tags('sup')
+                self._add_to_ext_tags(state, 'sup')
 
-    def _to_css_background_color(self, run):
-        background_color = run.get_background_color()
-        background_fill = run.get_background_fill()
+    def _to_css_background_color(self, run, state: TranslationStateOfHTML):
+        run_format = run.get_effective_format()
+        background_color = run_format.background_color
+        background_fill = run_format.background_fill
         if background_color is not None:
             if background_color != 'none':
-                self.styles['background-color'] = background_color
+                state.styles['background-color'] = background_color
         elif background_fill is not None:
-            self.styles['background-color'] = TranslatorToHTML.translate_color(background_fill)
+            state.styles['background-color'] = TranslatorToHTML.translate_color(background_fill)
 
-    def _to_css_color(self, run):
-        color = run.get_color()
+    def _to_css_color(self, run, state: TranslationStateOfHTML):
+        color = run.get_effective_format().color
         if color is not None:
-            self.styles['color'] = TranslatorToHTML.translate_color(color)
+            state.styles['color'] = TranslatorToHTML.translate_color(color)
 
-    def _to_css_line_throught(self, run):
-        if run.is_strike():
-            self._add_to_many_properties_style(('text-decoration', 'line-through'))
+    def _to_css_line_throught(self, run, state: TranslationStateOfHTML):
+        if run.get_effective_format().strike:
+            self._add_to_many_properties_style(('text-decoration', 'line-through'), state)
 
-    def _to_css_underline(self, run):
-        underline = run.get_underline()
+    def _to_css_underline(self, run, state: TranslationStateOfHTML):
+        underline = run.get_effective_format().underline_type
         if underline is not None:
-            self._add_to_many_properties_style(('text-decoration', 'underline'))
+            self._add_to_many_properties_style(('text-decoration', 'underline'), state)
             if underline in self.underlines:
-                self.styles['text-decoration-style'] = self.underlines[underline]
-            self._to_css_underline_color(run)
+                state.styles['text-decoration-style'] = self.underlines[underline]
+            self._to_css_underline_color(run, state)
 
-    def _to_css_underline_color(self, run):
+    def _to_css_underline_color(self, run, state: TranslationStateOfHTML):
         """
         must called after self.__to_css_underline
         """
-        underline_color = run.get_underline_color()
+        underline_color = run.get_effective_format().underline_color
         if underline_color is not None:
-            self.styles['text-decoration-color'] = TranslatorToHTML.translate_color(underline_color)
+            state.styles['text-decoration-color'] = TranslatorToHTML.translate_color(underline_color)
 
     def _get_border_property_of_run(self, run, pr: str) -> Optional[str]:
-        if not self.defining_of_border[pr]:
-            self.border[pr] = run.get_border(pr)
-            self.defining_of_border[pr] = True
-        return self.border[pr]
+        return getattr(run.get_effective_format(), f'border_{pr}')
 
     def _to_css_border_color(self, run, direction: str) -> Optional[Tuple[str, str]]:
         border_color = self._get_border_property_of_run(run, 'color')
@@ -400,14 +547,28 @@ class RunTranslatorToHTML(TranslatorToHTML, BorderedElementToHTMLMixin):
 class TextTranslatorToHTML(TranslatorToHTML):
     from .docx_html_correspondings import character
     characters_html: Dict[str, str] = character
+    # {class: function that replaces all characters of characters_html of class in one pass}
+    __replacers: Dict[type, Callable[[str], str]] = {}
 
     def translate(self, text_element, inner_elements: list, context: dict) -> str:
+        return self._get_replacer()(text_element.content)
+
+    @classmethod
+    def _get_replacer(cls) -> Callable[[str], str]:
+        """
+        :return: function that replaces characters of characters_html by their html. Text is scanned once by
+                 compiled pattern of all characters
+        """
         import re
 
-        text = text_element.content
-        for char in self.characters_html:
-            text = re.sub(char, self.characters_html[char], text)
-        return text
+        replacer: Optional[Callable[[str], str]] = TextTranslatorToHTML.__replacers.get(cls)
+        if replacer is None:
+            characters_html: Dict[str, str] = dict(cls.characters_html)
+            pattern = re.compile('|'.join(re.escape(char) for char in sorted(characters_html, key=len, reverse=True)))
+            replace_match: Callable = lambda match: characters_html[match.group()]
+            replacer = lambda text: pattern.sub(replace_match, text)
+            TextTranslatorToHTML.__replacers[cls] = replacer
+        return replacer
 
 
 class LineBreakTranslatorToHTML(TranslatorToHTML):
@@ -436,71 +597,71 @@ class SoftHyphenTranslatorToHTML(TranslatorToHTML):
 
 
 class SymbolTranslatorToHTML(TranslatorToHTML):
-    def _do_methods(self, symbol, context: dict):
-        self._to_css_font(symbol)
-        self._get_char(symbol)
+    def _do_methods(self, symbol, context: dict, state: TranslationStateOfHTML):
+        self._to_css_font(symbol, state)
+        self._get_char(symbol, state)
 
-    def _get_html_tag(self) -> str:
-        if self.styles:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
+        if state.styles:
             return 'span'
         return ''
 
-    def _to_css_font(self, symbol):
+    def _to_css_font(self, symbol, state: TranslationStateOfHTML):
         font = symbol.get_font()
         if font is not None:
-            self.styles['font-family'] = font
+            state.styles['font-family'] = font
 
-    def _get_char(self, symbol):
+    def _get_char(self, symbol, state: TranslationStateOfHTML):
         char = symbol.get_char()
         if char is not None:
             char_code = int(char, 16)
             if char_code > int('F000', 16):
                 char_code -= int('F000', 16)
-            self.inner_text = f'&#{char_code};'
+            state.inner_text = f'&#{char_code};'
 
 
 class TableTranslatorToHTML(TranslatorToHTML, BorderedElementToHTMLMixin):
 
-    def _do_methods(self, table, context: dict):
-        self._to_css_border_collapse()
-        self._to_attribute_width(table)
-        self._to_attribute_align(table)
-        self._to_css_all_borders(table)
-        self._to_css_margin(table)
+    def _do_methods(self, table, context: dict, state: TranslationStateOfHTML):
+        self._to_css_border_collapse(state)
+        self._to_attribute_width(table, state)
+        self._to_attribute_align(table, state)
+        self._to_css_all_borders(table, state)
+        self._to_css_margin(table, state)
 
-    def _get_html_tag(self) -> str:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         return 'table'
 
-    def _to_css_border_collapse(self):
-        self.styles['border-collapse'] = 'collapse'
+    def _to_css_border_collapse(self, state: TranslationStateOfHTML):
+        state.styles['border-collapse'] = 'collapse'
 
-    def _to_attribute_width(self, table):
+    def _to_attribute_width(self, table, state: TranslationStateOfHTML):
         width, width_type, layout = table.get_width()
         if width is not None and width_type is not None:
             if (layout is not None and layout != 'autofit') or layout is None:
                 if width_type == 'dxa':
-                    self.attributes['width'] = str(int(width) // 20) + 'px'
+                    state.attributes['width'] = str(int(width) // 20) + 'px'
                 elif width_type == 'pct':
-                    self.attributes['width'] = str(int(width) / 50) + '%'
+                    state.attributes['width'] = str(int(width) / 50) + '%'
                 elif width_type == 'nil':
-                    self.attributes['width'] = '0pt'
+                    state.attributes['width'] = '0pt'
                 elif width_type == 'auto':
                     return
 
-    def _to_attribute_align(self, table):
+    def _to_attribute_align(self, table, state: TranslationStateOfHTML):
         align = table.get_align()
         if align is not None:
-            self.attributes['align'] = align
+            state.attributes['align'] = align
 
-    def _to_css_margin(self, table):
+    def _to_css_margin(self, table, state: TranslationStateOfHTML):
         align = table.get_align()
         if align is None or align != 'center' and align != 'right':
             margin, indentation_type = table.get_indentation()
             if margin is not None and indentation_type is not None:
                 if indentation_type == 'dxa':
-                    self.styles['margin-left'] = str(int(margin) // 20) + 'px'
+                    state.styles['margin-left'] = str(int(margin) // 20) + 'px'
                 elif indentation_type == 'nil':
-                    self.styles['margin-left'] = '0px'
+                    state.styles['margin-left'] = '0px'
                 elif indentation_type == 'pct':
                     return
                 elif indentation_type == 'auto':
@@ -509,28 +670,28 @@ class TableTranslatorToHTML(TranslatorToHTML, BorderedElementToHTMLMixin):
 
 class RowTranslatorToHTML(TranslatorToHTML):
 
-    def _do_methods(self, row, context: dict):
-        self._to_attribute_or_css_height(row)
+    def _do_methods(self, row, context: dict, state: TranslationStateOfHTML):
+        self._to_attribute_or_css_height(row, state)
 
-    def _convert_fields(self, row):
-        self._to_ext_tag_head(row)
+    def _convert_fields(self, row, state: TranslationStateOfHTML):
+        self._to_ext_tag_head(row, state)
 
-    def _get_html_tag(self) -> str:
+    def _get_html_tag(self, state: TranslationStateOfHTML) -> str:
         return 'tr'
 
-    def _to_ext_tag_head(self, row):
+    def _to_ext_tag_head(self, row, state: TranslationStateOfHTML):
         if row.is_header():
-            self._add_to_ext_tags('thead', row.is_first_row_in_header, row.is_last_row_in_header)
+            self._add_to_ext_tags(state, 'thead', row.is_first_row_in_header, row.is_last_row_in_header)
 
-    def _to_attribute_or_css_height(self, row):
+    def _to_attribute_or_css_height(self, row, state: TranslationStateOfHTML):
         height, height_type = row.get_height()
         if height is not None:
             if height_type is None:
-                self.attributes['height'] = str(int(height) // 20) + 'px'
+                state.attributes['height'] = str(int(height) // 20) + 'px'
             elif height_type == 'exact':
-                self.attributes['height'] = str(int(height) // 20) + 'px'
+                state.attributes['height'] = str(int(height) // 20) + 'px'
             elif height_type == 'atLeast':
-                self.styles['min-height'] = str(int(height) // 20) + 'px'
+                state.styles['min-height'] = str(int(height) // 20) + 'px'
             elif height_type == 'auto':
                 return
 
@@ -541,118 +702,129 @@ class CellTranslatorToHTML(TranslatorToHTML, BorderedElementToHTMLMixin):
 
     def __init__(self):
         super(CellTranslatorToHTML, self).__init__()
-        self._is_header: bool = False
         self._tag_for_header = 'td'
 
+    def _create_state(self, context: dict, inner_text: str = '') -> CellTranslationStateOfHTML:
+        return CellTranslationStateOfHTML(self._get_css_classes(context), inner_text)
+
     def translate(self, element, inner_elements: list, context: dict) -> str:
-        from ...constants.property_enums import CellProperty
-        from ...properties import Property
-        if isinstance(element.get_property(CellProperty.VERTICAL_MERGE, False), Property.Missed):
+        if CellTranslatorToHTML.__is_merged_with_cell_above(element):
             return ''
         return super(CellTranslatorToHTML, self).translate(element, inner_elements, context)
 
-    def _do_methods(self, cell, context: dict):
-        self._to_css_fill_color(cell)
-        self._to_css_all_borders(cell)
-        self._to_attribute_width(cell)
-        self._to_attribute_col_span(cell)
-        self._to_css_text_direction(cell)
-        self._to_attribute_vertical_align(cell)
-        self._to_css_all_padding(cell)
+    def translate_around_inner_elements(self, element, context: dict) -> Tuple[str, Optional[str]]:
+        if CellTranslatorToHTML.__is_merged_with_cell_above(element):
+            return '', None
+        return super(CellTranslatorToHTML, self).translate_around_inner_elements(element, context)
+
+    @staticmethod
+    def __is_merged_with_cell_above(cell) -> bool:
+        from ...constants.property_enums import CellProperty
+        from ...properties import Property
+        return isinstance(cell.get_property(CellProperty.VERTICAL_MERGE, False), Property.Missed)
+
+    def _do_methods(self, cell, context: dict, state: CellTranslationStateOfHTML):
+        self._to_css_fill_color(cell, state)
+        self._to_css_all_borders(cell, state)
+        self._to_attribute_width(cell, state)
+        self._to_attribute_col_span(cell, state)
+        self._to_css_text_direction(cell, state)
+        self._to_attribute_vertical_align(cell, state)
+        self._to_css_all_padding(cell, state)
 
-    def _convert_fields(self, cell):
-        self._to_attribute_row_span(cell)
-        self._is_header = cell.is_header
+    def _convert_fields(self, cell, state: CellTranslationStateOfHTML):
+        self._to_attribute_row_span(cell, state)
+        state.is_header = cell.is_header
 
-    def _get_html_tag(self) -> str:
-        return 'td' if not self._is_header else self._tag_for_header
+    def _get_html_tag(self, state: CellTranslationStateOfHTML) -> str:
+        return 'td' if not state.is_header else self._tag_for_header
 
     def is_th_for_header(self, value: bool = True):
         self._tag_for_header = 'th' if value is True else 'td'
 
-    def _to_css_fill_color(self, cell):
+    def _to_css_fill_color(self, cell, state: TranslationStateOfHTML):
         color = cell.get_fill_color()
         if color is not None:
             if color != 'auto':
-                self.styles['background-color'] = TranslatorToHTML.translate_color(color)
+                state.styles['background-color'] = TranslatorToHTML.translate_color(color)
 
-    def _to_css_all_padding(self, cell):
-        self._to_css_padding_top(cell)
-        self._to_css_padding_bottom(cell)
-        self._to_css_padding_left(cell)
-        self._to_css_padding_right(cell)
+    def _to_css_all_padding(self, cell, state: TranslationStateOfHTML):
+        self._to_css_padding_top(cell, state)
+        self._to_css_padding_bottom(cell, state)
+        self._to_css_padding_left(cell, state)
+        self._to_css_padding_right(cell, state)
 
-    def _to_css_padding_top(self, cell):
+    def _to_css_padding_top(self, cell, state: TranslationStateOfHTML):
         padding = cell.get_margin('top')[0]
         if padding is not None:
-            self.styles['padding-top'] = padding
-            self._to_css_padding_type(cell, 'top')
+            state.styles['padding-top'] = padding
+            self._to_css_padding_type(cell, 'top', state)
 
-    def _to_css_padding_bottom(self, cell):
+    def _to_css_padding_bottom(self, cell, state: TranslationStateOfHTML):
         padding = cell.get_margin('bottom')[0]
         if padding is not None:
-            self.styles['padding-bottom'] = padding
-            self._to_css_padding_type(cell, 'bottom')
+            state.styles['padding-bottom'] = padding
+            self._to_css_padding_type(cell, 'bottom', state)
 
-    def _to_css_padding_left(self, cell):
+    def _to_css_padding_left(self, cell, state: TranslationStateOfHTML):
         padding = cell.get_margin('left')[0]
         if padding is not None:
-            self.styles['padding-left'] = padding
-            self._to_css_padding_type(cell, 'left')
+            state.styles['padding-left'] = padding
+            self._to_css_padding_type(cell, 'left', state)
 
-    def _to_css_padding_right(self, cell):
+    def _to_css_padding_right(self, cell, state: TranslationStateOfHTML):
         padding = cell.get_margin('right')[0]
         if padding is not None:
-            self.styles['padding-right'] = padding
-            self._to_css_padding_type(cell, 'right')
+            state.styles['padding-right'] = padding
+            self._to_css_padding_type(cell, 'right', state)
 
-    def _to_css_padding_type(self, cell, direction: str):
+    def _to_css_padding_type(self, cell, direction: str, state: TranslationStateOfHTML):
         """
         self.__to_css_padding_... need run before this method
         """
         padding_type = cell.get_margin(direction)[1]
         if padding_type is not None:
             if padding_type == 'dxa':
-                self.styles[rf'padding-{direction}'] = \
-                    str(int(self.styles[rf'padding-{direction}']) // 20) + 'px'
+                state.styles[rf'padding-{direction}'] = \
+                    str(int(state.styles[rf'padding-{direction}']) // 20) + 'px'
             elif padding_type == 'nil':
-                self.styles[rf'padding-{direction}'] = '0px'
+                state.styles[rf'padding-{direction}'] = '0px'
             else:
-                if rf'padding-{direction}' in self.attributes:
-                    self.styles.pop(rf'padding-{direction}')
+                if rf'padding-{direction}' in state.attributes:
+                    state.styles.pop(rf'padding-{direction}')
         else:
-            if rf'padding-{direction}' in self.attributes:
-                self.styles.pop(rf'padding-{direction}')
+            if rf'padding-{direction}' in state.attributes:
+                state.styles.pop(rf'padding-{direction}')
 
-    def _to_attribute_width(self, cell):
+    def _to_attribute_width(self, cell, state: TranslationStateOfHTML):
         width, width_type = cell.get_width()
         if width is not None and width_type is not None:
             if width_type == 'dxa':
-                self.attributes['width'] = str(int(width) // 20) + 'px'
+                state.attributes['width'] = str(int(width) // 20) + 'px'
             elif width_type == 'pct':
-                self.attributes['width'] = str(int(width) / 50) + '%'
+                state.attributes['width'] = str(int(width) / 50) + '%'
             elif width_type == 'nil':
-                self.attributes['width'] = '0px'
+                state.attributes['width'] = '0px'
             elif width_type == 'auto':
                 return
 
-    def _to_attribute_col_span(self, cell):
+    def _to_attribute_col_span(self, cell, state: TranslationStateOfHTML):
         col_span = cell.get_col_span()
         if col_span is not None:
             if int(col_span) > 1:
-                self.attributes['colspan'] = col_span
+                state.attributes['colspan'] = col_span
 
-    def _to_attribute_row_span(self, cell):
+    def _to_attribute_row_span(self, cell, state: TranslationStateOfHTML):
         if cell.row_span > 1:
-            self.attributes['rowspan'] = str(cell.row_span)
+            state.attributes['rowspan'] = str(cell.row_span)
 
-    def _to_css_text_direction(self, cell):
+    def _to_css_text_direction(self, cell, state: TranslationStateOfHTML):
         text_direction = cell.get_text_direction()
         if text_direction is not None:
             if text_direction in self.text_directions:
-                self.inner_html_wrapper_styles['writing-mode'] = self.text_directions[text_direction]
+                state.inner_html_wrapper_styles['writing-mode'] = self.text_directions[text_direction]
 
-    def _to_attribute_vertical_align(self, cell):
+    def _to_attribute_vertical_align(self, cell, state: TranslationStateOfHTML):
         vertical_align = cell.get_vertical_align()
         if vertical_align is not None:
-            self.attributes['valign'] = vertical_align
+            state.attributes['valign'] = vertical_align
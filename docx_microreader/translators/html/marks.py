@@ -5,3 +5,14 @@ from enum import Enum, unique, auto
 class ParagraphMark(Enum):
     FIRST_ELEMENT_NUMBERING = auto()
     LAST_ELEMENT_NUMBERING = auto()
+
+
+@unique
+class ContextMark(Enum):
+    """
+    keys of data of translators in context of translation
+    """
+    HTML_OF_RUN_FORMATS = auto()
+    IS_CSS_CLASSES_USED = auto()
+    CSS_CLASSES = auto()
+    COUNT_OF_WRITTEN_CSS_CLASSES = auto()
@@ -7,7 +7,7 @@ class BorderedElementToHTMLMixin(ABC):
     border_types_corresponding: Dict[str, str] = border_type
 
     @abstractmethod
-    def _add_to_many_properties_style(self, t: Optional[Tuple[str, str]]):
+    def _add_to_many_properties_style(self, t: Optional[Tuple[str, str]], state):
         pass
 
     def _to_css_border(self, element, direction: str) -> Optional[Tuple[str, str]]:
@@ -33,31 +33,31 @@ class BorderedElementToHTMLMixin(ABC):
             return rf'border-{direction}', str(int(border_size) / 8) + 'pt'
         return None
 
-    def _to_css_border_top(self, element):
-        self._add_to_many_properties_style(self._to_css_border(element, 'top'))
-        self._add_to_many_properties_style(self._to_css_border_color(element, 'top'))
-        self._add_to_many_properties_style(self._to_css_border_size(element, 'top'))
-
-    def _to_css_border_bottom(self, element):
-        self._add_to_many_properties_style(self._to_css_border(element, 'bottom'))
-        self._add_to_many_properties_style(self._to_css_border_color(element, 'bottom'))
-        self._add_to_many_properties_style(self._to_css_border_size(element, 'bottom'))
-
-    def _to_css_border_left(self, element):
-        self._add_to_many_properties_style(self._to_css_border(element, 'left'))
-        self._add_to_many_properties_style(self._to_css_border_color(element, 'left'))
-        self._add_to_many_properties_style(self._to_css_border_size(element, 'left'))
-
-    def _to_css_border_right(self, element):
-        self._add_to_many_properties_style(self._to_css_border(element, 'right'))
-        self._add_to_many_properties_style(self._to_css_border_color(element, 'right'))
-        self._add_to_many_properties_style(self._to_css_border_size(element, 'right'))
-
-    def _to_css_all_borders(self, element):
-        self._to_css_border_top(element)
-        self._to_css_border_bottom(element)
-        self._to_css_border_left(element)
-        self._to_css_border_right(element)
+    def _to_css_border_top(self, element, state):
+        self._add_to_many_properties_style(self._to_css_border(element, 'top'), state)
+        self._add_to_many_properties_style(self._to_css_border_color(element, 'top'), state)
+        self._add_to_many_properties_style(self._to_css_border_size(element, 'top'), state)
+
+    def _to_css_border_bottom(self, element, state):
+        self._add_to_many_properties_style(self._to_css_border(element, 'bottom'), state)
+        self._add_to_many_properties_style(self._to_css_border_color(element, 'bottom'), state)
+        self._add_to_many_properties_style(self._to_css_border_size(element, 'bottom'), state)
+
+    def _to_css_border_left(self, element, state):
+        self._add_to_many_properties_style(self._to_css_border(element, 'left'), state)
+        self._add_to_many_properties_style(self._to_css_border_color(element, 'left'), state)
+        self._add_to_many_properties_style(self._to_css_border_size(element, 'left'), state)
+
+    def _to_css_border_right(self, element, state):
+        self._add_to_many_properties_style(self._to_css_border(element, 'right'), state)
+        self._add_to_many_properties_style(self._to_css_border_color(element, 'right'), state)
+        self._add_to_many_properties_style(self._to_css_border_size(element, 'right'), state)
+
+    def _to_css_all_borders(self, element, state):
+        self._to_css_border_top(element, state)
+        self._to_css_border_bottom(element, state)
+        self._to_css_border_left(element, state)
+        self._to_css_border_right(element, state)
 
 
 class ParagraphContainerMixin:
@@ -47,7 +47,7 @@ class TranslatorToXML:
             tag_property = prop.description.tag_property[0] if isinstance(prop.description.tag_property, list) else \
                 prop.description.tag_property
             tags.append(tag_property)
-            self.create_properties_dict(properties, tags, element._properties[prop.key].value)
+            self.create_properties_dict(properties, tags, element._get_property_value(prop.key))
         self.add_property(result, properties)
         TranslatorToXML.append_inner_elements(result, inner_elements)
         return result
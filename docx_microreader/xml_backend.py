@@ -0,0 +1,66 @@
+import xml.etree.ElementTree as ET
+from typing import Tuple
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# backend for parsing parts of documents: lxml if it is installed, otherwise xml.etree.ElementTree.
+# Parsed elements of both backends have the same interface (tag, text, get, find, findall, iteration by children).
+# Translators create elements by xml.etree.ElementTree, because lxml doesn't allow prefixed tags (w:p)
+
+ETREE: str = 'etree'
+LXML: str = 'lxml'
+
+_backend: str = LXML if lxml_etree is not None else ETREE
+
+
+def get_backend() -> str:
+    """
+    :return: LXML or ETREE
+    """
+    return _backend
+
+
+def set_backend(backend: str):
+    """
+    :param backend: LXML or ETREE
+    """
+    global _backend
+
+    if backend == LXML and lxml_etree is None:
+        raise ImportError('lxml is not installed')
+    if backend != LXML and backend != ETREE:
+        raise ValueError(f'unknown xml backend {backend}')
+    _backend = backend
+
+
+def _lxml_parser():
+    return lxml_etree.XMLParser(resolve_entities=False, huge_tree=True)
+
+
+def fromstring(data: bytes):
+    """
+    :return: root element of parsed data
+    """
+    if _backend == LXML:
+        return lxml_etree.fromstring(data, _lxml_parser())
+    return ET.fromstring(data)
+
+
+def iterparse(source, events: Tuple[str, ...] = ('start', 'end')):
+    """
+    :param source: binary file-like object
+    :return: iterator of (event, element)
+    """
+    # incremental parsing uses xml.etree.ElementTree for both backends: lxml.etree.iterparse creates proxy objects
+    # for every event and is slower than ElementTree when elements are processed and cleared one by one
+    return ET.iterparse(source, events=events)
+
+
+def is_element(obj) -> bool:
+    """
+    :return: True if obj is element of xml.etree.ElementTree or lxml
+    """
+    return ET.iselement(obj) or lxml_etree is not None and lxml_etree.iselement(obj)
@@ -1,14 +1,31 @@
-from .docx_parser import Parser
+from .docx_parser import Parser, _ResolvedPropertiesCacheVersion
 import xml.etree.ElementTree as ET
 from typing import Union, List, Dict, Tuple, Optional
 from .properties import Property
 from .constants import property_enums as pr_const
+from .constants.translate_formats import TranslateFormat
 from .utils.functions import execute_if_not_none
 
 
+class _ResolvedPropertiesCacheStatistics:
+    """
+    statistics of caches of resolved properties of all elements. It isn't stored in class attributes of XMLement,
+    because assignment to class attribute invalidates attribute lookup caches of class and all its subclasses
+    """
+    __slots__ = ('hits', 'misses')
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+
+
+_resolved_properties_cache_statistics = _ResolvedPropertiesCacheStatistics()
+# version of caches of resolved properties of elements that don't belong to document
+_detached_elements_cache_version = _ResolvedPropertiesCacheVersion()
+
+
 class XMLement(Parser):
     element_description: Union[pr_const.Element, pr_const.Style, pr_const.SubStyle]
-    from .constants.translate_formats import TranslateFormat
 
     # {TranslateFormat: translator} tarnslator must have method:
     # def translate(self, xml_element, translated_inner_elements: str)
@@ -22,9 +39,25 @@ class XMLement(Parser):
 
     _default_style: Optional[pr_const.DefaultStyle] = None
 
-    def __init__(self, element: ET.Element, parent):
+    # resolved values of properties are cached in elements. Caches of all elements of document are invalidated together
+    # by changing version of document on any change that can affect resolving: values of properties, styles, structure
+    # of elements
+    __slots__ = ('parent', '_document', '_base_style', '__resolved_properties', '__resolved_properties_cache_version')
+
+    def __init__(self, element: ET.Element, parent, is_lazy: Optional[bool] = None):
+        """
+        :param is_lazy: parse inner elements on first access to them. Value of parent is used if None
+        """
         self.parent: Optional[XMLement] = parent
-        super(XMLement, self).__init__(element)
+        # document that owns element. It is maintained by insert_inner_element, append_inner_element and
+        # pop_inner_element. Inner elements get it from parent while they are parsed
+        self._document = execute_if_not_none(parent, lambda x: x._get_document())
+        # {(key of property, is_find_missed_or_true): resolved value}
+        self.__resolved_properties: Optional[dict] = None
+        self.__resolved_properties_cache_version: int = -1
+        super(XMLement, self).__init__(
+            element, is_lazy if is_lazy is not None else execute_if_not_none(parent, lambda x: x._is_lazy, False)
+        )
         self._properties_unificate()
         self._base_style = self._get_style_from_document()
         self._set_default_style_of_class()
@@ -44,16 +77,26 @@ class XMLement(Parser):
             raise TypeError(f"{element} can't be inner element of {self.__class__}")
         self._inner_elements.insert(index, element)
         element.parent = self
+        element._set_document(self._get_document())
+        self._after_parse_inner_elements()
+        self.invalidate_resolved_properties_cache()
 
     def append_inner_element(self, element):
         if not self.__class__.is_possible_inner_element(element.__class__):
             raise TypeError(f"{element} can't be inner element of {self.__class__}")
         self._inner_elements.append(element)
         element.parent = self
+        element._set_document(self._get_document())
+        self._after_parse_inner_elements()
+        self.invalidate_resolved_properties_cache()
 
     def pop_inner_element(self, index: int = -1):
-        self._inner_elements[index].parent = None
-        return self._inner_elements.pop(index)
+        element = self._inner_elements.pop(index)
+        element.parent = None
+        element._set_document(None)
+        self._after_parse_inner_elements()
+        self.invalidate_resolved_properties_cache()
+        return element
 
     def iterate_by_inner_elements(self):
         for el in self._inner_elements:
@@ -66,24 +109,121 @@ class XMLement(Parser):
         :param is_recursive_translate: pass to_format to inner element if True
         :param context: Translators can use this variable for create context of translation
         """
-        from docx_microreader.constants.translate_formats import TranslateFormat
-        translator = self.translators[TranslateFormat(to_format)] if to_format is not None else \
-                     self.translators[self.translate_format]
-
         if context is None:
             context = {}
-        translator.preparation_to_translate_inner_elements(self, context)
+        translate_format: Optional[TranslateFormat] = TranslateFormat(to_format) if to_format is not None else None
+        # inner elements are translated to their translate_format if None
+        inner_translate_format: Optional[TranslateFormat] = translate_format if is_recursive_translate else None
 
-        translated_inner_elements = []
-        for el in self._inner_elements:
-            if is_recursive_translate:
-                translated_inner_elements.append(el.translate(to_format, is_recursive_translate, context))
+        # elements are visited by explicit stack instead of recursion, so depth of elements isn't limited by recursion
+        # limit. [(element, its translator, iterator by its inner elements, translations of its inner elements)]
+        stack: List[tuple] = []
+        element: XMLement = self
+        while True:
+            translator = element.translators[translate_format if translate_format is not None
+                                             else element.translate_format]
+            element._preparation_to_translate()
+            translator.preparation_to_translate_inner_elements(element, context)
+            translate_format = inner_translate_format
+            inner_elements: list = element._inner_elements
+            if inner_elements:
+                inner_elements_iterator = iter(inner_elements)
+                stack.append((element, translator, inner_elements_iterator, []))
+                element = next(inner_elements_iterator)
+                continue
+
+            translation = element._translate_by(translator, [], context)
+            # elements whose all inner elements are translated are translated too
+            while stack:
+                parent, parent_translator, inner_elements_iterator, translations = stack[-1]
+                translations.append(translation)
+                element = next(inner_elements_iterator, None)
+                if element is not None:
+                    break
+                stack.pop()
+                translation = parent._translate_by(parent_translator, translations, context)
             else:
-                translated_inner_elements.append(el.translate(context=context))
+                return translation
+
+    def _translate_by(self, translator, translated_inner_elements: list, context: dict):
+        """
+        :param translated_inner_elements: translations of inner elements
+        :return: translation of element by translator
+        """
         return translator.translate(self, translated_inner_elements, context)
 
+    def translate_to(self, stream, to_format: Union[TranslateFormat, str, None] = None,
+                     context: Optional[dict] = None):
+        """
+        translate element and write result to stream piece by piece, so translation isn't kept in memory
+        :param stream: text stream (object with write method)
+        :param to_format: using translate_format of element if None
+        :param context: Translators can use this variable for create context of translation
+        """
+        for chunk in self.iterate_translation(to_format, context):
+            stream.write(chunk)
+
+    def iterate_translation(self, to_format: Union[TranslateFormat, str, None] = None,
+                            context: Optional[dict] = None):
+        """
+        translate element piece by piece: translation of element around inner elements is yielded before and
+        after translations of inner elements. Translators of elements that have inner elements must have method
+        translate_around_inner_elements(self, xml_element, context) -> (str, str or None)
+        :param to_format: using translate_format of element if None
+        :param context: Translators can use this variable for create context of translation
+        :return: generator of str
+        """
+        if context is None:
+            context = {}
+        translate_format: Optional[TranslateFormat] = TranslateFormat(to_format) if to_format is not None else None
+
+        # elements are visited by explicit stack instead of recursion.
+        # [(iterator by inner elements of element, translation of element after inner elements)]
+        stack: List[tuple] = []
+        element: Optional[XMLement] = self
+        while True:
+            if element is not None:
+                translator = element.translators[translate_format if translate_format is not None
+                                                 else element.translate_format]
+                inner_elements: list = element._inner_elements
+                if inner_elements and not hasattr(translator, 'translate_around_inner_elements'):
+                    raise TypeError(f"translation of {element.__class__.__name__} by {translator.__class__.__name__} "
+                                    f"can't be iterated")
+                element._preparation_to_translate()
+                translator.preparation_to_translate_inner_elements(element, context)
+                if not inner_elements:
+                    yield element._translate_by(translator, [], context)
+                else:
+                    translation_before, translation_after = translator.translate_around_inner_elements(element, context)
+                    yield translation_before
+                    if translation_after is not None:
+                        stack.append((iter(inner_elements), translation_after))
+            if not stack:
+                return
+            inner_elements_iterator, translation_after = stack[-1]
+            element = next(inner_elements_iterator, None)
+            if element is None:
+                stack.pop()
+                yield translation_after
+
+    def _preparation_to_translate(self):
+        """
+        it is called before translation of element and its inner elements
+        """
+        pass
+
     def _get_document(self):
-        return execute_if_not_none(self.parent, lambda x: x._get_document())
+        return self._document
+
+    def _set_document(self, document):
+        """
+        set document of element and its inner elements. Inner elements that aren't parsed yet get document from
+        element when they are parsed
+        """
+        self._document = document
+        if self.is_inner_elements_parsed():
+            for el in self._inner_elements:
+                el._set_document(document)
 
     def _get_style_id(self) -> Optional[str]:
         return None
@@ -96,21 +236,26 @@ class XMLement(Parser):
         if value of property not equal one of variants or correct variant set None
         """
         for key in self._properties_unificators:
-            if not (key in self._properties):
+            if not self._is_described_property(key):
                 raise KeyError(f'not found key "{key}" from _properties_validators in _all_properties')
+            value = self._get_property_value(key)
+            if value is None:
+                continue
             is_finding_value: bool = False
             for correct_value, variants in self._properties_unificators[key]:
-                if self._properties[key].value == correct_value:
+                if value == correct_value:
                     is_finding_value = True
                     break
                 else:
                     for variant in variants:
-                        if self._properties[key].value == variant:
-                            self._properties[key].value = correct_value
+                        if value == variant:
+                            value = correct_value
+                            # element is being constructed, so nothing is cached and caches aren't invalidated
+                            Parser._set_property_value(self, key, value)
                             is_finding_value = True
                             break
             if not is_finding_value:
-                self._properties[key].value = None                
+                Parser._set_property_value(self, key, None)
 
     @staticmethod
     def _key_of_property(property_name) -> str:
@@ -129,8 +274,46 @@ class XMLement(Parser):
         :param is_find_missed_or_true: recursive find value if result equal Property.Missed. Return True if not find
         :return: Property.value or None
         """
-        result = None
+        statistics: _ResolvedPropertiesCacheStatistics = _resolved_properties_cache_statistics
         key: str = XMLement._key_of_property(property_name)
+        cache_key: Tuple[str, bool] = (key, is_find_missed_or_true)
+        version: int = self._get_resolved_properties_cache_version()
+        if self.__resolved_properties_cache_version != version:
+            self.__resolved_properties = {}
+            self.__resolved_properties_cache_version = version
+        elif cache_key in self.__resolved_properties:
+            statistics.hits += 1
+            return self.__resolved_properties[cache_key]
+        statistics.misses += 1
+        result = self._resolve_property(key, is_find_missed_or_true)
+        self.__resolved_properties[cache_key] = result
+        return result
+
+    def _get_properties(self, keys: Tuple[str, ...]) -> Dict[str, Union[str, bool, None]]:
+        """
+        the same as get_property with is_find_missed_or_true == True for many keys. Values that aren't cached are
+        resolved together by _resolve_properties and cached
+        :return: {key: value of property}
+        """
+        statistics: _ResolvedPropertiesCacheStatistics = _resolved_properties_cache_statistics
+        version: int = self._get_resolved_properties_cache_version()
+        if self.__resolved_properties_cache_version != version:
+            self.__resolved_properties = {}
+            self.__resolved_properties_cache_version = version
+        cache: dict = self.__resolved_properties
+        not_cached_keys: Tuple[str, ...] = tuple(key for key in keys if (key, True) not in cache)
+        statistics.hits += len(keys) - len(not_cached_keys)
+        if not_cached_keys:
+            statistics.misses += len(not_cached_keys)
+            for key, value in self._resolve_properties(not_cached_keys).items():
+                cache[(key, True)] = value
+        return {key: cache[(key, True)] for key in keys}
+
+    def _resolve_property(self, key: str, is_find_missed_or_true: bool):
+        """
+        find value of property without cache. Subclasses extend chain of resolving by overriding this method
+        """
+        result = None
 
         if key in self._properties:
             result = self._properties[key].value
@@ -148,18 +331,110 @@ class XMLement(Parser):
             return True
         return result
 
+    def _resolve_properties(self, keys: Tuple[str, ...]) -> Dict[str, Union[str, bool, None]]:
+        """
+        find values of many properties like get_property with is_find_missed_or_true == True. Subclasses override this
+        method to visit each source of values in chain of resolving once for all keys
+        :return: {key: value of property}
+        """
+        return {key: self._resolve_property(key, True) for key in keys}
+
+    def _resolve_properties_of_element_and_base_style(self, keys: Tuple[str, ...]) -> \
+            Dict[str, Union[str, bool, None]]:
+        """
+        the same as _resolve_property of XMLement with is_find_missed_or_true == True for many keys.
+        Base style is visited once for all keys that aren't found in element
+        :return: {key: value of property}
+        """
+        result: Dict[str, Union[str, bool, None]] = {}
+        not_found_keys: List[str] = []
+        missed_keys: List[str] = []
+        for key in keys:
+            prop: Optional[Property] = self._properties.get(key)
+            value = prop.value if prop is not None else None
+            if value is None or isinstance(value, Property.Missed):
+                if value is not None:
+                    missed_keys.append(key)
+                not_found_keys.append(key)
+                value = None
+            result[key] = value
+
+        if not_found_keys and self._base_style is not None:
+            base_style_result = self._base_style._get_properties(tuple(not_found_keys))
+            for key in not_found_keys:
+                result[key] = base_style_result[key]
+
+        for key in missed_keys:
+            if result[key] is None:
+                result[key] = True
+        return result
+
     def get_base_style(self):
         return self._base_style
 
     def set_style(self, style_id: str):
         self._base_style = execute_if_not_none(self._get_document(), lambda x: x.get_style(style_id))
+        self.invalidate_resolved_properties_cache()
+
+    def _set_property_value(self, key: str, value):
+        super(XMLement, self)._set_property_value(key, value)
+        self.invalidate_resolved_properties_cache()
+
+    def invalidate_resolved_properties_cache(self):
+        """
+        invalidate cached resolved values of properties of all elements of document of element (or of all elements
+        that don't belong to document). It is called by methods that change properties, styles or structure of
+        elements. Call it after changing attributes of elements directly
+        """
+        self.__get_resolved_properties_cache_version_of_document().invalidate()
+
+    def _invalidate_resolved_properties_cache_of_inner_elements(self):
+        """
+        invalidate cached resolved values of properties of element and its inner elements only. It is used for
+        changes that can't affect resolving of properties of other elements, so caches of document are kept
+        """
+        elements: list = [self]
+        while elements:
+            element: XMLement = elements.pop()
+            element.__resolved_properties_cache_version = -1
+            if element.is_inner_elements_parsed():
+                elements.extend(element._inner_elements)
+
+    def _get_resolved_properties_cache_version(self) -> int:
+        """
+        :return: version of caches of document of element that is changed when caches are invalidated
+        """
+        return self.__get_resolved_properties_cache_version_of_document().value
+
+    def __get_resolved_properties_cache_version_of_document(self) -> _ResolvedPropertiesCacheVersion:
+        document = self._get_document()
+        return document._resolved_properties_cache_version if document is not None \
+            else _detached_elements_cache_version
+
+    @staticmethod
+    def get_resolved_properties_cache_statistics() -> Dict[str, int]:
+        """
+        :return: {'hits': count of get_property calls returned cached value, 'misses': count of resolved values}
+        """
+        return {
+            'hits': _resolved_properties_cache_statistics.hits,
+            'misses': _resolved_properties_cache_statistics.misses,
+        }
+
+    @staticmethod
+    def reset_resolved_properties_cache_statistics():
+        _resolved_properties_cache_statistics.hits = 0
+        _resolved_properties_cache_statistics.misses = 0
 
     def set_property_value(self, property_name, value: Union[str, bool, None]):
         """
         :param property_name: key of property (str or instance of Enum from constants.property_enums)
         :param value: new value
         """
-        self._properties[XMLement._key_of_property(property_name)].value = value
+        key: str = XMLement._key_of_property(property_name)
+        if not self._is_described_property(key):
+            raise KeyError(f'{self.__class__.__name__} has no property "{key}"')
+        self._set_property_value(key, value)
 
     def _get_style_from_document(self):
         style_id = self._get_style_id()
@@ -8,4 +8,5 @@ setup(
     author='Duda Eugen',
     license='MIT',
     install_requires=[],
+    extras_require={'lxml': ['lxml']},
 )
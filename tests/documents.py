@@ -0,0 +1,143 @@
+"""
+docx files for tests. They are built in memory
+"""
+import io
+import zipfile
+from xml.sax.saxutils import escape
+
+
+W_NAMESPACE = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/numbering.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+    '</Types>'
+)
+
+DOCUMENT_RELATIONSHIPS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" '
+    'Target="numbering.xml"/>'
+    '</Relationships>'
+)
+
+STYLES = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:styles {W_NAMESPACE}>'
+    '<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri"/><w:sz w:val="22"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:ind w:left="10"/></w:pPr></w:pPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:pPr><w:jc w:val="both"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading"><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:pBdr><w:top w:val="single" w:sz="4" w:color="auto"/></w:pBdr></w:pPr>'
+    '<w:rPr><w:b/><w:sz w:val="32"/></w:rPr></w:style>'
+    '<w:style w:type="character" w:styleId="Emphasis"><w:rPr><w:i/><w:u w:val="single"/></w:rPr></w:style>'
+    '<w:style w:type="table" w:styleId="Grid"><w:tblPr><w:tblBorders>'
+    '<w:top w:val="single" w:sz="4"/><w:bottom w:val="single" w:sz="4"/>'
+    '<w:insideH w:val="single" w:sz="4"/><w:insideV w:val="dotted" w:sz="4"/></w:tblBorders></w:tblPr>'
+    '<w:tblStylePr w:type="firstRow"><w:rPr><w:b/></w:rPr><w:tcPr><w:shd w:fill="4472C4"/></w:tcPr></w:tblStylePr>'
+    '<w:tblStylePr w:type="band1Horz"><w:tcPr><w:shd w:fill="EEEEEE"/></w:tcPr></w:tblStylePr>'
+    '</w:style>'
+    '</w:styles>'
+)
+
+NUMBERING = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:numbering {W_NAMESPACE}>'
+    '<w:abstractNum w:abstractNumId="0">'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="decimal"/><w:lvlText w:val="%1."/></w:lvl>'
+    '<w:lvl w:ilvl="1"><w:start w:val="3"/><w:numFmt w:val="lowerLetter"/><w:lvlText w:val="%2)"/></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+RUN_FORMATS = ('', '<w:b/>', '<w:i/><w:color w:val="FF0000"/>', '<w:rStyle w:val="Emphasis"/><w:sz w:val="28"/>',
+               '<w:strike/><w:highlight w:val="yellow"/>', '<w:vertAlign w:val="superscript"/>')
+
+
+def run_xml(text: str, formats: str = '') -> str:
+    properties = f'<w:rPr>{formats}</w:rPr>' if formats else ''
+    return f'<w:r>{properties}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def paragraph_xml(runs: str, properties: str = '') -> str:
+    return f'<w:p>{"<w:pPr>" + properties + "</w:pPr>" if properties else ""}{runs}</w:p>'
+
+
+def table_xml(index: int, rows_count: int = 12) -> str:
+    """
+    :return: table with two header rows and vertically merged cells in the second and the third columns
+    """
+    rows = []
+    for row in range(rows_count):
+        cells = []
+        for column in range(3):
+            properties = '<w:tcW w:w="1000" w:type="dxa"/>'
+            if column == 1 and row >= 2:
+                # cells are merged by groups of 3 rows
+                properties += '<w:vMerge w:val="restart"/>' if row % 3 == 2 else '<w:vMerge/>'
+            elif column == 2 and row >= 2 and (row // 2 + index) % 3 != 0:
+                # some pairs of rows are merged
+                properties += '<w:vMerge w:val="restart"/>' if row % 2 == 0 else '<w:vMerge w:val="continue"/>'
+            cells.append(f'<w:tc><w:tcPr>{properties}</w:tcPr>'
+                         f'{paragraph_xml(run_xml(f"cell {index}.{row}.{column}", RUN_FORMATS[column]))}</w:tc>')
+        header = '<w:trPr><w:tblHeader/></w:trPr>' if row < 2 else ''
+        rows.append(f'<w:tr>{header}{"".join(cells)}</w:tr>')
+    return ('<w:tbl><w:tblPr><w:tblStyle w:val="Grid"/><w:tblLook w:firstRow="1" w:noHBand="0"/></w:tblPr>'
+            f'{"".join(rows)}</w:tbl>')
+
+
+def create_docx(seed: int) -> bytes:
+    """
+    :param seed: documents with different seed have different content
+    :return: content of docx file with styled paragraphs, runs of various formats, numbering and tables with
+             header rows and merged cells
+    """
+    body = []
+    for i in range(40):
+        number = seed * 40 + i
+        runs = ''.join(run_xml(f'text {number}.{j} <&> ', RUN_FORMATS[(number + j) % len(RUN_FORMATS)])
+                       for j in range(1 + number % 4))
+        if i % 10 == 0:
+            body.append(paragraph_xml(runs, '<w:pStyle w:val="Heading"/>'))
+        elif i % 10 < 5:
+            body.append(paragraph_xml(runs, f'<w:numPr><w:ilvl w:val="{i % 2}"/><w:numId w:val="1"/></w:numPr>'))
+        elif i % 10 == 7:
+            body.append(table_xml(number))
+        else:
+            body.append(paragraph_xml(runs, '<w:jc w:val="center"/>' if i % 3 else ''))
+    return pack_docx(''.join(body))
+
+
+def create_docx_of_tables(tables_count: int, rows_count: int) -> bytes:
+    """
+    :return: content of docx file with tables only. Translation of such file depends on layout of tables mostly
+    """
+    return pack_docx(''.join([table_xml(index, rows_count) for index in range(tables_count)]))
+
+
+def pack_docx(body: str) -> bytes:
+    """
+    :param body: xml of inner elements of body
+    :return: content of docx file
+    """
+    document = f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {W_NAMESPACE}><w:body>' \
+               f'{body}</w:body></w:document>'
+
+    content = io.BytesIO()
+    with zipfile.ZipFile(content, 'w') as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('word/_rels/document.xml.rels', DOCUMENT_RELATIONSHIPS)
+        archive.writestr('word/document.xml', document)
+        archive.writestr('word/styles.xml', STYLES)
+        archive.writestr('word/numbering.xml', NUMBERING)
+    return content.getvalue()
@@ -0,0 +1,93 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from docx_microreader.models import Document
+from docx_microreader.translators.html.marks import ContextMark
+
+from documents import create_docx, create_docx_of_tables
+
+
+class ConcurrentTranslationTest(unittest.TestCase):
+    """
+    documents translated on different threads at the same time must be translated as if they were translated one by
+    one. Thread switching is made frequent, so translations are interleaved as much as possible
+    """
+    documents_count: int = 6
+    repeats: int = 2
+    threads_count: int = 8
+
+    @classmethod
+    def setUpClass(cls):
+        cls.contents = [create_docx(seed) for seed in range(cls.documents_count)]
+        cls.serial_html = [Document(content).translate('html') for content in cls.contents]
+        cls.content_of_tables = create_docx_of_tables(10, 30)
+        cls.serial_html_of_tables = Document(cls.content_of_tables).translate('html')
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def __translate_concurrently(self, translate) -> list:
+        """
+        :param translate: function that translates new Document of content of docx file to html
+        :return: [(index of content, html)]
+        """
+        indexes = list(range(self.documents_count)) * self.repeats
+        with ThreadPoolExecutor(self.threads_count) as pool:
+            return list(pool.map(lambda i: (i, translate(Document(self.contents[i]))), indexes))
+
+    def test_translate(self):
+        for i, html in self.__translate_concurrently(lambda document: document.translate('html')):
+            self.assertEqual(self.serial_html[i], html)
+
+    def test_iterate_translation(self):
+        for i, html in self.__translate_concurrently(lambda document: ''.join(document.iterate_translation('html'))):
+            self.assertEqual(self.serial_html[i], html)
+
+    def test_css_classes(self):
+        # mode of css classes is chosen by context, so translations in both modes can run at the same time
+        serial_html_with_css_classes = Document(self.contents[0]).translate(
+            'html', context={ContextMark.IS_CSS_CLASSES_USED: True}
+        )
+        self.assertIn('<style>', serial_html_with_css_classes)
+        modes = [True, False] * self.threads_count
+        with ThreadPoolExecutor(self.threads_count) as pool:
+            results = list(pool.map(lambda is_css_classes_used: Document(self.contents[0]).translate(
+                'html', context={ContextMark.IS_CSS_CLASSES_USED: is_css_classes_used}
+            ), modes))
+        for is_css_classes_used, html in zip(modes, results):
+            self.assertEqual(serial_html_with_css_classes if is_css_classes_used else self.serial_html[0], html)
+
+    def __translate_shared_document(self, document) -> list:
+        """
+        :return: translations of one document to html that are made at the same time
+        """
+        with ThreadPoolExecutor(self.threads_count) as pool:
+            return list(pool.map(lambda _: document.translate('html'), range(self.threads_count)))
+
+    def test_shared_document(self):
+        for html in self.__translate_shared_document(Document(self.contents[0])):
+            self.assertEqual(self.serial_html[0], html)
+        # layout of tables (header rows and merged cells) is defined by parsing, so translation doesn't change
+        # document and doesn't invalidate caches that are used by other translations
+        document = Document(self.content_of_tables)
+        version = document._get_resolved_properties_cache_version()
+        self.assertEqual(self.serial_html_of_tables, document.translate('html'))
+        self.assertEqual(version, document._get_resolved_properties_cache_version())
+        for html in self.__translate_shared_document(Document(self.content_of_tables)):
+            self.assertEqual(self.serial_html_of_tables, html)
+
+    def test_shared_lazy_document(self):
+        # inner elements of lazy document are parsed by the first translations
+        for html in self.__translate_shared_document(Document(self.contents[0], is_lazy=True)):
+            self.assertEqual(self.serial_html[0], html)
+        for html in self.__translate_shared_document(Document(self.content_of_tables, is_lazy=True)):
+            self.assertEqual(self.serial_html_of_tables, html)
+
+
+if __name__ == '__main__':
+    unittest.main()
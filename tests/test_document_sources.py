@@ -0,0 +1,59 @@
+import io
+import mmap
+import os
+import pathlib
+import tempfile
+import unittest
+
+from docx_microreader.models import Document
+
+from documents import create_docx
+
+
+class DocumentSourcesTest(unittest.TestCase):
+    """
+    document must be the same for all kinds of source of docx file
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.content = create_docx(0)
+        cls.html = Document(cls.content).translate('html')
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'document.docx')
+        with open(cls.path, 'wb') as file:
+            file.write(cls.content)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_content(self):
+        self.assertEqual(self.html, Document(bytearray(self.content)).translate('html'))
+        self.assertEqual(self.html, Document(memoryview(self.content)).translate('html'))
+
+    def test_path(self):
+        self.assertEqual(self.html, Document(self.path).translate('html'))
+        self.assertEqual(self.html, Document(pathlib.Path(self.path)).translate('html'))
+
+    def test_stream(self):
+        self.assertEqual(self.html, Document(io.BytesIO(self.content)).translate('html'))
+        with open(self.path, 'rb') as file:
+            self.assertEqual(self.html, Document(file).translate('html'))
+            self.assertFalse(file.closed)
+
+    def test_memory_map(self):
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory_map:
+            self.assertEqual(self.html, Document(memory_map).translate('html'))
+
+    def test_iter_body(self):
+        context = {}
+        html = ''.join(element.translate('html', context=context)
+                       for element in Document.iter_body(pathlib.Path(self.path), context=context))
+        self.assertIn(html, self.html)
+        with open(self.path, 'rb') as file:
+            self.assertEqual(html, ''.join(element.translate('html', context=context)
+                                           for element in Document.iter_body(file, context=context)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import re
+import unittest
+import xml.etree.ElementTree as ET
+
+from docx_microreader.models import Document, Paragraph
+
+from documents import create_docx
+
+
+class IterBodyTest(unittest.TestCase):
+    """
+    elements of body that are parsed incrementally must be translated as elements of document that is parsed at once
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.contents = [create_docx(seed) for seed in range(3)]
+
+    def test_html(self):
+        for content in self.contents:
+            html = Document(content).translate('html')
+            body_html = re.search('<body>(.*)</body>', html, re.DOTALL).group(1)
+            context = {}
+            translations = [element.translate('html', context=context)
+                            for element in Document.iter_body(content, context=context)]
+            self.assertEqual(body_html, ''.join(translations))
+            self.assertIn('<ol', body_html)
+
+    def test_xml(self):
+        for content in self.contents:
+            body = Document(content).get_inner_element(0)
+            self.assertEqual([ET.tostring(element.translate('xml')) for element in body.iterate_by_inner_elements()],
+                             [ET.tostring(element.translate('xml')) for element in Document.iter_body(content)])
+
+    def test_list_is_in_body(self):
+        # paragraphs of list are yielded together, so they are in body while they are translated
+        for element in Document.iter_body(self.contents[0]):
+            body_elements = list(element.parent.iterate_by_inner_elements())
+            self.assertIn(element, body_elements)
+            if len(body_elements) > 1:
+                self.assertTrue(all(isinstance(el, Paragraph) and el.get_numbering_level() is not None
+                                    for el in body_elements[:-1]))
+
+    def test_context_is_cleared(self):
+        context = {}
+        for element in Document.iter_body(self.contents[0], context=context):
+            element.translate('html', context=context)
+        self.assertFalse(any(isinstance(key, Paragraph) for key in context))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+from docx_microreader.models import Document
+
+from documents import create_docx, create_docx_of_tables
+
+
+class LazyParsingTest(unittest.TestCase):
+    """
+    lazy document parses inner elements on first access to them and must be translated as document that is parsed at
+    once
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.contents = [create_docx(seed) for seed in range(3)] + [create_docx_of_tables(3, 12)]
+
+    def test_inner_elements_are_parsed_on_access(self):
+        document = Document(self.contents[0], is_lazy=True)
+        self.assertFalse(document.is_inner_elements_parsed())
+        body = document.get_inner_element(0)
+        self.assertTrue(document.is_inner_elements_parsed())
+        self.assertFalse(body.is_inner_elements_parsed())
+        paragraph = body.get_inner_element(0)
+        self.assertTrue(body.is_inner_elements_parsed())
+        self.assertFalse(paragraph.is_inner_elements_parsed())
+        self.assertIs(paragraph.parent, body)
+
+    def test_html(self):
+        for content in self.contents:
+            self.assertEqual(Document(content).translate('html'), Document(content, is_lazy=True).translate('html'))
+            self.assertEqual(''.join(Document(content).iterate_translation('html')),
+                             ''.join(Document(content, is_lazy=True).iterate_translation('html')))
+
+    def test_xml(self):
+        for content in self.contents:
+            self.assertEqual(ET.tostring(Document(content).translate('xml')),
+                             ET.tostring(Document(content, is_lazy=True).translate('xml')))
+
+
+if __name__ == '__main__':
+    unittest.main()
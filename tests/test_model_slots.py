@@ -0,0 +1,44 @@
+import unittest
+
+from docx_microreader.models import Document, Paragraph, Run
+
+from documents import create_docx
+
+
+class CommentedParagraph(Paragraph):
+    """
+    subclass of model without __slots__
+    """
+    pass
+
+
+class ModelSlotsTest(unittest.TestCase):
+    """
+    attributes of models are stored in slots, so instances of models don't have __dict__
+    """
+    def test_models_have_no_dict(self):
+        document = Document(create_docx(0))
+        elements = list(document.iterate_by_inner_elements())
+        classes = set()
+        while elements:
+            element = elements.pop()
+            classes.add(type(element).__name__)
+            self.assertFalse(hasattr(element, '__dict__'), type(element).__name__)
+            elements.extend(element.iterate_by_inner_elements())
+        self.assertTrue({'Body', 'Paragraph', 'Run', 'Text', 'Table', 'Row', 'Cell'} <= classes)
+
+    def test_subclass_without_slots(self):
+        paragraph = CommentedParagraph.create()
+        paragraph.comment = 'added'
+        paragraph.append_inner_element(Run.create())
+        paragraph.set_align_value('center')
+        self.assertEqual('added', paragraph.comment)
+        self.assertEqual('center', paragraph.get_align())
+        expected_paragraph = Paragraph.create()
+        expected_paragraph.append_inner_element(Run.create())
+        expected_paragraph.set_align_value('center')
+        self.assertEqual(expected_paragraph.translate('html'), paragraph.translate('html'))
+
+
+if __name__ == '__main__':
+    unittest.main()
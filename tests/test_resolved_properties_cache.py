@@ -0,0 +1,85 @@
+import unittest
+
+from docx_microreader.models import Document
+
+from documents import pack_docx, paragraph_xml, run_xml
+
+
+class ResolvedPropertiesCacheTest(unittest.TestCase):
+    """
+    resolved values of properties are cached, so changes of elements and styles must invalidate caches: document that
+    is changed after parsing must be translated as document that is parsed with these changes
+    """
+    heading: str = '<w:pStyle w:val="Heading"/>'
+    emphasis: str = '<w:rStyle w:val="Emphasis"/>'
+
+    @staticmethod
+    def __create_document(run_formats: str = '', paragraph_properties: str = ''):
+        return Document(pack_docx(
+            paragraph_xml(run_xml('heading'), ResolvedPropertiesCacheTest.heading) +
+            paragraph_xml(run_xml('text', ResolvedPropertiesCacheTest.emphasis + run_formats), paragraph_properties)
+        ))
+
+    def __get_run(self, document):
+        return document.get_inner_element(0).get_inner_element(1).get_inner_element(0)
+
+    def test_run(self):
+        document = self.__create_document()
+        run = self.__get_run(document)
+        document.translate('html')
+        self.assertFalse(run.is_bold())
+        self.assertIsNone(run.get_effective_format().bold)
+
+        run.set_as_bold()
+        run.set_color_value('FF0000')
+        self.assertTrue(run.is_bold())
+        self.assertEqual('FF0000', run.get_effective_format().color)
+        self.assertEqual(self.__create_document('<w:b/><w:color w:val="FF0000"/>').translate('html'),
+                         document.translate('html'))
+
+    def test_paragraph(self):
+        document = self.__create_document()
+        paragraph = document.get_inner_element(0).get_inner_element(1)
+        document.translate('html')
+        paragraph.set_align_value('center')
+        self.assertEqual('center', paragraph.get_effective_format().align)
+        self.assertEqual(self.__create_document(paragraph_properties='<w:jc w:val="center"/>').translate('html'),
+                         document.translate('html'))
+
+    def test_style(self):
+        document = self.__create_document()
+        run = self.__get_run(document)
+        document.translate('html')
+        self.assertTrue(run.is_italic())
+
+        document.get_style('Emphasis').set_as_italic(False)
+        self.assertFalse(run.is_italic())
+        self.assertFalse(run.get_effective_format().italic)
+        self.assertNotEqual(self.__create_document().translate('html'), document.translate('html'))
+
+    def test_base_style(self):
+        document = self.__create_document()
+        heading = document.get_inner_element(0).get_inner_element(0)
+        document.translate('html')
+        self.assertEqual('both', heading.get_align())
+
+        # Heading is based on Normal
+        document.get_style('Normal').set_align_value('center')
+        self.assertEqual('center', heading.get_align())
+        self.assertEqual('center', heading.get_effective_format().align)
+
+    def test_set_style(self):
+        document = self.__create_document()
+        run = self.__get_run(document)
+        paragraph = document.get_inner_element(0).get_inner_element(1)
+        document.translate('html')
+        self.assertFalse(run.is_bold())
+
+        paragraph.set_style('Heading')
+        self.assertTrue(run.is_bold())
+        self.assertEqual(self.__create_document(paragraph_properties=self.heading).translate('html'),
+                         document.translate('html'))
+
+
+if __name__ == '__main__':
+    unittest.main()
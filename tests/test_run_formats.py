@@ -0,0 +1,55 @@
+import unittest
+
+from docx_microreader.models import Document, Run
+
+from documents import create_docx, pack_docx, paragraph_xml, run_xml
+
+
+class RunFormatsTest(unittest.TestCase):
+    """
+    effective formats of runs are interned in document: runs with equal formats share one format and its id
+    """
+    def __get_runs(self, document) -> list:
+        runs = []
+        elements = list(document.iterate_by_inner_elements())
+        while elements:
+            element = elements.pop()
+            if isinstance(element, Run):
+                runs.append(element)
+            elements.extend(element.iterate_by_inner_elements())
+        return runs
+
+    def test_equal_formats_are_shared(self):
+        document = Document(create_docx(0))
+        runs = self.__get_runs(document)
+        formats = {}
+        for run in runs:
+            run_format = run.get_effective_format()
+            format_id = run.get_format_id()
+            self.assertIs(run_format, formats.setdefault(format_id, run_format))
+            self.assertIs(run_format, document.get_run_format(format_id))
+        self.assertEqual(len(set(formats.values())), len(formats))
+        self.assertEqual(len(formats), document.count_run_formats())
+        self.assertLess(document.count_run_formats(), len(runs))
+
+    def test_changed_run(self):
+        document = Document(pack_docx(paragraph_xml(run_xml('plain') + run_xml('bold', '<w:b/>') + run_xml('text'))))
+        plain_run, bold_run, run = self.__get_runs(document)[::-1]
+        self.assertIs(plain_run.get_effective_format(), run.get_effective_format())
+        self.assertNotEqual(bold_run.get_format_id(), run.get_format_id())
+
+        run.set_as_bold()
+        self.assertEqual(bold_run.get_format_id(), run.get_format_id())
+        self.assertIs(bold_run.get_effective_format(), run.get_effective_format())
+        self.assertEqual(Document(pack_docx(paragraph_xml(
+            run_xml('plain') + run_xml('bold', '<w:b/>') + run_xml('text', '<w:b/>')
+        ))).translate('html'), document.translate('html'))
+
+    def test_run_out_of_document(self):
+        run = Run.create()
+        self.assertIsNone(run.get_format_id())
+        self.assertIsNotNone(run.get_effective_format())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from docx_microreader.constants import property_enums as pr_const
+from docx_microreader.models import Document
+
+from documents import pack_docx, table_xml
+
+
+class TableAreasTest(unittest.TestCase):
+    """
+    table areas of cells (first row, banding, etc.) are computed for whole table and cached, so changes of table look
+    and of rows must invalidate them
+    """
+    @staticmethod
+    def __create_document(rows_count: int, is_last_row_style_used: bool = False, is_first_row_style_used: bool = True):
+        xml = table_xml(0, rows_count)
+        if is_last_row_style_used:
+            xml = xml.replace('<w:tblLook ', '<w:tblLook w:lastRow="1" ')
+        if not is_first_row_style_used:
+            xml = xml.replace('w:firstRow="1"', 'w:firstRow="0"')
+        return Document(pack_docx(xml))
+
+    def __assert_table_areas_are_actual(self, table):
+        for row in table.iterate_by_inner_elements():
+            for cell in row.iterate_by_inner_elements():
+                self.assertEqual(cell._define_table_areas(), table._get_table_areas_of_cell(cell))
+
+    def test_table_look(self):
+        document = self.__create_document(6)
+        table = document.get_inner_element(0).get_inner_element(0)
+        top_left_cell = table.get_inner_element(0).get_inner_element(0)
+        document.translate('html')
+        self.assertIn(pr_const.TableArea.FIRST_ROW, table._get_table_areas_of_cell(top_left_cell))
+
+        table.set_as_use_style_of_first_row(False)
+        self.assertNotIn(pr_const.TableArea.FIRST_ROW, table._get_table_areas_of_cell(top_left_cell))
+        self.__assert_table_areas_are_actual(table)
+        self.assertEqual(self.__create_document(6, is_first_row_style_used=False).translate('html'),
+                         document.translate('html'))
+
+    def test_rows(self):
+        document = self.__create_document(6, is_last_row_style_used=True)
+        table = document.get_inner_element(0).get_inner_element(0)
+        document.translate('html')
+        self.__assert_table_areas_are_actual(table)
+
+        table.pop_inner_element()
+        last_cell = table.get_inner_element(-1).get_inner_element(0)
+        self.assertIn(pr_const.TableArea.LAST_ROW, table._get_table_areas_of_cell(last_cell))
+        self.__assert_table_areas_are_actual(table)
+        self.assertEqual(self.__create_document(5, is_last_row_style_used=True).translate('html'),
+                         document.translate('html'))
+
+        table.append_inner_element(table.pop_inner_element(0))
+        self.__assert_table_areas_are_actual(table)
+
+
+if __name__ == '__main__':
+    unittest.main()